@@ -24,7 +24,7 @@ CREATE TABLE api_clients (
   updated_at TIMESTAMPTZ DEFAULT NOW()
 );
 
-CREATE INDEX idx_api_clients_active ON api_clients(is_active);
+CREATE INDEX idx_api_clients_active ON api_clients(client_id) WHERE is_active = true;
 CREATE INDEX idx_api_clients_api_key ON api_clients(api_key);
 
 COMMENT ON TABLE api_clients IS 'API clients registered to use the LLM service';
@@ -180,7 +180,10 @@ CREATE TABLE llm_generation_log (
 SELECT create_hypertable('llm_generation_log', 'created_at');
 
 -- Indexes for fast queries
-CREATE INDEX idx_log_client_time ON llm_generation_log (client_id, created_at DESC);
+-- Covering: per-client usage breakdowns (GROUP BY provider/endpoint over a
+-- time window) are answered from the index without visiting the heap
+CREATE INDEX idx_log_client_time ON llm_generation_log (client_id, created_at DESC)
+  INCLUDE (provider, endpoint, total_tokens, total_cost_usd, generation_time_ms, success);
 CREATE INDEX idx_log_provider_time ON llm_generation_log (provider, created_at DESC);
 CREATE INDEX idx_log_endpoint_time ON llm_generation_log (endpoint, created_at DESC);
 CREATE INDEX idx_log_success ON llm_generation_log (success, created_at DESC);
@@ -218,6 +221,10 @@ SELECT add_continuous_aggregate_policy('llm_hourly_costs',
   end_offset => INTERVAL '1 hour',
   schedule_interval => INTERVAL '1 hour');
 
+-- Real-time aggregation: reads merge not-yet-materialized recent rows from
+-- llm_generation_log, so the dashboard totals read from this view stay current
+ALTER MATERIALIZED VIEW llm_hourly_costs SET (timescaledb.materialized_only = false);
+
 -- ============================================================================
 -- CONTINUOUS AGGREGATION: llm_daily_costs
 -- Daily cost aggregation for billing reports
@@ -241,11 +248,15 @@ GROUP BY day, client_id, provider, endpoint;
 
 -- Note: Cannot add COMMENT to TimescaleDB continuous aggregates
 
--- Add refresh policy (refresh once per day)
+-- Add refresh policy (refresh hourly; admin billing reports read this view)
 SELECT add_continuous_aggregate_policy('llm_daily_costs',
   start_offset => INTERVAL '3 days',
-  end_offset => INTERVAL '1 day',
-  schedule_interval => INTERVAL '1 day');
+  end_offset => INTERVAL '1 hour',
+  schedule_interval => INTERVAL '1 hour');
+
+-- Real-time aggregation: today's not-yet-materialized rows are merged in from
+-- llm_generation_log, so billing reports include the current day
+ALTER MATERIALIZED VIEW llm_daily_costs SET (timescaledb.materialized_only = false);
 
 -- ============================================================================
 -- CONTINUOUS AGGREGATION: llm_monthly_billing
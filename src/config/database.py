@@ -4,11 +4,13 @@ Handles SQLAlchemy engine, sessions, and connection pooling
 """
 
 from sqlalchemy import create_engine, text, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 from contextlib import contextmanager
-from typing import Generator
+from typing import AsyncGenerator, Generator
 import logging
 
 from src.config.settings import settings
@@ -30,6 +32,17 @@ engine = create_engine(
     echo=settings.DB_ECHO,  # Log SQL queries if enabled
 )
 
+# Async engine (asyncpg) for async route handlers, so queries don't block the
+# event loop; same database and pool settings as the sync engine
+async_engine = create_async_engine(
+    make_url(settings.DATABASE_URL).set(drivername="postgresql+asyncpg"),
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_pre_ping=True,
+    echo=settings.DB_ECHO,
+)
+
 # ============================================================================
 # Session Factory
 # ============================================================================
@@ -40,6 +53,12 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False  # Attributes stay readable after commit without a lazy reload
+)
+
 # ============================================================================
 # Declarative Base
 # ============================================================================
@@ -72,6 +91,7 @@ def receive_checkout(dbapi_conn, connection_record, connection_proxy):
 # ============================================================================
 
 @event.listens_for(engine, "before_cursor_execute")
+@event.listens_for(async_engine.sync_engine, "before_cursor_execute")
 def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
     """Record query start time for slow query detection"""
     import time
@@ -79,6 +99,7 @@ def before_cursor_execute(conn, cursor, statement, parameters, context, executem
 
 
 @event.listens_for(engine, "after_cursor_execute")
+@event.listens_for(async_engine.sync_engine, "after_cursor_execute")
 def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
     """Log slow queries (>2 seconds)"""
     import time
@@ -119,6 +140,25 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency for async database sessions (asyncpg)
+    Automatically handles session lifecycle and rollback on errors
+
+    Usage:
+        @app.get("/endpoint")
+        async def endpoint(db: AsyncSession = Depends(get_async_db)):
+            result = await db.execute(select(...))
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error(f"Database session error: {str(e)}")
+            await db.rollback()
+            raise
+
+
 @contextmanager
 def get_db_context():
     """
@@ -205,6 +245,7 @@ async def close_database():
     """
     try:
         engine.dispose()
+        await async_engine.dispose()
         logger.info("Database connections closed")
     except Exception as e:
         logger.error(f"Error closing database connections: {str(e)}")
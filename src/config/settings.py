@@ -18,6 +18,7 @@ class Settings(BaseSettings):
     SERVICE_NAME: str = "llm_hub"
     SERVICE_VERSION: str = "1.0.0"
     LOG_LEVEL: str = "info"
+    PUBLIC_WEBHOOK_BASE_URL: Optional[str] = None  # Externally reachable base URL for provider completion callbacks
 
     # =========================================================================
     # Database Configuration (TimescaleDB)
@@ -35,6 +36,15 @@ class Settings(BaseSettings):
     REDIS_DB: int = 0
     REDIS_CACHE_TTL: int = 3600  # 1 hour default cache TTL
 
+    # =========================================================================
+    # Provider Response Cache
+    # =========================================================================
+    LLM_CACHE_BACKEND: str = "memory"  # "memory" (per-process LRU) or "redis"
+    LLM_CACHE_MAX_ENTRIES: int = 1024  # In-memory backend capacity
+    EMBED_CACHE_ENABLED: bool = True  # Cache embeddings per text (and rerank results)
+    EMBED_CACHE_TTL: int = 86400  # Embeddings are deterministic, so keep them a day
+    EMBED_CACHE_MAX_ENTRIES: int = 50000  # In-memory embedding cache capacity (separate from LLM_CACHE_MAX_ENTRIES)
+
     # =========================================================================
     # LLM Provider API Keys
     # =========================================================================
@@ -64,6 +74,15 @@ class Settings(BaseSettings):
     MAX_RETRIES: int = 3
     RETRY_DELAY: float = 1.0  # seconds
 
+    # Per-provider request limits (requests per minute: None = unlimited)
+    COHERE_MAX_CONCURRENCY: int = 48
+    COHERE_REQUESTS_PER_MINUTE: Optional[float] = None
+    DEEPGRAM_MAX_CONCURRENCY: int = 50
+    DEEPGRAM_REQUESTS_PER_MINUTE: Optional[float] = None
+    PERSPECTIVE_REQUESTS_PER_MINUTE: Optional[float] = 60  # Free tier quota is 1 QPS
+    VOYAGE_MAX_CONCURRENCY: int = 32
+    VOYAGE_REQUESTS_PER_MINUTE: Optional[float] = None
+
     # =========================================================================
     # MinIO Configuration (for image storage)
     # =========================================================================
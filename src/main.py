@@ -5,7 +5,7 @@ Application-agnostic LLM service with billing tracking
 
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
@@ -16,6 +16,7 @@ from pathlib import Path
 from src.config.settings import settings
 from src.config.database import init_database, close_database
 from src.utils.logger import logger
+from src.providers import ProviderRegistry
 from src.routers import health
 
 # Import v1 routers
@@ -48,6 +49,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("👋 Shutting down service")
+    await ProviderRegistry.close_all()
     await close_database()
     logger.info("✅ Shutdown complete")
 
@@ -63,6 +65,7 @@ app = FastAPI(
     docs_url=settings.DOCS_URL,
     redoc_url=settings.REDOC_URL,
     openapi_url=settings.OPENAPI_URL,
+    default_response_class=ORJSONResponse,  # Serialize responses with orjson (C) instead of stdlib json
     lifespan=lifespan
 )
 
@@ -76,6 +79,7 @@ app.add_middleware(
     allow_credentials=settings.CORS_ALLOW_CREDENTIALS,
     allow_methods=settings.CORS_ALLOW_METHODS,
     allow_headers=settings.CORS_ALLOW_HEADERS,
+    expose_headers=["X-Next-Cursor"],  # Keyset paging cursor for GET /admin/clients
 )
 
 # ============================================================================
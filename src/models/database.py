@@ -3,7 +3,7 @@ SQLAlchemy ORM Models for LLM Microservice
 Maps to TimescaleDB schema tables
 """
 
-from sqlalchemy import Column, String, Integer, Boolean, Text, DECIMAL, ForeignKey, Index
+from sqlalchemy import Column, String, Integer, Boolean, Text, DECIMAL, ForeignKey, Index, table, column
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy import TIMESTAMP
 from sqlalchemy.orm import relationship
@@ -217,7 +217,10 @@ class LLMGenerationLog(Base):
 
     # Indexes (defined in schema, but listed here for reference)
     __table_args__ = (
-        Index('idx_log_client_time', client_id, created_at.desc()),
+        Index(
+            'idx_log_client_time', client_id, created_at.desc(),
+            postgresql_include=['provider', 'endpoint', 'total_tokens', 'total_cost_usd', 'generation_time_ms', 'success']
+        ),
         Index('idx_log_provider_time', provider, created_at.desc()),
         Index('idx_log_endpoint_time', endpoint, created_at.desc()),
         Index('idx_log_success', success, created_at.desc()),
@@ -235,3 +238,21 @@ class LLMGenerationLog(Base):
     def total_cost_usd(self) -> float:
         """Calculate total cost (generated column in DB, computed here for ORM)"""
         return float((self.input_cost_usd or 0) + (self.output_cost_usd or 0))
+
+
+# ============================================================================
+# llm_daily_costs (TimescaleDB Continuous Aggregate)
+# ============================================================================
+
+# Daily rollup of llm_generation_log per client/provider/endpoint, maintained by
+# TimescaleDB (database/init.sql). Read-only and not part of Base.metadata.
+llm_daily_costs = table(
+    "llm_daily_costs",
+    column("day", TIMESTAMP(timezone=True)),
+    column("client_id", UUID(as_uuid=True)),
+    column("provider", String),
+    column("endpoint", String),
+    column("call_count", Integer),
+    column("total_tokens", Integer),
+    column("total_cost", DECIMAL),
+)
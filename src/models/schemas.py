@@ -3,7 +3,7 @@ Pydantic Models for Request/Response Validation
 Used by FastAPI for automatic validation and documentation
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, HttpUrl, validator
 from typing import Optional, List, Dict, Any, Union
 from datetime import datetime
 from uuid import UUID
@@ -718,6 +718,19 @@ class V2AudioTranscribeRequest(V2BaseRequest):
     search: Optional[List[str]] = Field(None, description="Terms to search for in transcript (Deepgram)")
     replace: Optional[Dict[str, str]] = Field(None, description="Find and replace terms (Deepgram)")
     multichannel: Optional[bool] = Field(False, description="Multi-channel audio processing (Deepgram)")
+    include_words: Optional[bool] = Field(True, description="Include per-word timestamps for the first 100 words (Deepgram)")
+
+    # Asynchronous delivery
+    webhook_url: Optional[HttpUrl] = Field(
+        None,
+        description="Return immediately and POST the transcript to this https URL when it is ready (AssemblyAI)"
+    )
+
+    @validator('webhook_url')
+    def validate_webhook_url(cls, v):
+        if v is not None and v.scheme != "https":
+            raise ValueError("webhook_url must use https")
+        return v
 
     class Config:
         json_schema_extra = {
@@ -737,8 +750,15 @@ class V2AudioTranscribeRequest(V2BaseRequest):
         }
 
 
+class V2AudioTranscribeWebhook(BaseModel):
+    """Transcript completion callback sent by AssemblyAI"""
+    transcript_id: str = Field(..., description="AssemblyAI transcript ID")
+    status: str = Field(..., description="Final transcript status: 'completed' or 'error'")
+
+
 class V2AudioTranscribeResponse(V2BaseResponse):
     """Response for audio transcription with audio intelligence"""
+    log_id: Optional[UUID] = Field(None, description="Billing log ID (None while a webhook-mode transcript is queued)")
     text: str = Field(..., description="Full transcript text")
     audio_duration: float = Field(..., description="Audio duration in seconds")
     confidence: Optional[float] = Field(None, description="Overall transcription confidence (0-1)")
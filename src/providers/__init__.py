@@ -65,6 +65,18 @@ class ProviderRegistry:
         """List all registered provider classes"""
         return list(cls._providers.keys())
 
+    @classmethod
+    async def close_all(cls):
+        """Release shared SDK clients held by provider classes"""
+        for provider_name, provider_class in cls._providers.items():
+            try:
+                await provider_class.close_all()
+            except Exception as e:
+                logger.warning(f"Failed to close {provider_name} clients: {e}")
+
+        from src.providers.http_client import close_shared_async_client
+        await close_shared_async_client()
+
 
 # Auto-discover and register all providers
 def _auto_register_providers():
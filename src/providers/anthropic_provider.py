@@ -11,6 +11,15 @@ from src.utils.logger import logger
 class AnthropicProvider(BaseProvider):
     """Claude provider implementation"""
 
+    METADATA = ProviderMetadata(
+        display_name="Anthropic Claude",
+        description="Advanced AI assistant with 200K context window and superior reasoning capabilities",
+        logo_url="https://www.anthropic.com/images/icons/safari-pinned-tab.svg",
+        website_url="https://www.anthropic.com",
+        requires_api_key=True,
+        requires_base_url=False
+    )
+
     @property
     def provider_name(self) -> str:
         return "claude"
@@ -83,14 +92,7 @@ class AnthropicProvider(BaseProvider):
         ]
 
     def get_metadata(self) -> ProviderMetadata:
-        return ProviderMetadata(
-            display_name="Anthropic Claude",
-            description="Advanced AI assistant with 200K context window and superior reasoning capabilities",
-            logo_url="https://www.anthropic.com/images/icons/safari-pinned-tab.svg",
-            website_url="https://www.anthropic.com",
-            requires_api_key=True,
-            requires_base_url=False
-        )
+        return self.METADATA
 
 
 # Auto-register this provider
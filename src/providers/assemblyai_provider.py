@@ -4,10 +4,12 @@ State-of-the-art transcription with speaker diarization, sentiment, and more
 """
 
 from typing import Dict, Any, List, Optional
-import time
-import assemblyai as aai
+import asyncio
+import itertools
+import secrets
 
 from src.providers.base import BaseProvider, LLMResponse, ProviderConfig, ProviderMetadata
+from src.providers.cache import LLMCache, jobs_backend
 from src.utils.logger import logger
 
 
@@ -34,6 +36,17 @@ class AssemblyAIProvider(BaseProvider):
     - transcribe: Convert audio to text with intelligence features
     """
 
+    METADATA = ProviderMetadata(
+        display_name="AssemblyAI",
+        description="State-of-the-art speech-to-text with Universal-2 model. "
+                    "Includes speaker diarization, sentiment analysis, entity detection, "
+                    "summarization, and content moderation.",
+        logo_url="https://www.assemblyai.com/favicon.ico",
+        website_url="https://www.assemblyai.com",
+        requires_api_key=True,
+        requires_base_url=False
+    )
+
     # Model tiers
     MODELS = [
         "best",  # Universal-2 - most accurate ($0.37/hour)
@@ -51,6 +64,24 @@ class AssemblyAIProvider(BaseProvider):
         "content_safety_labels": 0.15,
     }
 
+    # Webhook-mode transcripts not called back within this window are forgotten
+    WEBHOOK_PENDING_TTL = 24 * 3600  # seconds
+
+    def __init__(self, config: ProviderConfig):
+        super().__init__(config)
+        # Webhook-mode transcripts awaiting AssemblyAI's completion callback,
+        # keyed by transcript_id. Kept out of the evicting response cache so
+        # a queued transcript can't be pushed out before it is billed.
+        self._pending_webhooks = LLMCache(
+            namespace="assemblyai_webhooks",
+            backend=jobs_backend(),
+            default_ttl=self.WEBHOOK_PENDING_TTL
+        )
+        # assemblyai SDK module, imported on first use
+        self._aai = None
+        # Guards lazy client init (aai.settings.api_key is global SDK state)
+        self._client_lock = asyncio.Lock()
+
     @property
     def provider_name(self) -> str:
         return "assemblyai"
@@ -65,33 +96,28 @@ class AssemblyAIProvider(BaseProvider):
 
     def get_metadata(self) -> ProviderMetadata:
         """Provider information for UI display"""
-        return ProviderMetadata(
-            display_name="AssemblyAI",
-            description="State-of-the-art speech-to-text with Universal-2 model. "
-                        "Includes speaker diarization, sentiment analysis, entity detection, "
-                        "summarization, and content moderation.",
-            logo_url="https://www.assemblyai.com/favicon.ico",
-            website_url="https://www.assemblyai.com",
-            requires_api_key=True,
-            requires_base_url=False
-        )
+        return self.METADATA
 
-    def _get_client(self):
+    async def _get_client(self):
         """Lazy-load AssemblyAI client"""
-        if self._client is None:
-            try:
-                # Set API key globally for AssemblyAI SDK
-                aai.settings.api_key = self.config.api_key
-                self._client = aai.Transcriber()
-                logger.info(f"Initialized AssemblyAI client")
-            except ImportError:
-                raise ImportError(
-                    "assemblyai package not installed. "
-                    "Install with: pip install assemblyai"
-                )
-            except Exception as e:
-                logger.error(f"Failed to initialize AssemblyAI client: {str(e)}")
-                raise
+        async with self._client_lock:
+            if self._client is None:
+                try:
+                    import assemblyai as aai
+
+                    # Set API key globally for AssemblyAI SDK
+                    aai.settings.api_key = self.config.api_key
+                    self._aai = aai
+                    self._client = aai.Transcriber()
+                    logger.info(f"Initialized AssemblyAI client")
+                except ImportError:
+                    raise ImportError(
+                        "assemblyai package not installed. "
+                        "Install with: pip install assemblyai"
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to initialize AssemblyAI client: {str(e)}")
+                    raise
 
         return self._client
 
@@ -144,6 +170,9 @@ class AssemblyAIProvider(BaseProvider):
         redact_pii: bool = False,
         word_boost: Optional[List[str]] = None,
         boost_param: str = "default",
+        webhook_url: Optional[str] = None,
+        webhook_auth_header_name: Optional[str] = None,
+        webhook_context: Optional[Dict[str, Any]] = None,
         **kwargs
     ) -> LLMResponse:
         """
@@ -166,6 +195,12 @@ class AssemblyAIProvider(BaseProvider):
             redact_pii: Redact personal info
             word_boost: Custom vocabulary list
             boost_param: Boost level ("low", "default", "high")
+            webhook_url: Our callback URL. If set, submit without waiting and
+                let AssemblyAI call it on completion (returns immediately with
+                the transcript_id and status "queued")
+            webhook_auth_header_name: Header carrying the per-transcript
+                secret AssemblyAI sends with the callback
+            webhook_context: Caller data handed back by claim_webhook()
 
         Returns:
             LLMResponse with transcript and audio intelligence results
@@ -179,8 +214,21 @@ class AssemblyAIProvider(BaseProvider):
                 f"Supported: {', '.join(self.MODELS)}"
             )
 
+        # Feature flags used for logging and response metadata
+        feature_flags = {
+            "speaker_labels": speaker_labels,
+            "sentiment_analysis": sentiment_analysis,
+            "entity_detection": entity_detection,
+            "auto_chapters": auto_chapters,
+            "summarization": summarization,
+            "iab_categories": iab_categories,
+            "content_safety": content_safety,
+        }
+        features_enabled = self._list_enabled_features(feature_flags)
+
         try:
-            client = self._get_client()
+            client = await self._get_client()
+            aai = self._aai
 
             # Build transcription config
             config = aai.TranscriptionConfig(
@@ -223,186 +271,296 @@ class AssemblyAIProvider(BaseProvider):
 
             logger.info(
                 f"Starting AssemblyAI transcription: model={model}, "
-                f"url={audio_url[:50]}..., features={self._list_enabled_features(**locals())}"
+                f"url={audio_url[:50]}..., features={features_enabled}"
             )
 
+            if webhook_url:
+                return await self._submit_with_webhook(
+                    client=client,
+                    audio_url=audio_url,
+                    config=config,
+                    model=model,
+                    feature_flags=feature_flags,
+                    features_enabled=features_enabled,
+                    webhook_url=webhook_url,
+                    webhook_auth_header_name=webhook_auth_header_name,
+                    webhook_context=webhook_context
+                )
+
             # Submit transcription (synchronous - SDK handles polling)
             transcript = client.transcribe(audio_url, config=config)
 
-            # Check for errors
-            if transcript.status == aai.TranscriptStatus.error:
-                raise Exception(f"Transcription failed: {transcript.error}")
+            return self._build_transcript_response(transcript, model, feature_flags, features_enabled)
 
-            # Extract audio duration (in seconds)
-            audio_duration = transcript.audio_duration if hasattr(transcript, 'audio_duration') else 0
-
-            # Calculate cost
-            cost_usd = self._calculate_transcription_cost(
-                model=model,
-                audio_duration_seconds=audio_duration,
-                speaker_labels=speaker_labels,
-                sentiment_analysis=sentiment_analysis,
-                entity_detection=entity_detection,
-                auto_chapters=auto_chapters,
-                summarization=summarization,
-                iab_categories=iab_categories,
-                content_safety=content_safety
-            )
+        except Exception as e:
+            logger.error(f"AssemblyAI transcription failed: {str(e)}", model=model)
+            raise Exception(f"AssemblyAI transcription failed: {str(e)}")
 
-            # Build response content
-            response_content = {
-                "text": transcript.text,
-                "audio_duration": audio_duration,
-                "confidence": transcript.confidence if hasattr(transcript, 'confidence') else None,
-                "language_code": transcript.language_code if hasattr(transcript, 'language_code') else None,
-            }
+    def _build_transcript_response(
+        self,
+        transcript,
+        model: str,
+        feature_flags: Dict[str, bool],
+        features_enabled: List[str]
+    ) -> LLMResponse:
+        """Turn a finished AssemblyAI transcript into a billed LLMResponse"""
+        speaker_labels = feature_flags["speaker_labels"]
+        sentiment_analysis = feature_flags["sentiment_analysis"]
+        entity_detection = feature_flags["entity_detection"]
+        auto_chapters = feature_flags["auto_chapters"]
+        summarization = feature_flags["summarization"]
+        iab_categories = feature_flags["iab_categories"]
+        content_safety = feature_flags["content_safety"]
+
+        # Check for errors
+        if transcript.status == self._aai.TranscriptStatus.error:
+            raise Exception(f"Transcription failed: {transcript.error}")
+
+        # Extract audio duration (in seconds)
+        audio_duration = transcript.audio_duration if hasattr(transcript, 'audio_duration') else 0
+
+        # Calculate cost
+        cost_usd = self._calculate_transcription_cost(
+            model=model,
+            audio_duration_seconds=audio_duration,
+            speaker_labels=speaker_labels,
+            sentiment_analysis=sentiment_analysis,
+            entity_detection=entity_detection,
+            auto_chapters=auto_chapters,
+            summarization=summarization,
+            iab_categories=iab_categories,
+            content_safety=content_safety
+        )
 
-            # Add optional features
-            if speaker_labels and hasattr(transcript, 'utterances') and transcript.utterances:
-                response_content["utterances"] = [
-                    {
-                        "speaker": utt.speaker,
-                        "text": utt.text,
-                        "start": utt.start,
-                        "end": utt.end,
-                        "confidence": utt.confidence
-                    }
-                    for utt in transcript.utterances
-                ]
+        # Build response content
+        response_content = {
+            "text": transcript.text,
+            "audio_duration": audio_duration,
+            "confidence": transcript.confidence if hasattr(transcript, 'confidence') else None,
+            "language_code": transcript.language_code if hasattr(transcript, 'language_code') else None,
+        }
 
-            if auto_chapters and hasattr(transcript, 'chapters') and transcript.chapters:
-                response_content["chapters"] = [
-                    {
-                        "headline": ch.headline,
-                        "summary": ch.summary,
-                        "gist": ch.gist,
-                        "start": ch.start,
-                        "end": ch.end
-                    }
-                    for ch in transcript.chapters
-                ]
+        # Add optional features
+        if speaker_labels and hasattr(transcript, 'utterances') and transcript.utterances:
+            response_content["utterances"] = [
+                {
+                    "speaker": utt.speaker,
+                    "text": utt.text,
+                    "start": utt.start,
+                    "end": utt.end,
+                    "confidence": utt.confidence
+                }
+                for utt in transcript.utterances
+            ]
+
+        if auto_chapters and hasattr(transcript, 'chapters') and transcript.chapters:
+            response_content["chapters"] = [
+                {
+                    "headline": ch.headline,
+                    "summary": ch.summary,
+                    "gist": ch.gist,
+                    "start": ch.start,
+                    "end": ch.end
+                }
+                for ch in transcript.chapters
+            ]
+
+        if entity_detection and hasattr(transcript, 'entities') and transcript.entities:
+            response_content["entities"] = [
+                {
+                    "entity_type": ent.entity_type,
+                    "text": ent.text,
+                    "start": ent.start,
+                    "end": ent.end
+                }
+                for ent in transcript.entities
+            ]
+
+        if sentiment_analysis and hasattr(transcript, 'sentiment_analysis_results'):
+            response_content["sentiment_analysis_results"] = [
+                {
+                    "text": sent.text,
+                    "sentiment": sent.sentiment,
+                    "confidence": sent.confidence,
+                    "start": sent.start,
+                    "end": sent.end
+                }
+                for sent in transcript.sentiment_analysis_results
+            ]
 
-            if entity_detection and hasattr(transcript, 'entities') and transcript.entities:
-                response_content["entities"] = [
+        if iab_categories and hasattr(transcript, 'iab_categories_result'):
+            response_content["iab_categories_result"] = {
+                "summary": transcript.iab_categories_result.summary,
+                "results": [
                     {
-                        "entity_type": ent.entity_type,
-                        "text": ent.text,
-                        "start": ent.start,
-                        "end": ent.end
+                        "text": result.text,
+                        "labels": [
+                            {
+                                "label": label.label,
+                                "relevance": label.relevance
+                            }
+                            for label in result.labels
+                        ]
                     }
-                    for ent in transcript.entities
+                    for result in transcript.iab_categories_result.results
                 ]
+            }
 
-            if sentiment_analysis and hasattr(transcript, 'sentiment_analysis_results'):
-                response_content["sentiment_analysis_results"] = [
+        if content_safety and hasattr(transcript, 'content_safety_labels'):
+            response_content["content_safety_labels"] = {
+                "status": transcript.content_safety_labels.status,
+                "results": [
                     {
-                        "text": sent.text,
-                        "sentiment": sent.sentiment,
-                        "confidence": sent.confidence,
-                        "start": sent.start,
-                        "end": sent.end
+                        "text": result.text,
+                        "labels": [
+                            {
+                                "label": label.label,
+                                "confidence": label.confidence,
+                                "severity": label.severity
+                            }
+                            for label in result.labels
+                        ]
                     }
-                    for sent in transcript.sentiment_analysis_results
+                    for result in transcript.content_safety_labels.results
                 ]
+            }
 
-            if iab_categories and hasattr(transcript, 'iab_categories_result'):
-                response_content["iab_categories_result"] = {
-                    "summary": transcript.iab_categories_result.summary,
-                    "results": [
-                        {
-                            "text": result.text,
-                            "labels": [
-                                {
-                                    "label": label.label,
-                                    "relevance": label.relevance
-                                }
-                                for label in result.labels
-                            ]
-                        }
-                        for result in transcript.iab_categories_result.results
-                    ]
+        if summarization and hasattr(transcript, 'summary'):
+            response_content["summary"] = transcript.summary
+
+        # Add words with timestamps if available
+        if hasattr(transcript, 'words') and transcript.words:
+            response_content["words"] = [
+                {
+                    "text": word.text,
+                    "start": word.start,
+                    "end": word.end,
+                    "confidence": word.confidence
                 }
+                # Limit to first 100 words to save space (islice avoids copying the full list)
+                for word in itertools.islice(transcript.words, 100)
+            ]
+
+        # Pseudo-tokens: duration_seconds × 100 (for billing compatibility)
+        pseudo_tokens = int(audio_duration * 100)
+
+        logger.info(
+            "assemblyai_transcribe_success",
+            model=model,
+            duration=audio_duration,
+            confidence=response_content.get("confidence"),
+            cost_usd=cost_usd
+        )
 
-            if content_safety and hasattr(transcript, 'content_safety_labels'):
-                response_content["content_safety_labels"] = {
-                    "status": transcript.content_safety_labels.status,
-                    "results": [
-                        {
-                            "text": result.text,
-                            "labels": [
-                                {
-                                    "label": label.label,
-                                    "confidence": label.confidence,
-                                    "severity": label.severity
-                                }
-                                for label in result.labels
-                            ]
-                        }
-                        for result in transcript.content_safety_labels.results
-                    ]
-                }
+        return LLMResponse(
+            content=response_content,
+            input_tokens=pseudo_tokens,  # Duration-based pseudo-tokens
+            output_tokens=0,  # Transcription doesn't generate tokens
+            cost_usd=cost_usd,
+            provider_metadata={
+                "audio_duration": audio_duration,
+                "language_code": transcript.language_code if hasattr(transcript, 'language_code') else None,
+                "model": model,
+                "features_enabled": features_enabled
+            }
+        )
 
-            if summarization and hasattr(transcript, 'summary'):
-                response_content["summary"] = transcript.summary
+    async def _submit_with_webhook(
+        self,
+        client,
+        audio_url: str,
+        config,
+        model: str,
+        feature_flags: Dict[str, bool],
+        features_enabled: List[str],
+        webhook_url: str,
+        webhook_auth_header_name: Optional[str] = None,
+        webhook_context: Optional[Dict[str, Any]] = None
+    ) -> LLMResponse:
+        """
+        Queue a transcription and return immediately
 
-            # Add words with timestamps if available
-            if hasattr(transcript, 'words') and transcript.words:
-                response_content["words"] = [
-                    {
-                        "text": word.text,
-                        "start": word.start,
-                        "end": word.end,
-                        "confidence": word.confidence
-                    }
-                    for word in transcript.words[:100]  # Limit to first 100 words to save space
-                ]
+        AssemblyAI POSTs {transcript_id, status} to webhook_url once done,
+        with a secret generated for this transcript in the auth header. The
+        callback route claims the transcript with claim_webhook(), then
+        fetches and bills it with fetch_webhook_transcript(); the queued
+        response itself carries zero cost.
+        """
+        secret = secrets.token_urlsafe(32)
+        config.set_webhook(webhook_url, webhook_auth_header_name or "Authorization", secret)
+
+        # The SDK call is blocking; keep it off the event loop
+        transcript = await asyncio.to_thread(client.submit, audio_url, config=config)
+
+        if transcript.status == self._aai.TranscriptStatus.error:
+            raise Exception(f"Transcription failed: {transcript.error}")
+
+        await self._pending_webhooks.set(
+            self._webhook_key(transcript.id, secret),
+            {
+                "secret": secret,
+                "model": model,
+                "feature_flags": feature_flags,
+                "features_enabled": features_enabled,
+                "context": webhook_context or {}
+            }
+        )
 
-            # Pseudo-tokens: duration_seconds × 100 (for billing compatibility)
-            pseudo_tokens = int(audio_duration * 100)
+        logger.info(
+            "assemblyai_transcribe_queued",
+            model=model,
+            transcript_id=transcript.id
+        )
 
-            logger.info(
-                "assemblyai_transcribe_success",
-                model=model,
-                duration=audio_duration,
-                confidence=response_content.get("confidence"),
-                cost_usd=cost_usd
-            )
+        return LLMResponse(
+            content={
+                "transcript_id": transcript.id,
+                "status": "queued"
+            },
+            input_tokens=0,
+            output_tokens=0,
+            cost_usd=0.0,
+            provider_metadata={
+                "transcript_id": transcript.id,
+                "model": model,
+                "features_enabled": features_enabled
+            }
+        )
 
-            return LLMResponse(
-                content=response_content,
-                input_tokens=pseudo_tokens,  # Duration-based pseudo-tokens
-                output_tokens=0,  # Transcription doesn't generate tokens
-                cost_usd=cost_usd,
-                provider_metadata={
-                    "audio_duration": audio_duration,
-                    "language_code": transcript.language_code if hasattr(transcript, 'language_code') else None,
-                    "model": model,
-                    "features_enabled": self._list_enabled_features(**locals())
-                }
-            )
+    async def claim_webhook(self, transcript_id: str, secret: str) -> Optional[Dict[str, Any]]:
+        """
+        Claim a queued transcript from AssemblyAI's webhook callback
 
-        except Exception as e:
-            logger.error(f"AssemblyAI transcription failed: {str(e)}", model=model)
-            raise Exception(f"AssemblyAI transcription failed: {str(e)}")
+        Returns:
+            The pending entry (model, feature flags and the caller's
+            webhook_context), or None if the transcript is unknown, expired or
+            the secret doesn't match. The claim is atomic: of concurrent
+            (retried) callbacks only one gets the entry, so it is billed once.
+        """
+        return await self._pending_webhooks.pop(self._webhook_key(transcript_id, secret))
+
+    async def release_webhook(self, transcript_id: str, pending: Dict[str, Any]) -> None:
+        """Put a claimed transcript back so a retried callback can claim it"""
+        await self._pending_webhooks.set(self._webhook_key(transcript_id, pending["secret"]), pending)
+
+    def _webhook_key(self, transcript_id: str, secret: str) -> str:
+        # The secret is part of the key, so a wrong secret simply misses
+        return self._pending_webhooks.make_key({"transcript_id": transcript_id, "secret": secret})
+
+    async def fetch_webhook_transcript(self, transcript_id: str, pending: Dict[str, Any]) -> LLMResponse:
+        """Fetch a claimed transcript and build its billed response (raises if it failed)"""
+        await self._get_client()
+        transcript = await asyncio.to_thread(self._aai.Transcript.get_by_id, transcript_id)
+        return self._build_transcript_response(
+            transcript,
+            pending["model"],
+            pending["feature_flags"],
+            pending["features_enabled"]
+        )
 
-    def _list_enabled_features(self, **kwargs) -> List[str]:
+    def _list_enabled_features(self, flags: Dict[str, bool]) -> List[str]:
         """List which audio intelligence features are enabled"""
-        features = []
-        if kwargs.get("speaker_labels"):
-            features.append("speaker_labels")
-        if kwargs.get("sentiment_analysis"):
-            features.append("sentiment_analysis")
-        if kwargs.get("entity_detection"):
-            features.append("entity_detection")
-        if kwargs.get("auto_chapters"):
-            features.append("auto_chapters")
-        if kwargs.get("summarization"):
-            features.append("summarization")
-        if kwargs.get("iab_categories"):
-            features.append("iab_categories")
-        if kwargs.get("content_safety"):
-            features.append("content_safety")
-        return features
+        return [name for name, enabled in flags.items() if enabled]
 
     def _calculate_transcription_cost(
         self,
@@ -4,23 +4,64 @@ All LLM providers must implement this protocol
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass, field
+import inspect
+import orjson
 
 
 @dataclass
 class LLMResponse:
-    """Standardized response from any provider"""
-    content: str
+    """
+    Standardized response from any provider
+
+    content is plain text for chat/completion providers, a structured
+    dict for providers that return rich results (e.g. transcription) and
+    raw bytes for audio synthesis.
+
+    billable_units/unit_type carry usage for providers that bill in units
+    other than tokens (e.g. characters for text-to-speech).
+    """
+    content: Union[str, bytes, Dict[str, Any]]
     input_tokens: int
     output_tokens: int
     cost_usd: float
     provider_metadata: Optional[Dict[str, Any]] = field(default_factory=dict)
+    billable_units: int = 0
+    unit_type: str = "tokens"
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the whole response with orjson (for API/websocket layers and caches)
 
-@dataclass
+        Not memoized: responses are still adjusted after creation (cost
+        zeroed for cache hits, metadata tagged), so every call reflects the
+        current fields.
+
+        Raises:
+            TypeError: If content is raw bytes (not JSON-serializable;
+                base64-encode audio before serializing)
+        """
+        if isinstance(self.content, (bytes, bytearray)):
+            raise TypeError("LLMResponse with raw bytes content can't be serialized to JSON")
+
+        return orjson.dumps(
+            {
+                "content": self.content,
+                "input_tokens": self.input_tokens,
+                "output_tokens": self.output_tokens,
+                "cost_usd": self.cost_usd,
+                "provider_metadata": self.provider_metadata,
+                "billable_units": self.billable_units,
+                "unit_type": self.unit_type,
+            },
+            option=orjson.OPT_SERIALIZE_NUMPY
+        )
+
+
+@dataclass(frozen=True)
 class ProviderMetadata:
-    """Provider display metadata for UI"""
+    """Provider display metadata for UI (immutable, safe to share at class level)"""
     display_name: str
     description: str
     logo_url: Optional[str] = None
@@ -38,6 +79,18 @@ class ProviderConfig:
     default_model: Optional[str] = None
     timeout: int = 60
     pricing: Optional[Dict[str, Dict[str, float]]] = field(default_factory=dict)
+    max_concurrency: Optional[int] = None  # Max in-flight API calls (None = unlimited)
+    requests_per_minute: Optional[float] = None  # Token-bucket pacing (None = unlimited)
+
+
+async def close_client(client: Any) -> None:
+    """Close an SDK client if it exposes close()/aclose() (sync or async)"""
+    close = getattr(client, "aclose", None) or getattr(client, "close", None)
+    if close is None:
+        return
+    result = close()
+    if inspect.isawaitable(result):
+        await result
 
 
 class BaseProvider(ABC):
@@ -53,6 +106,10 @@ class BaseProvider(ABC):
     def __init__(self, config: ProviderConfig):
         self.config = config
         self._client = None
+        # model -> (input, output) USD per 1K tokens, resolved once per model
+        self._model_prices: Dict[str, Tuple[float, float]] = {}
+        # (pricing dict it was built from, [(lowercased key, price data)])
+        self._lowered_pricing: Optional[Tuple[Any, List[Tuple[str, Dict[str, Any]]]]] = None
 
     @property
     @abstractmethod
@@ -88,8 +145,8 @@ class BaseProvider(ABC):
         pass
 
     @abstractmethod
-    def get_models(self) -> List[str]:
-        """Return list of supported model identifiers"""
+    def get_models(self) -> Sequence[str]:
+        """Return supported model identifiers"""
         pass
 
     @abstractmethod
@@ -97,6 +154,11 @@ class BaseProvider(ABC):
         """Return provider metadata for UI display"""
         pass
 
+    @classmethod
+    async def close_all(cls) -> None:
+        """Release SDK clients shared at class level (called on shutdown)"""
+        pass
+
     def calculate_cost(
         self,
         model: str,
@@ -108,18 +170,36 @@ class BaseProvider(ABC):
 
         Pricing loaded from config, so adding new models doesn't require code changes
         """
-        if not self.config.pricing or model not in self.config.pricing:
+        input_price, output_price = self._get_model_prices(model)
+        return round((input_tokens / 1000) * input_price + (output_tokens / 1000) * output_price, 6)
+
+    def _get_model_prices(self, model: str) -> Tuple[float, float]:
+        """Resolve (input, output) per-1K-token prices for a model, memoized per instance"""
+        prices = self._model_prices.get(model)
+        if prices is not None:
+            return prices
+
+        pricing = self.config.pricing or {}
+        costs = pricing.get(model)
+        if costs is None:
             # Fallback: find closest match by model name substring
-            for model_pattern, costs in (self.config.pricing or {}).items():
-                if model_pattern.lower() in model.lower():
-                    input_cost = (input_tokens / 1000) * costs.get("input", 0.01)
-                    output_cost = (output_tokens / 1000) * costs.get("output", 0.03)
-                    return round(input_cost + output_cost, 6)
-
-            # Final fallback
-            return round((input_tokens / 1000) * 0.01 + (output_tokens / 1000) * 0.03, 6)
-
-        costs = self.config.pricing[model]
-        input_cost = (input_tokens / 1000) * costs["input"]
-        output_cost = (output_tokens / 1000) * costs["output"]
-        return round(input_cost + output_cost, 6)
+            model_lower = model.lower()
+            costs = next(
+                (c for pattern, c in self.get_lowered_pricing() if pattern in model_lower),
+                {}
+            )
+
+        # Final fallback
+        prices = (costs.get("input", 0.01), costs.get("output", 0.03))
+        self._model_prices[model] = prices
+        return prices
+
+    def get_lowered_pricing(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Pricing entries as (lowercased key, price data) for pattern matching
+        Cached until config.pricing is replaced
+        """
+        pricing = self.config.pricing
+        if self._lowered_pricing is None or self._lowered_pricing[0] is not pricing:
+            self._lowered_pricing = (pricing, [(key.lower(), data) for key, data in (pricing or {}).items()])
+        return self._lowered_pricing[1]
@@ -4,7 +4,7 @@ All embeddings providers must implement this protocol
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 from dataclasses import dataclass, field
 
 
@@ -80,8 +80,8 @@ class BaseEmbeddingsProvider(ABC):
         pass
 
     @abstractmethod
-    def get_models(self) -> List[str]:
-        """Return list of supported embedding model identifiers"""
+    def get_models(self) -> Sequence[str]:
+        """Return supported embedding model identifiers"""
         pass
 
     def calculate_cost(
@@ -0,0 +1,288 @@
+"""
+Provider Response Cache
+Deterministic response caching (in-memory LRU or Redis) and in-flight request
+coalescing for provider calls
+"""
+
+from typing import Dict, Any, Optional, Protocol, Callable, Awaitable, TypeVar
+from collections import OrderedDict
+import asyncio
+import hashlib
+import time
+import orjson
+
+from src.config.settings import settings
+from src.providers.base import LLMResponse
+from src.utils.logger import logger
+
+
+class CacheBackend(Protocol):
+    """Byte-oriented key/value store used by LLMCache"""
+
+    async def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        ...
+
+    async def delete(self, key: str) -> None:
+        ...
+
+    async def pop(self, key: str) -> Optional[bytes]:
+        """Atomically remove and return a value"""
+        ...
+
+
+class InMemoryCacheBackend:
+    """
+    Process-local LRU cache with per-entry expiry
+
+    With max_entries=None nothing is ever evicted for space; expired entries
+    are swept on write instead.
+    """
+
+    def __init__(self, max_entries: Optional[int] = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[float, bytes]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        now = time.monotonic()
+        self._entries[key] = (now + ttl, value)
+        self._entries.move_to_end(key)
+        if self.max_entries is None:
+            for expired in [k for k, (expires_at, _) in self._entries.items() if expires_at < now]:
+                del self._entries[expired]
+            return
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def pop(self, key: str) -> Optional[bytes]:
+        entry = self._entries.pop(key, None)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+
+class RedisCacheBackend:
+    """Shared cache backed by redis.asyncio"""
+
+    def __init__(self, url: str, db: int = 0):
+        try:
+            import redis.asyncio as aioredis
+        except ImportError:
+            raise ImportError(
+                "redis package not installed. "
+                "Install with: pip install redis"
+            )
+        self._redis = aioredis.from_url(url, db=db)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._redis.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        await self._redis.set(key, value, ex=ttl)
+
+    async def delete(self, key: str) -> None:
+        await self._redis.delete(key)
+
+    async def pop(self, key: str) -> Optional[bytes]:
+        return await self._redis.getdel(key)
+
+
+class LLMCache:
+    """
+    Response cache for deterministic provider calls
+
+    Values are dicts serialized with orjson; keys are sha256 digests of the
+    request parameters, prefixed with the provider namespace.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        backend: Optional[CacheBackend] = None,
+        default_ttl: Optional[int] = None
+    ):
+        self.namespace = namespace
+        self.backend = backend or _default_backend()
+        self.default_ttl = default_ttl or settings.REDIS_CACHE_TTL
+        self.stats = {"hits": 0, "misses": 0}
+
+    def make_key(self, params: Dict[str, Any]) -> str:
+        """Build a stable cache key from request parameters"""
+        digest = hashlib.sha256(orjson.dumps(params, option=orjson.OPT_SORT_KEYS)).hexdigest()
+        return f"llmhub:{self.namespace}:{digest}"
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value, or None on miss (backend errors count as misses)"""
+        try:
+            raw = await self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"Cache read failed ({self.namespace}): {str(e)}")
+            raw = None
+
+        if raw is None:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        return orjson.loads(raw)
+
+    async def set(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Store a value; failures are logged and otherwise ignored"""
+        try:
+            raw = orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+        except Exception as e:
+            logger.warning(f"Cache write failed ({self.namespace}): {str(e)}")
+            return
+        await self._store(key, raw, ttl)
+
+    async def _store(self, key: str, raw: bytes, ttl: Optional[int]) -> None:
+        try:
+            await self.backend.set(key, raw, ttl or self.default_ttl)
+        except Exception as e:
+            logger.warning(f"Cache write failed ({self.namespace}): {str(e)}")
+
+    async def delete(self, key: str) -> None:
+        """Remove a value; failures are logged and otherwise ignored"""
+        try:
+            await self.backend.delete(key)
+        except Exception as e:
+            logger.warning(f"Cache delete failed ({self.namespace}): {str(e)}")
+
+    async def pop(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Atomically remove and return a value, or None if absent
+
+        Of several concurrent callers at most one gets the value, which makes
+        this suitable for claiming one-shot entries. Backend errors count as
+        absent.
+        """
+        try:
+            raw = await self.backend.pop(key)
+        except Exception as e:
+            logger.warning(f"Cache pop failed ({self.namespace}): {str(e)}")
+            return None
+        return orjson.loads(raw) if raw is not None else None
+
+    async def get_response(self, key: str) -> Optional[LLMResponse]:
+        """
+        Return a cached LLMResponse, or None on miss
+
+        Hits cost nothing at the provider, so cost_usd is zeroed and
+        provider_metadata is tagged with cache_hit=True.
+        """
+        cached = await self.get(key)
+        if cached is None:
+            return None
+
+        response = LLMResponse(**cached)
+        response.cost_usd = 0.0
+        response.provider_metadata = {**(response.provider_metadata or {}), "cache_hit": True}
+        return response
+
+    async def set_response(self, key: str, response: LLMResponse, ttl: Optional[int] = None) -> None:
+        """Store an LLMResponse (responses with raw bytes content are skipped)"""
+        try:
+            raw = response.to_json_bytes()
+        except Exception as e:
+            logger.warning(f"Cache write failed ({self.namespace}): {str(e)}")
+            return
+        await self._store(key, raw, ttl)
+
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesce identical concurrent calls
+
+    While a call for a key is in flight, later callers with the same key
+    await its result instead of issuing a duplicate request. The call runs
+    as its own task, so cancelling any one caller (including the first)
+    leaves the others waiting on it.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._done(key, done))
+        return await asyncio.shield(task)
+
+    def _done(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # Mark retrieved when every caller has gone
+
+
+_shared_backend: Optional[CacheBackend] = None
+_jobs_backend: Optional[CacheBackend] = None
+_embeddings_backend: Optional[CacheBackend] = None
+
+
+def _default_backend() -> CacheBackend:
+    """Backend selected by LLM_CACHE_BACKEND, shared by all LLMCache instances"""
+    global _shared_backend
+    if _shared_backend is None:
+        if settings.LLM_CACHE_BACKEND == "redis":
+            _shared_backend = RedisCacheBackend(settings.REDIS_URL, db=settings.REDIS_DB)
+        else:
+            _shared_backend = InMemoryCacheBackend(max_entries=settings.LLM_CACHE_MAX_ENTRIES)
+    return _shared_backend
+
+
+def jobs_backend() -> CacheBackend:
+    """
+    Backend for pending async-job state (e.g. queued webhook transcripts)
+
+    Unlike the response cache this must never drop live entries for space:
+    Redis when LLM_CACHE_BACKEND is "redis" (shared across workers), else a
+    process-local store without an LRU bound. Entries still expire by TTL.
+    """
+    global _jobs_backend
+    if _jobs_backend is None:
+        if settings.LLM_CACHE_BACKEND == "redis":
+            _jobs_backend = _default_backend()
+        else:
+            _jobs_backend = InMemoryCacheBackend(max_entries=None)
+    return _jobs_backend
+
+
+def embeddings_backend() -> CacheBackend:
+    """
+    Backend for per-text embedding (and rerank) caching
+
+    One embed call can add thousands of entries, so in memory it gets its
+    own LRU of EMBED_CACHE_MAX_ENTRIES instead of evicting everything in
+    the shared response cache. Redis when LLM_CACHE_BACKEND is "redis".
+    """
+    global _embeddings_backend
+    if _embeddings_backend is None:
+        if settings.LLM_CACHE_BACKEND == "redis":
+            _embeddings_backend = _default_backend()
+        else:
+            _embeddings_backend = InMemoryCacheBackend(max_entries=settings.EMBED_CACHE_MAX_ENTRIES)
+    return _embeddings_backend
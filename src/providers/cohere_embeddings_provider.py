@@ -4,7 +4,6 @@ High-quality embeddings for RAG and semantic search
 """
 
 from typing import List, Optional
-import cohere
 from src.providers.base_embeddings import (
     BaseEmbeddingsProvider,
     EmbeddingsResponse,
@@ -23,9 +22,16 @@ class CohereEmbeddingsProvider(BaseEmbeddingsProvider):
     def is_available(self) -> bool:
         return bool(self.config.api_key)
 
-    def _get_client(self) -> cohere.Client:
-        """Lazy client initialization"""
+    def _get_client(self):
+        """Lazy client initialization (cohere SDK imported on first use)"""
         if not self._client and self.config.api_key:
+            try:
+                import cohere
+            except ImportError:
+                raise ImportError(
+                    "cohere package not installed. "
+                    "Install with: pip install cohere"
+                )
             self._client = cohere.Client(api_key=self.config.api_key)
         return self._client
 
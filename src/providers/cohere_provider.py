@@ -3,15 +3,53 @@ Cohere Provider
 Enterprise LLM with excellent RAG capabilities and GDPR compliance
 """
 
-from typing import List, Dict, Any, Optional
-import cohere
-from src.providers.base import BaseProvider, LLMResponse, ProviderConfig, ProviderMetadata
+from typing import List, Dict, Any, Optional, Tuple
+from collections import OrderedDict
+import asyncio
+import dataclasses
+import hashlib
+import orjson
+from src.providers.base import BaseProvider, LLMResponse, ProviderConfig, ProviderMetadata, close_client
+from src.providers.cache import LLMCache, SingleFlight
+from src.providers.rate_limit import RateLimiter
 from src.utils.logger import logger
 
 
 class CohereProvider(BaseProvider):
     """Cohere provider implementation"""
 
+    MODELS: Tuple[str, ...] = (
+        "command-r-plus",
+        "command-r",
+        "command",
+        "command-light",
+    )
+
+    METADATA = ProviderMetadata(
+        display_name="Cohere",
+        description="Enterprise AI with excellent RAG capabilities, multilingual support, and GDPR compliance",
+        logo_url="https://cohere.com/favicon.ico",
+        website_url="https://cohere.com",
+        requires_api_key=True,
+        requires_base_url=False
+    )
+
+    # Max conversations whose converted chat history is kept
+    HISTORY_CACHE_SIZE = 1024
+
+    # SDK clients shared by every instance, keyed by API key
+    _shared_clients: Dict[str, Any] = {}
+    _clients_lock = asyncio.Lock()
+
+    def __init__(self, config: ProviderConfig):
+        super().__init__(config)
+        self.cache = LLMCache(namespace="cohere")
+        self._inflight = SingleFlight()
+        self._limiter = RateLimiter(config.max_concurrency, config.requests_per_minute)
+        # conversation_id -> (messages processed, digest of those messages,
+        # chat_history, last user message); cached lists are never mutated
+        self._history_cache: "OrderedDict[str, Tuple[int, str, List[Dict[str, str]], str]]" = OrderedDict()
+
     @property
     def provider_name(self) -> str:
         return "cohere"
@@ -19,11 +57,28 @@ class CohereProvider(BaseProvider):
     def is_available(self) -> bool:
         return bool(self.config.api_key)
 
-    def _get_client(self) -> cohere.Client:
-        """Lazy client initialization"""
-        if not self._client and self.config.api_key:
-            self._client = cohere.Client(api_key=self.config.api_key)
-        return self._client
+    @classmethod
+    async def _get_client(cls, api_key: str):
+        """Lazy client initialization, one client per API key (cohere SDK imported on first use)"""
+        async with cls._clients_lock:
+            if api_key not in cls._shared_clients:
+                try:
+                    import cohere
+                except ImportError:
+                    raise ImportError(
+                        "cohere package not installed. "
+                        "Install with: pip install cohere"
+                    )
+                cls._shared_clients[api_key] = cohere.AsyncClient(api_key=api_key)
+        return cls._shared_clients[api_key]
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close all shared Cohere clients"""
+        async with cls._clients_lock:
+            for client in cls._shared_clients.values():
+                await close_client(client)
+            cls._shared_clients.clear()
 
     async def call(
         self,
@@ -38,98 +93,177 @@ class CohereProvider(BaseProvider):
         if not self.is_available():
             raise ValueError("Cohere API key not configured")
 
-        client = self._get_client()
+        if not messages:
+            raise ValueError("Messages cannot be empty")
 
-        try:
-            # Cohere uses chat API with message history
-            chat_history = []
-            user_message = ""
-
-            # Process messages
-            for msg in messages:
-                role = msg["role"]
-                content = msg["content"]
-
-                if role == "system":
-                    # System messages handled via preamble parameter
-                    continue
-                elif role == "user":
-                    user_message = content
-                elif role == "assistant":
-                    chat_history.append({
-                        "role": "CHATBOT",
-                        "message": content
-                    })
-
-            # Prepare chat parameters
-            chat_params = {
-                "message": user_message or messages[-1]["content"],
-                "model": model,
-                "temperature": temperature if temperature is not None else 0.7,
-                "chat_history": chat_history if chat_history else None,
-            }
+        request_key = self.cache.make_key({
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "system_prompt": system_prompt,
+            "max_tokens": max_tokens
+        })
+
+        conversation_id = kwargs.get("conversation_id")
+
+        # Only temperature=0 chat is deterministic enough to cache or share;
+        # sampled completions are never handed to another caller
+        if temperature != 0:
+            return await self._chat(
+                model, messages, max_tokens, temperature, system_prompt, None,
+                conversation_id=conversation_id
+            )
 
-            # Add system prompt as preamble if provided
-            if system_prompt:
-                chat_params["preamble"] = system_prompt
-
-            # Add max_tokens if specified
-            if max_tokens:
-                chat_params["max_tokens"] = max_tokens
-
-            # Call Cohere Chat API
-            response = client.chat(**chat_params)
-
-            # Extract response content
-            content = response.text
-
-            # Get token counts from response
-            # Cohere returns token counts in meta field
-            input_tokens = 0
-            output_tokens = 0
-
-            if hasattr(response, 'meta') and response.meta:
-                if hasattr(response.meta, 'billed_units'):
-                    input_tokens = getattr(response.meta.billed_units, 'input_tokens', 0)
-                    output_tokens = getattr(response.meta.billed_units, 'output_tokens', 0)
-
-            # Calculate cost
-            cost_usd = self.calculate_cost(model, input_tokens, output_tokens)
-
-            return LLMResponse(
-                content=content,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                cost_usd=cost_usd,
-                provider_metadata={
-                    "model": model,
-                    "finish_reason": getattr(response, 'finish_reason', None),
-                    "generation_id": getattr(response, 'generation_id', None)
-                }
+        cached = await self.cache.get_response(request_key)
+        if cached is not None:
+            return cached
+
+        submitted = False
+
+        async def chat() -> LLMResponse:
+            nonlocal submitted
+            submitted = True
+            return await self._chat(
+                model, messages, max_tokens, temperature, system_prompt, request_key,
+                conversation_id=conversation_id
+            )
+
+        # Identical concurrent requests share a single API call
+        response = await self._inflight.do(request_key, chat)
+        if not submitted:
+            # Coalesced onto a concurrent identical request; only that one is billed
+            response = dataclasses.replace(
+                response,
+                cost_usd=0.0,
+                provider_metadata={**(response.provider_metadata or {}), "cache_hit": True}
             )
+        return response
+
+    async def _chat(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        max_tokens: Optional[int],
+        temperature: Optional[float],
+        system_prompt: Optional[str],
+        cache_key: Optional[str],
+        conversation_id: Optional[str] = None
+    ) -> LLMResponse:
+        """Issue the Cohere chat request and store cacheable results"""
+        client = await self._get_client(self.config.api_key)
+
+        # Cohere uses chat API with message history
+        chat_history, user_message = self._build_chat_history(messages, conversation_id)
+
+        # Prepare chat parameters
+        chat_params = {
+            "message": user_message or messages[-1]["content"],
+            "model": model,
+            "temperature": temperature if temperature is not None else 0.7,
+            "chat_history": chat_history if chat_history else None,
+        }
+
+        # Add system prompt as preamble if provided
+        if system_prompt:
+            chat_params["preamble"] = system_prompt
 
+        # Add max_tokens if specified
+        if max_tokens:
+            chat_params["max_tokens"] = max_tokens
+
+        try:
+            # Call Cohere Chat API (bounded by concurrency/rate limits)
+            async with self._limiter:
+                response = await client.chat(**chat_params)
         except Exception as e:
             logger.error(f"Cohere API error: {str(e)}")
             raise
 
-    def get_models(self) -> List[str]:
-        return [
-            "command-r-plus",
-            "command-r",
-            "command",
-            "command-light"
-        ]
+        # Extract response content
+        content = response.text
 
-    def get_metadata(self) -> ProviderMetadata:
-        return ProviderMetadata(
-            display_name="Cohere",
-            description="Enterprise AI with excellent RAG capabilities, multilingual support, and GDPR compliance",
-            logo_url="https://cohere.com/favicon.ico",
-            website_url="https://cohere.com",
-            requires_api_key=True,
-            requires_base_url=False
+        # Get token counts from response
+        # Cohere returns token counts in meta field
+        billed_units = getattr(getattr(response, 'meta', None), 'billed_units', None)
+        input_tokens = getattr(billed_units, 'input_tokens', 0) or 0
+        output_tokens = getattr(billed_units, 'output_tokens', 0) or 0
+
+        # Calculate cost
+        cost_usd = self.calculate_cost(model, input_tokens, output_tokens)
+
+        result = LLMResponse(
+            content=content,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cost_usd=cost_usd,
+            provider_metadata={
+                "model": model,
+                "finish_reason": getattr(response, 'finish_reason', None),
+                "generation_id": getattr(response, 'generation_id', None)
+            }
         )
 
+        if cache_key:
+            await self.cache.set_response(cache_key, result)
+
+        return result
+
+    def _build_chat_history(
+        self,
+        messages: List[Dict[str, str]],
+        conversation_id: Optional[str] = None
+    ) -> Tuple[List[Dict[str, str]], str]:
+        """
+        Convert messages to Cohere chat_history and the current user message
+
+        With a conversation_id, the converted history is cached and only
+        messages added since the previous turn are processed. The cache is
+        only reused if the already-processed messages are unchanged (an
+        edited or regenerated turn rebuilds from scratch).
+        """
+        chat_history: List[Dict[str, str]] = []
+        user_message = ""
+        start = 0
+
+        if conversation_id:
+            cached = self._history_cache.get(conversation_id)
+            if cached and cached[0] <= len(messages) and cached[1] == self._messages_digest(messages[:cached[0]]):
+                start, _, cached_history, user_message = cached
+                # Copy: concurrent turns of one conversation share the cached list
+                chat_history = list(cached_history)
+
+        # Process new messages (system messages handled via preamble parameter)
+        new_messages = messages[start:] if start else messages
+        chat_history.extend([
+            {"role": "CHATBOT", "message": msg["content"]}
+            for msg in new_messages
+            if msg["role"] == "assistant"
+        ])
+        user_message = next(
+            (msg["content"] for msg in reversed(new_messages) if msg["role"] == "user"),
+            user_message
+        )
+
+        if conversation_id:
+            self._history_cache[conversation_id] = (
+                len(messages), self._messages_digest(messages), chat_history, user_message
+            )
+            self._history_cache.move_to_end(conversation_id)
+            while len(self._history_cache) > self.HISTORY_CACHE_SIZE:
+                self._history_cache.popitem(last=False)
+
+        return chat_history, user_message
+
+    @staticmethod
+    def _messages_digest(messages: List[Dict[str, str]]) -> str:
+        return hashlib.sha256(orjson.dumps(messages)).hexdigest()
+
+    def get_models(self) -> Tuple[str, ...]:
+        return self.MODELS
+
+    def get_metadata(self) -> ProviderMetadata:
+        return self.METADATA
+
 
 # Auto-register this provider
 def register():
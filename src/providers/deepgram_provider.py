@@ -3,13 +3,45 @@ Deepgram Provider - Ultra-Fast Speech-to-Text
 World's fastest speech recognition with sub-200ms latency and real-time streaming
 """
 
-from typing import Dict, Any, List, Optional
-import time
-
-from src.providers.base import BaseProvider, LLMResponse, ProviderConfig, ProviderMetadata
+from typing import Dict, Any, List, Optional, Tuple, AsyncIterator
+from operator import attrgetter
+import asyncio
+import itertools
+
+from src.providers.base import BaseProvider, LLMResponse, ProviderConfig, ProviderMetadata, close_client
+from src.providers.cache import LLMCache, SingleFlight
+from src.providers.http_client import get_shared_async_client
+from src.providers.rate_limit import RateLimiter
 from src.utils.logger import logger
 
 
+# Cost per second of audio (USD), from per-minute list prices
+_COST_PER_SECOND = {
+    model: cost_per_minute / 60
+    for model, cost_per_minute in {
+        "nova-3": 0.0043,
+        "nova-3-multilingual": 0.0043,
+        "nova-3-medical": 0.0043,
+        "nova-2": 0.0043,
+        "whisper-large": 0.0048,
+        # Streaming models (for future)
+        "nova-3-streaming": 0.0059,
+    }.items()
+}
+
+# Features reported in provider_metadata["features_enabled"]
+_FEATURE_FLAGS: Tuple[str, ...] = (
+    "smart_format", "diarize", "summarize", "topics", "sentiment", "intents",
+    "detect_language", "keywords", "paragraphs", "utterances", "profanity_filter", "redact"
+)
+
+# Field extractors for per-item transcript results
+_WORD_KEYS = ("word", "start", "end", "confidence")
+_get_word_fields = attrgetter(*_WORD_KEYS)
+_UTTERANCE_KEYS = ("speaker", "text", "start", "end", "confidence")
+_get_utterance_fields = attrgetter("speaker", "transcript", "start", "end", "confidence")
+
+
 class DeepgramProvider(BaseProvider):
     """
     Deepgram speech-to-text provider
@@ -31,17 +63,40 @@ class DeepgramProvider(BaseProvider):
 
     Operations:
     - transcribe: Convert audio to text with intelligence features
-    - stream: Real-time streaming transcription (future enhancement)
+    - stream: Incremental transcription via stream_transcribe()
     """
 
     # Supported models
-    MODELS = [
+    MODELS: Tuple[str, ...] = (
         "nova-3",                # Flagship: Best accuracy, multilingual
         "nova-3-multilingual",   # 10-language code-switching
         "nova-3-medical",        # Healthcare specialization
         "nova-2",                # Previous generation
         "whisper-large",         # OpenAI Whisper (faster via Deepgram)
-    ]
+    )
+
+    METADATA = ProviderMetadata(
+        display_name="Deepgram",
+        description="World's fastest speech-to-text with sub-200ms latency. "
+                    "Nova-3 delivers 54% lower streaming WER, real-time code-switching "
+                    "across 10 languages, and 40x faster diarization. Includes smart "
+                    "formatting, summarization, topics, sentiment, and keyword boosting.",
+        logo_url="https://deepgram.com/favicon.ico",
+        website_url="https://deepgram.com",
+        requires_api_key=True,
+        requires_base_url=False
+    )
+
+    # SDK clients shared by every instance, keyed by API key
+    _shared_clients: Dict[str, Any] = {}
+    _clients_lock = asyncio.Lock()
+
+    def __init__(self, config: ProviderConfig):
+        super().__init__(config)
+        # Pre-recorded transcription is deterministic for a given URL + options
+        self.cache = LLMCache(namespace="deepgram")
+        self._inflight = SingleFlight()
+        self._limiter = RateLimiter(config.max_concurrency, config.requests_per_minute)
 
     @property
     def provider_name(self) -> str:
@@ -51,42 +106,42 @@ class DeepgramProvider(BaseProvider):
         """Check if Deepgram API key is configured"""
         return self.config.api_key is not None and len(self.config.api_key) > 0
 
-    def get_models(self) -> List[str]:
+    def get_models(self) -> Tuple[str, ...]:
         """Return supported models"""
         return self.MODELS
 
     def get_metadata(self) -> ProviderMetadata:
         """Provider information for UI display"""
-        return ProviderMetadata(
-            display_name="Deepgram",
-            description="World's fastest speech-to-text with sub-200ms latency. "
-                        "Nova-3 delivers 54% lower streaming WER, real-time code-switching "
-                        "across 10 languages, and 40x faster diarization. Includes smart "
-                        "formatting, summarization, topics, sentiment, and keyword boosting.",
-            logo_url="https://deepgram.com/favicon.ico",
-            website_url="https://deepgram.com",
-            requires_api_key=True,
-            requires_base_url=False
-        )
-
-    def _get_client(self):
-        """Lazy-load Deepgram client"""
-        if self._client is None:
-            try:
-                from deepgram import DeepgramClient
-
-                self._client = DeepgramClient(self.config.api_key)
-                logger.info(f"Initialized Deepgram client")
-            except ImportError:
-                raise ImportError(
-                    "deepgram-sdk package not installed. "
-                    "Install with: pip install deepgram-sdk"
-                )
-            except Exception as e:
-                logger.error(f"Failed to initialize Deepgram client: {str(e)}")
-                raise
-
-        return self._client
+        return self.METADATA
+
+    @classmethod
+    async def _get_client(cls, api_key: str):
+        """Lazy-load Deepgram client, one client per API key"""
+        async with cls._clients_lock:
+            if api_key not in cls._shared_clients:
+                try:
+                    from deepgram import DeepgramClient
+
+                    cls._shared_clients[api_key] = DeepgramClient(api_key)
+                    logger.info(f"Initialized Deepgram client")
+                except ImportError:
+                    raise ImportError(
+                        "deepgram-sdk package not installed. "
+                        "Install with: pip install deepgram-sdk"
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to initialize Deepgram client: {str(e)}")
+                    raise
+
+        return cls._shared_clients[api_key]
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close all shared Deepgram clients"""
+        async with cls._clients_lock:
+            for client in cls._shared_clients.values():
+                await close_client(client)
+            cls._shared_clients.clear()
 
     async def call(
         self,
@@ -102,7 +157,7 @@ class DeepgramProvider(BaseProvider):
 
         Operations:
         - transcribe: Convert audio to text (audio_url kwarg required)
-        - stream: Real-time streaming (future enhancement)
+        - stream: Returns an async iterator; use stream_transcribe() directly
         """
         if not self.is_available():
             raise ValueError(
@@ -115,9 +170,9 @@ class DeepgramProvider(BaseProvider):
         if operation == "transcribe":
             return await self._transcribe(**kwargs)
         elif operation == "stream":
-            raise NotImplementedError(
-                "Real-time streaming not yet implemented. "
-                "Use operation='transcribe' for pre-recorded audio."
+            raise ValueError(
+                "Streaming yields partial results and cannot return a single "
+                "LLMResponse. Use DeepgramProvider.stream_transcribe() instead."
             )
         else:
             raise ValueError(
@@ -167,6 +222,9 @@ class DeepgramProvider(BaseProvider):
         # Multi-channel
         multichannel: bool = False,
 
+        # Output shaping
+        include_words: bool = True,
+
         **kwargs
     ) -> LLMResponse:
         """
@@ -196,6 +254,8 @@ class DeepgramProvider(BaseProvider):
             search: Terms to search for
             replace: Find and replace terms
             multichannel: Multi-channel audio processing
+            include_words: Include per-word timestamps (first 100 words);
+                disable when only the transcript text is needed
 
         Returns:
             LLMResponse with transcript and intelligence results
@@ -209,178 +269,207 @@ class DeepgramProvider(BaseProvider):
                 f"Supported: {', '.join(self.MODELS)}"
             )
 
-        try:
-            from deepgram import PrerecordedOptions
+        # Values in _FEATURE_FLAGS order
+        features_enabled = self._list_enabled_features((
+            smart_format, diarize, summarize, topics, sentiment, intents,
+            detect_language, keywords, paragraphs, utterances, profanity_filter, redact
+        ))
+
+        # Build transcription options in one pass; None values fall back to SDK defaults
+        opts = {
+            "model": model,
+            "smart_format": smart_format,
+            "punctuate": punctuate if not smart_format else None,  # smart_format includes punctuation
+            "paragraphs": paragraphs,
+            "numerals": numerals,
+            "filler_words": filler_words,
+            "diarize": diarize,
+            "diarize_version": "2024-09-24" if diarize else None,  # Latest version
+            "utterances": utterances if diarize else None,  # Requires diarization
+            "multichannel": multichannel,
+            "profanity_filter": profanity_filter,
+        }
 
-            client = self._get_client()
+        # Language settings
+        if detect_language:
+            opts["detect_language"] = True
+        elif language_code:
+            opts["language"] = language_code
 
-            # Build transcription options
-            options = PrerecordedOptions(
-                model=model,
-                smart_format=smart_format,
-                punctuate=punctuate if not smart_format else None,  # smart_format includes punctuation
-                paragraphs=paragraphs,
-                numerals=numerals,
-                filler_words=filler_words,
-                diarize=diarize,
-                diarize_version="2024-09-24" if diarize else None,  # Latest version
-                utterances=utterances if diarize else None,  # Requires diarization
-                multichannel=multichannel,
-                profanity_filter=profanity_filter,
-            )
+        # Audio intelligence features
+        if summarize:
+            opts["summarize"] = "v2"  # Latest version
 
-            # Language settings
-            if detect_language:
-                options.detect_language = True
-            elif language_code:
-                options.language = language_code
+        if topics:
+            opts["topics"] = True
+            if custom_topics:
+                opts["custom_topics"] = custom_topics
 
-            # Audio intelligence features
-            if summarize:
-                options.summarize = "v2"  # Latest version
+        if sentiment:
+            opts["sentiment"] = True
 
-            if topics:
-                options.topics = True
-                if custom_topics:
-                    options.custom_topics = custom_topics
+        if intents:
+            opts["intents"] = True
 
-            if sentiment:
-                options.sentiment = True
+        # Keyword boosting
+        if keywords:
+            # Format: ["keyword1:boost", "keyword2:boost"]
+            opts["keywords"] = [f"{kw}:{keyword_boost}" for kw in keywords[:100]]  # Limit 100
 
-            if intents:
-                options.intents = True
+        # PII redaction
+        if redact:
+            opts["redact"] = redact
 
-            # Keyword boosting
-            if keywords:
-                # Format: ["keyword1:boost", "keyword2:boost"]
-                keyword_list = [f"{kw}:{keyword_boost}" for kw in keywords[:100]]  # Limit 100
-                options.keywords = keyword_list
+        # Search
+        if search:
+            opts["search"] = search
 
-            # PII redaction
-            if redact:
-                options.redact = redact
+        # Replace
+        if replace:
+            opts["replace"] = replace
 
-            # Search
-            if search:
-                options.search = search
+        opts = {key: value for key, value in opts.items() if value is not None}
 
-            # Replace
-            if replace:
-                options.replace = replace
+        cache_key = self.cache.make_key({
+            "audio_url": audio_url,
+            "language_code": language_code,
+            "include_words": include_words,
+            **opts
+        })
+        cached = await self.cache.get_response(cache_key)
+        if cached is not None:
+            return cached
 
-            logger.info(
-                f"Starting Deepgram transcription: model={model}, "
-                f"url={audio_url[:50]}..., features={self._list_enabled_features(**locals())}"
-            )
+        from deepgram import PrerecordedOptions
 
-            # Call Deepgram API
-            response = client.listen.rest.v("1").transcribe_url(
-                source={"url": audio_url},
-                options=options
-            )
+        client = await self._get_client(self.config.api_key)
+        options = PrerecordedOptions(**opts)
+
+        logger.info(
+            f"Starting Deepgram transcription: model={model}, "
+            f"url={audio_url[:50]}..., features={features_enabled}"
+        )
+
+        submitted = False
+
+        try:
+
+            async def transcribe_url():
+                nonlocal submitted
+                submitted = True
+                async with self._limiter:
+                    return await client.listen.asyncrest.v("1").transcribe_url(
+                        source={"url": audio_url},
+                        options=options
+                    )
+
+            # Call Deepgram API (identical concurrent requests share one call)
+            response = await self._inflight.do(cache_key, transcribe_url)
 
             # Extract results
-            channel = response.results.channels[0]
+            results = response.results
+            metadata = response.metadata
+            channel = results.channels[0]
             alternative = channel.alternatives[0]
 
             # Basic transcript data
             transcript_text = alternative.transcript
-            confidence = alternative.confidence if hasattr(alternative, 'confidence') else None
+            confidence = getattr(alternative, 'confidence', None)
 
             # Audio duration (in seconds)
-            audio_duration = response.metadata.duration if hasattr(response.metadata, 'duration') else 0
+            audio_duration = getattr(metadata, 'duration', 0)
 
             # Build response content
+            model_info = getattr(metadata, 'model_info', None)
             response_content = {
                 "text": transcript_text,
                 "audio_duration": audio_duration,
                 "confidence": confidence,
-                "model_info": response.metadata.model_info.__dict__ if hasattr(response.metadata, 'model_info') else {}
+                "model_info": model_info.__dict__ if model_info is not None else {}
             }
 
             # Language detection
-            if detect_language and hasattr(channel, 'detected_language'):
-                response_content["detected_language"] = channel.detected_language
+            detected_language = getattr(channel, 'detected_language', None)
+            if detect_language and detected_language is not None:
+                response_content["detected_language"] = detected_language
             elif language_code:
                 response_content["language_code"] = language_code
 
             # Words with timestamps
-            if hasattr(alternative, 'words') and alternative.words:
+            words = getattr(alternative, 'words', None) if include_words else None
+            if words:
                 response_content["words"] = [
-                    {
-                        "word": word.word,
-                        "start": word.start,
-                        "end": word.end,
-                        "confidence": word.confidence if hasattr(word, 'confidence') else None
-                    }
-                    for word in alternative.words[:100]  # Limit to first 100 words
+                    dict(zip(_WORD_KEYS, _get_word_fields(word)))
+                    for word in itertools.islice(words, 100)  # Limit to first 100 words
                 ]
 
             # Paragraphs
-            if paragraphs and hasattr(alternative, 'paragraphs') and alternative.paragraphs:
+            paragraphs_obj = getattr(alternative, 'paragraphs', None)
+            if paragraphs and paragraphs_obj:
                 response_content["paragraphs"] = [
                     {
                         "transcript": para.sentences[0].text if para.sentences else "",
-                        "start": para.start if hasattr(para, 'start') else None,
-                        "end": para.end if hasattr(para, 'end') else None
+                        "start": getattr(para, 'start', None),
+                        "end": getattr(para, 'end', None)
                     }
-                    for para in alternative.paragraphs.paragraphs
+                    for para in paragraphs_obj.paragraphs
                 ]
 
             # Utterances (speaker diarization)
-            if utterances and hasattr(channel, 'utterances') and channel.utterances:
+            utterances_list = getattr(channel, 'utterances', None)
+            if utterances and utterances_list:
                 response_content["utterances"] = [
-                    {
-                        "speaker": utt.speaker,
-                        "text": utt.transcript,
-                        "start": utt.start,
-                        "end": utt.end,
-                        "confidence": utt.confidence if hasattr(utt, 'confidence') else None
-                    }
-                    for utt in channel.utterances
+                    dict(zip(_UTTERANCE_KEYS, _get_utterance_fields(utt)))
+                    for utt in utterances_list
                 ]
 
             # Summary
-            if summarize and hasattr(response.results, 'summary'):
-                response_content["summary"] = response.results.summary.short if hasattr(response.results.summary, 'short') else str(response.results.summary)
+            summary_obj = getattr(results, 'summary', None)
+            if summarize and summary_obj is not None:
+                summary_text = getattr(summary_obj, 'short', None)
+                response_content["summary"] = summary_text if summary_text is not None else str(summary_obj)
 
             # Topics
-            if topics and hasattr(response.results, 'topics'):
+            topics_obj = getattr(results, 'topics', None)
+            if topics and topics_obj is not None:
                 response_content["topics_detected"] = [
                     {
-                        "topic": topic.topic if hasattr(topic, 'topic') else str(topic),
-                        "confidence": topic.confidence if hasattr(topic, 'confidence') else None
+                        "topic": getattr(topic, 'topic', None) or str(topic),
+                        "confidence": getattr(topic, 'confidence', None)
                     }
-                    for segment in response.results.topics.segments
+                    for segment in getattr(topics_obj, 'segments', None) or []
                     for topic in segment.topics
-                ] if hasattr(response.results.topics, 'segments') else []
+                ]
 
             # Sentiment
-            if sentiment and hasattr(response.results, 'sentiments'):
+            sentiments_obj = getattr(results, 'sentiments', None)
+            if sentiment and sentiments_obj is not None:
                 response_content["sentiment_analysis_results"] = [
                     {
-                        "text": seg.text if hasattr(seg, 'text') else "",
-                        "sentiment": seg.sentiment if hasattr(seg, 'sentiment') else None,
-                        "confidence": seg.sentiment_score if hasattr(seg, 'sentiment_score') else None,
-                        "start": seg.start if hasattr(seg, 'start') else None,
-                        "end": seg.end if hasattr(seg, 'end') else None
+                        "text": getattr(seg, 'text', ""),
+                        "sentiment": getattr(seg, 'sentiment', None),
+                        "confidence": getattr(seg, 'sentiment_score', None),
+                        "start": getattr(seg, 'start', None),
+                        "end": getattr(seg, 'end', None)
                     }
-                    for seg in response.results.sentiments.segments
-                ] if hasattr(response.results.sentiments, 'segments') else []
+                    for seg in getattr(sentiments_obj, 'segments', None) or []
+                ]
 
             # Intents
-            if intents and hasattr(response.results, 'intents'):
+            intents_obj = getattr(results, 'intents', None)
+            if intents and intents_obj is not None:
                 response_content["intents_detected"] = [
                     {
-                        "intent": seg.intent if hasattr(seg, 'intent') else None,
-                        "confidence": seg.intent_score if hasattr(seg, 'intent_score') else None
+                        "intent": getattr(seg, 'intent', None),
+                        "confidence": getattr(seg, 'intent_score', None)
                     }
-                    for seg in response.results.intents.segments
-                ] if hasattr(response.results.intents, 'segments') else []
+                    for seg in getattr(intents_obj, 'segments', None) or []
+                ]
 
             # Search results
-            if search and hasattr(response.results, 'search'):
-                response_content["search_results"] = response.results.search
+            search_results = getattr(results, 'search', None)
+            if search and search_results is not None:
+                response_content["search_results"] = search_results
 
             # Calculate cost (per-second precision!)
             cost_usd = self._calculate_cost(audio_duration, model)
@@ -396,7 +485,7 @@ class DeepgramProvider(BaseProvider):
                 cost_usd=cost_usd
             )
 
-            return LLMResponse(
+            result = LLMResponse(
                 content=response_content,
                 input_tokens=pseudo_tokens,  # Duration-based pseudo-tokens
                 output_tokens=0,  # Transcription doesn't generate tokens
@@ -405,28 +494,180 @@ class DeepgramProvider(BaseProvider):
                     "audio_duration": audio_duration,
                     "model": model,
                     "detected_language": response_content.get("detected_language"),
-                    "features_enabled": self._list_enabled_features(**locals())
+                    "features_enabled": features_enabled
                 }
             )
 
+            if not submitted:
+                # Coalesced onto a concurrent identical request; only that one is billed
+                result.cost_usd = 0.0
+                result.provider_metadata["cache_hit"] = True
+                return result
+
+            await self.cache.set_response(cache_key, result)
+
+            return result
+
         except Exception as e:
             logger.error(f"Deepgram transcription failed: {str(e)}", model=model)
             raise Exception(f"Deepgram transcription failed: {str(e)}")
 
-    def _list_enabled_features(self, **kwargs) -> List[str]:
-        """List which features are enabled"""
-        features = []
-        feature_flags = [
-            "smart_format", "diarize", "summarize", "topics",
-            "sentiment", "intents", "detect_language", "keywords",
-            "paragraphs", "utterances", "profanity_filter", "redact"
-        ]
-        for flag in feature_flags:
-            if kwargs.get(flag):
-                features.append(flag)
-        return features
-
-    def _calculate_cost(self, audio_duration_seconds: float, model: str) -> float:
+    async def stream_transcribe(
+        self,
+        audio_url: str,
+        model: str = "nova-3",
+        language_code: Optional[str] = None,
+        smart_format: bool = True,
+        diarize: bool = False,
+        max_words: Optional[int] = None,
+        chunk_size: int = 8192,
+        queue_size: int = 32
+    ) -> AsyncIterator[LLMResponse]:
+        """
+        Transcribe long audio incrementally over Deepgram's live websocket
+
+        The audio at audio_url is downloaded in chunks and forwarded as it
+        arrives, and each finalized segment is yielded as its own LLMResponse,
+        so the first text is available long before the whole file is processed.
+
+        Args:
+            audio_url: Public URL to audio file
+            model: Deepgram model
+            language_code: Language hint
+            smart_format: Smart formatting
+            diarize: Speaker diarization
+            max_words: Stop after this many transcribed words
+            chunk_size: Bytes forwarded per websocket frame
+            queue_size: Buffered segments before the websocket handler waits (backpressure)
+
+        Yields:
+            LLMResponse per finalized segment (content has text, start, duration, words)
+
+        Library-only: no router exposes this yet, so callers are responsible
+        for billing the cost_usd of each yielded segment.
+        """
+        if not self.is_available():
+            raise ValueError(
+                "Deepgram provider not configured. "
+                "Set DEEPGRAM_API_KEY in .env"
+            )
+
+        if not audio_url:
+            raise ValueError("'audio_url' parameter required for transcription")
+
+        if model not in self.MODELS:
+            raise ValueError(
+                f"Invalid model '{model}'. "
+                f"Supported: {', '.join(self.MODELS)}"
+            )
+
+        from deepgram import LiveOptions, LiveTranscriptionEvents
+
+        client = await self._get_client(self.config.api_key)
+        connection = client.listen.asynclive.v("1")
+        queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        done = object()
+        stopped = False
+        finished = False
+
+        async def offer(item):
+            # Once the consumer has stopped nobody reads the queue; drop items
+            # rather than block the websocket handlers forever
+            if not stopped:
+                await queue.put(item)
+
+        async def finish():
+            nonlocal finished
+            if not finished:
+                finished = True
+                await connection.finish()
+
+        async def on_transcript(_connection, result, **kwargs):
+            if result.is_final:
+                await offer(result)
+
+        async def on_close(_connection, *args, **kwargs):
+            await offer(done)
+
+        async def on_error(_connection, error, **kwargs):
+            await offer(Exception(f"Deepgram streaming error: {error}"))
+
+        connection.on(LiveTranscriptionEvents.Transcript, on_transcript)
+        connection.on(LiveTranscriptionEvents.Close, on_close)
+        connection.on(LiveTranscriptionEvents.Error, on_error)
+
+        options = {"model": model, "smart_format": smart_format, "diarize": diarize}
+        if language_code:
+            options["language"] = language_code
+
+        if not await connection.start(LiveOptions(**options)):
+            raise Exception("Deepgram streaming failed: could not open websocket")
+
+        async def feed_audio():
+            try:
+                http = get_shared_async_client()
+                async with http.stream("GET", audio_url, timeout=self.config.timeout) as audio:
+                    audio.raise_for_status()
+                    async for chunk in audio.aiter_bytes(chunk_size):
+                        await connection.send(chunk)
+            except Exception as e:
+                await offer(Exception(f"Deepgram streaming failed: {str(e)}"))
+            finally:
+                # Flushes buffered audio; Deepgram then sends the last segments and closes
+                await finish()
+
+        feeder = asyncio.create_task(feed_audio())
+        words_seen = 0
+
+        logger.info(f"Starting Deepgram streaming transcription: model={model}, url={audio_url[:50]}...")
+
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+
+                alternative = item.channel.alternatives[0]
+                if not alternative.transcript:
+                    continue
+
+                words = getattr(alternative, 'words', None) or []
+                duration = getattr(item, 'duration', 0) or 0
+
+                yield LLMResponse(
+                    content={
+                        "text": alternative.transcript,
+                        "start": getattr(item, 'start', None),
+                        "duration": duration,
+                        "confidence": getattr(alternative, 'confidence', None),
+                        "words": [dict(zip(_WORD_KEYS, _get_word_fields(word))) for word in words]
+                    },
+                    input_tokens=int(duration * 100),  # Duration-based pseudo-tokens
+                    output_tokens=0,
+                    cost_usd=self._calculate_cost(duration, model),
+                    provider_metadata={"model": model, "is_final": True}
+                )
+
+                words_seen += len(words)
+                if max_words is not None and words_seen >= max_words:
+                    break
+        finally:
+            stopped = True
+            feeder.cancel()
+            # Unblock handlers waiting on a full queue so the connection can close
+            while not queue.empty():
+                queue.get_nowait()
+            await finish()
+
+    @staticmethod
+    def _list_enabled_features(values: Tuple[Any, ...]) -> List[str]:
+        """List which features are enabled, given their values in _FEATURE_FLAGS order"""
+        return [name for name, enabled in zip(_FEATURE_FLAGS, values) if enabled]
+
+    @staticmethod
+    def _calculate_cost(audio_duration_seconds: float, model: str) -> float:
         """
         Calculate cost for transcription (per-second precision!)
 
@@ -437,23 +678,9 @@ class DeepgramProvider(BaseProvider):
         Returns:
             Total cost in USD
         """
-        # Cost per minute
-        cost_per_minute_map = {
-            "nova-3": 0.0043,
-            "nova-3-multilingual": 0.0043,
-            "nova-3-medical": 0.0043,
-            "nova-2": 0.0043,
-            "whisper-large": 0.0048,
-            # Streaming models (for future)
-            "nova-3-streaming": 0.0059,
-        }
-
-        cost_per_minute = cost_per_minute_map.get(model, 0.0043)
-        cost_per_second = cost_per_minute / 60
-
         # Per-second billing (Deepgram's advantage!)
-        total_cost = audio_duration_seconds * cost_per_second
-        return round(total_cost, 6)
+        cost_per_second = _COST_PER_SECOND.get(model, _COST_PER_SECOND["nova-3"])
+        return round(audio_duration_seconds * cost_per_second, 6)
 
 
 # Auto-register this provider
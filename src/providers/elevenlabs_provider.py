@@ -3,12 +3,23 @@ ElevenLabs Text-to-Speech Provider
 Premium voice synthesis with advanced voice controls
 """
 
-from typing import List, Dict, Any, Optional
-from elevenlabs import ElevenLabs
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+import pybase64
 from src.providers.base import BaseProvider, LLMResponse, ProviderConfig, ProviderMetadata
+from src.providers.cache import LLMCache
 from src.utils.logger import logger
 
 
+# Default premade voices (professional use cases), name -> voice ID
+_DEFAULT_VOICES = {
+    "professional_male": "ErXwobaYiN019PkySvjV",      # Antoni - deep, calm
+    "professional_female": "EXAVITQu4vr4xnSDxMaL",    # Bella - friendly, clear
+    "friendly_male": "VR6AewLTigWG4xSOukaG",          # Arnold - warm
+    "friendly_female": "jsCqWAovK2LkecY7zXl4",        # Freya - upbeat
+    "default": "JBFqnCBsd6RMkjVDRZzb"                 # George - neutral
+}
+
+
 class ElevenLabsProvider(BaseProvider):
     """
     ElevenLabs provider for text-to-speech synthesis
@@ -22,6 +33,26 @@ class ElevenLabsProvider(BaseProvider):
     - eleven_monolingual_v1: Legacy English-only, 1 credit/char
     """
 
+    MODELS: Tuple[str, ...] = (
+        "eleven_flash_v2_5",        # Fastest, cheapest
+        "eleven_turbo_v2_5",        # High quality, low latency
+        "eleven_multilingual_v2",   # Best quality
+        "eleven_flash_v2",          # Previous gen flash
+        "eleven_turbo_v2",          # Previous gen turbo
+        "eleven_multilingual_v1",   # Legacy multilingual
+        "eleven_monolingual_v1",    # Legacy English
+    )
+
+    METADATA = ProviderMetadata(
+        display_name="ElevenLabs",
+        description="Premium AI text-to-speech with the most realistic and expressive voices. "
+                    "Supports 32 languages, voice cloning, and 75ms latency for real-time applications.",
+        logo_url="https://elevenlabs.io/favicon.ico",
+        website_url="https://elevenlabs.io",
+        requires_api_key=True,
+        requires_base_url=False
+    )
+
     # Cost per character in USD (based on Growing Business tier: $165/1M chars)
     MODEL_COSTS_PER_CHAR = {
         # Flash models (0.5 credits per character)
@@ -37,13 +68,14 @@ class ElevenLabsProvider(BaseProvider):
     }
 
     # Default premade voices (professional use cases)
-    DEFAULT_VOICES = {
-        "professional_male": "ErXwobaYiN019PkySvjV",      # Antoni - deep, calm
-        "professional_female": "EXAVITQu4vr4xnSDxMaL",    # Bella - friendly, clear
-        "friendly_male": "VR6AewLTigWG4xSOukaG",          # Arnold - warm
-        "friendly_female": "jsCqWAovK2LkecY7zXl4",        # Freya - upbeat
-        "default": "JBFqnCBsd6RMkjVDRZzb"                 # George - neutral
-    }
+    DEFAULT_VOICES = _DEFAULT_VOICES
+
+    # Largest raw audio (bytes) whose synthesis result is cached
+    CACHE_MAX_AUDIO_BYTES = 1_000_000
+
+    def __init__(self, config: ProviderConfig):
+        super().__init__(config)
+        self.cache = LLMCache(namespace="elevenlabs")
 
     @property
     def provider_name(self) -> str:
@@ -53,13 +85,21 @@ class ElevenLabsProvider(BaseProvider):
         """Check if ElevenLabs API key is configured"""
         return bool(self.config.api_key)
 
-    def _get_client(self) -> ElevenLabs:
-        """Lazy client initialization"""
+    def _get_client(self):
+        """Lazy client initialization (elevenlabs SDK imported on first use)"""
         if not self._client and self.config.api_key:
+            try:
+                from elevenlabs import ElevenLabs
+            except ImportError:
+                raise ImportError(
+                    "elevenlabs package not installed. "
+                    "Install with: pip install elevenlabs"
+                )
             self._client = ElevenLabs(api_key=self.config.api_key)
         return self._client
 
-    def _resolve_voice_id(self, voice_identifier: str) -> str:
+    @staticmethod
+    def _resolve_voice_id(voice_identifier: str) -> str:
         """
         Resolve voice identifier to voice ID
 
@@ -67,12 +107,8 @@ class ElevenLabsProvider(BaseProvider):
         - Voice ID directly: "ErXwobaYiN019PkySvjV"
         - Named voice: "professional_male" -> resolves to ID
         """
-        # If it's a named voice, resolve it
-        if voice_identifier in self.DEFAULT_VOICES:
-            return self.DEFAULT_VOICES[voice_identifier]
-
-        # Otherwise assume it's already a voice ID
-        return voice_identifier
+        # Named voices resolve to their ID; anything else is assumed to be an ID already
+        return _DEFAULT_VOICES.get(voice_identifier, voice_identifier)
 
     async def call(
         self,
@@ -95,6 +131,16 @@ class ElevenLabsProvider(BaseProvider):
         - similarity_boost: Voice similarity 0-1 (default: 0.75)
         - style: Speaking style 0-1 (default: 0.0)
         - use_speaker_boost: Enhance clarity (default: True)
+        - stream_to: Writable binary file-like; audio chunks are written to it
+          as they arrive instead of being buffered (optional)
+        - stream_to_url: URL of the stream_to destination, returned as content
+        - output_encoding: "base64" to return content as a base64 str encoded
+          incrementally as chunks arrive (optional)
+        - cache: False to bypass the response cache (default: True). Only
+          base64 results are cached; repeat requests cost nothing
+
+        Otherwise content is the raw audio bytes; encoding for transport is
+        left to the caller.
         """
         if not self.is_available():
             raise ValueError("ElevenLabs API key not configured (ELEVENLABS_API_KEY required)")
@@ -119,6 +165,22 @@ class ElevenLabsProvider(BaseProvider):
             "use_speaker_boost": kwargs.get("use_speaker_boost", True)
         }
 
+        # Synthesis is deterministic for identical inputs, so replay cached audio
+        stream_to = kwargs.get("stream_to")
+        output_encoding = kwargs.get("output_encoding")
+        cache_key = None
+        if kwargs.get("cache", True) and output_encoding == "base64" and stream_to is None:
+            cache_key = self.cache.make_key({
+                "model": model,
+                "voice_id": voice_id,
+                "output_format": output_format,
+                "voice_settings": voice_settings,
+                "text": text
+            })
+            cached = await self.cache.get_response(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             logger.info(
                 f"Starting ElevenLabs TTS: model={model}, voice_id={voice_id[:8]}..., "
@@ -134,48 +196,83 @@ class ElevenLabsProvider(BaseProvider):
                 voice_settings=voice_settings
             )
 
-            # Collect audio bytes
-            audio_bytes = b""
-            for chunk in audio_generator:
-                audio_bytes += chunk
+            if stream_to is not None:
+                # Write chunks straight through; the audio is never held in memory
+                audio_size = 0
+                for chunk in audio_generator:
+                    stream_to.write(chunk)
+                    audio_size += len(chunk)
+                content = kwargs.get("stream_to_url", "")
+            elif output_encoding == "base64":
+                content, audio_size = self._encode_base64_stream(audio_generator)
+            else:
+                # Collect audio bytes (bytearray grows in place; one copy to
+                # immutable bytes at the end)
+                audio_bytes = bytearray()
+                for chunk in audio_generator:
+                    audio_bytes.extend(chunk)
+                audio_size = len(audio_bytes)
+                content = bytes(audio_bytes)
 
             # Calculate cost based on character count
             char_count = len(text)
             cost_usd = self._calculate_audio_cost(model, char_count)
 
-            # For billing tracking: use character-based pseudo-tokens
-            # 1 character = 100 tokens (for compatibility with token-based system)
-            pseudo_tokens = char_count * 100
-
             logger.info(
                 f"ElevenLabs TTS completed: chars={char_count}, "
-                f"audio_size={len(audio_bytes)} bytes, cost=${cost_usd}"
+                f"audio_size={audio_size} bytes, cost=${cost_usd}"
             )
 
-            # Return audio data as base64 or we could upload to MinIO
-            # For now, return as content (caller will handle storage)
-            import base64
-            audio_base64 = base64.b64encode(audio_bytes).decode('utf-8')
-
-            return LLMResponse(
-                content=audio_base64,  # Base64-encoded audio
-                input_tokens=pseudo_tokens,  # Character count * 100
+            result = LLMResponse(
+                content=content,  # Raw audio bytes, base64 str, or stream_to_url when streamed
+                input_tokens=0,
                 output_tokens=0,
                 cost_usd=cost_usd,
+                billable_units=char_count,  # Billed per character
+                unit_type="characters",
                 provider_metadata={
                     "model": model,
                     "voice_id": voice_id,
                     "output_format": output_format,
                     "character_count": char_count,
-                    "audio_size_bytes": len(audio_bytes),
+                    "audio_size_bytes": audio_size,
                     "voice_settings": voice_settings
                 }
             )
 
+            if cache_key and audio_size <= self.CACHE_MAX_AUDIO_BYTES:
+                await self.cache.set_response(cache_key, result)
+
+            return result
+
         except Exception as e:
             logger.error(f"ElevenLabs TTS generation failed: {str(e)}")
             raise Exception(f"ElevenLabs TTS error: {str(e)}")
 
+    @staticmethod
+    def _encode_base64_stream(chunks: Iterable[bytes]) -> Tuple[str, int]:
+        """
+        Base64-encode audio chunks as they arrive
+
+        Each chunk is encoded up to the last 3-byte boundary and the 0-2 byte
+        remainder is carried into the next one, so the raw audio is never held
+        in full alongside its encoding.
+
+        Returns:
+            (base64 str, raw audio size in bytes)
+        """
+        encoded = bytearray()
+        carry = b""
+        audio_size = 0
+        for chunk in chunks:
+            audio_size += len(chunk)
+            data = carry + chunk if carry else chunk
+            aligned = len(data) - len(data) % 3
+            encoded += pybase64.b64encode(memoryview(data)[:aligned])
+            carry = bytes(data[aligned:])
+        encoded += pybase64.b64encode(carry)
+        return encoded.decode("ascii"), audio_size
+
     def _calculate_audio_cost(self, model: str, char_count: int) -> float:
         """
         Calculate cost based on character count and model
@@ -190,42 +287,11 @@ class ElevenLabsProvider(BaseProvider):
         cost_per_char = self.MODEL_COSTS_PER_CHAR.get(model, 0.00016)
         return round(cost_per_char * char_count, 6)
 
-    def get_models(self) -> List[str]:
-        return [
-            "eleven_flash_v2_5",        # Fastest, cheapest
-            "eleven_turbo_v2_5",        # High quality, low latency
-            "eleven_multilingual_v2",   # Best quality
-            "eleven_flash_v2",          # Previous gen flash
-            "eleven_turbo_v2",          # Previous gen turbo
-            "eleven_multilingual_v1",   # Legacy multilingual
-            "eleven_monolingual_v1"     # Legacy English
-        ]
+    def get_models(self) -> Tuple[str, ...]:
+        return self.MODELS
 
     def get_metadata(self) -> ProviderMetadata:
-        return ProviderMetadata(
-            display_name="ElevenLabs",
-            description="Premium AI text-to-speech with the most realistic and expressive voices. "
-                        "Supports 32 languages, voice cloning, and 75ms latency for real-time applications.",
-            logo_url="https://elevenlabs.io/favicon.ico",
-            website_url="https://elevenlabs.io",
-            requires_api_key=True,
-            requires_base_url=False
-        )
-
-    def calculate_cost(
-        self,
-        model: str,
-        input_tokens: int,
-        output_tokens: int
-    ) -> float:
-        """
-        Override base calculate_cost since ElevenLabs uses character-based pricing
-
-        For ElevenLabs, input_tokens represents (character_count * 100)
-        This allows us to use the standard token-based cost tracking system
-        """
-        char_count = input_tokens // 100
-        return self._calculate_audio_cost(model, char_count)
+        return self.METADATA
 
 
 # Auto-register this provider
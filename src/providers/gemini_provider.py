@@ -2,15 +2,44 @@
 Google Gemini Provider
 """
 
-from typing import List, Dict, Any, Optional
-import google.generativeai as genai
+from typing import List, Dict, Any, Optional, Tuple
+from collections import OrderedDict
+from operator import itemgetter
 from src.providers.base import BaseProvider, LLMResponse, ProviderConfig, ProviderMetadata
 from src.utils.logger import logger
 
 
+_get_role_content = itemgetter("role", "content")
+
+
 class GeminiProvider(BaseProvider):
     """Google Gemini provider implementation"""
 
+    MODELS: Tuple[str, ...] = (
+        "gemini-1.5-pro",
+        "gemini-1.5-flash",
+        "gemini-1.0-pro",
+    )
+
+    METADATA = ProviderMetadata(
+        display_name="Google Gemini",
+        description="Google's multimodal AI models with long context windows and strong reasoning",
+        logo_url="https://www.gstatic.com/lamda/images/gemini_sparkle_v002_d4735304ff6292a690345.svg",
+        website_url="https://ai.google.dev/",
+        requires_api_key=True,
+        requires_base_url=False
+    )
+
+    # OpenAI-style role -> Gemini role
+    ROLE_MAP = {"user": "user", "assistant": "model"}
+
+    # Max (model, system prompt) pairs whose GenerativeModel is kept
+    MODEL_CACHE_SIZE = 32
+
+    def __init__(self, config: ProviderConfig):
+        super().__init__(config)
+        self._model_cache: "OrderedDict[Tuple[str, Optional[str]], Any]" = OrderedDict()
+
     @property
     def provider_name(self) -> str:
         return "google"
@@ -19,12 +48,35 @@ class GeminiProvider(BaseProvider):
         return bool(self.config.api_key)
 
     def _get_client(self):
-        """Lazy client initialization"""
+        """Lazy client initialization (google-generativeai imported and configured on first use)"""
         if not self._client and self.config.api_key:
+            try:
+                import google.generativeai as genai
+            except ImportError:
+                raise ImportError(
+                    "google-generativeai package not installed. "
+                    "Install with: pip install google-generativeai"
+                )
             genai.configure(api_key=self.config.api_key)
-            self._client = True  # Flag that we've configured
+            self._client = genai  # The configured module acts as the client
         return self._client
 
+    def _get_model(self, model: str, system_prompt: Optional[str]):
+        """Return a cached GenerativeModel for (model, system_prompt), building it on first use"""
+        key = (model, system_prompt or None)
+        gemini_model = self._model_cache.get(key)
+        if gemini_model is None:
+            gemini_model = self._get_client().GenerativeModel(
+                model_name=model,
+                system_instruction=key[1]
+            )
+            self._model_cache[key] = gemini_model
+            while len(self._model_cache) > self.MODEL_CACHE_SIZE:
+                self._model_cache.popitem(last=False)
+        else:
+            self._model_cache.move_to_end(key)
+        return gemini_model
+
     async def call(
         self,
         model: str,
@@ -38,40 +90,25 @@ class GeminiProvider(BaseProvider):
         if not self.is_available():
             raise ValueError("Google API key not configured")
 
-        self._get_client()
+        genai = self._get_client()
 
         try:
-            # Initialize model
-            gemini_model = genai.GenerativeModel(
-                model_name=model,
-                system_instruction=system_prompt if system_prompt else None
+            gemini_model = self._get_model(model, system_prompt)
+
+            # Convert messages to Gemini format: the last user message is the
+            # prompt and user/assistant turns before it become chat history.
+            # System messages are handled via system_instruction
+            last_idx = next(
+                (i for i in range(len(messages) - 1, -1, -1) if messages[i]["role"] == "user"),
+                len(messages) - 1
             )
-
-            # Convert messages to Gemini format
-            # Gemini uses a chat history format
-            chat_history = []
-            user_message = None
-
-            for msg in messages:
-                role = msg["role"]
-                content = msg["content"]
-
-                if role == "system":
-                    # System messages are handled via system_instruction
-                    continue
-                elif role == "user":
-                    user_message = content
-                    # Add to history (all but the last user message)
-                    if len([m for m in messages if m["role"] == "user"]) > 1:
-                        chat_history.append({
-                            "role": "user",
-                            "parts": [content]
-                        })
-                elif role == "assistant":
-                    chat_history.append({
-                        "role": "model",
-                        "parts": [content]
-                    })
+            prompt = messages[last_idx]["content"]
+            role_map = self.ROLE_MAP
+            chat_history = [
+                {"role": role_map[role], "parts": [content]}
+                for role, content in map(_get_role_content, messages[:last_idx])
+                if role in role_map
+            ]
 
             # Configure generation settings
             generation_config = genai.GenerationConfig(
@@ -82,13 +119,13 @@ class GeminiProvider(BaseProvider):
             # Start chat or generate content
             if chat_history:
                 chat = gemini_model.start_chat(history=chat_history)
-                response = chat.send_message(
-                    user_message or messages[-1]["content"],
+                response = await chat.send_message_async(
+                    prompt,
                     generation_config=generation_config
                 )
             else:
-                response = gemini_model.generate_content(
-                    user_message or messages[-1]["content"],
+                response = await gemini_model.generate_content_async(
+                    prompt,
                     generation_config=generation_config
                 )
 
@@ -96,12 +133,10 @@ class GeminiProvider(BaseProvider):
             content = response.text
 
             # Get token counts from response metadata
-            input_tokens = 0
-            output_tokens = 0
-
-            if hasattr(response, 'usage_metadata'):
-                input_tokens = response.usage_metadata.prompt_token_count or 0
-                output_tokens = response.usage_metadata.candidates_token_count or 0
+            usage = getattr(response, 'usage_metadata', None)
+            input_tokens = (usage.prompt_token_count or 0) if usage else 0
+            output_tokens = (usage.candidates_token_count or 0) if usage else 0
+            candidates = response.candidates or ()
 
             # Calculate cost
             cost_usd = self.calculate_cost(model, input_tokens, output_tokens)
@@ -113,7 +148,7 @@ class GeminiProvider(BaseProvider):
                 cost_usd=cost_usd,
                 provider_metadata={
                     "model": model,
-                    "finish_reason": response.candidates[0].finish_reason.name if response.candidates else None
+                    "finish_reason": candidates[0].finish_reason.name if candidates else None
                 }
             )
 
@@ -121,22 +156,11 @@ class GeminiProvider(BaseProvider):
             logger.error(f"Gemini API error: {str(e)}")
             raise
 
-    def get_models(self) -> List[str]:
-        return [
-            "gemini-1.5-pro",
-            "gemini-1.5-flash",
-            "gemini-1.0-pro"
-        ]
+    def get_models(self) -> Tuple[str, ...]:
+        return self.MODELS
 
     def get_metadata(self) -> ProviderMetadata:
-        return ProviderMetadata(
-            display_name="Google Gemini",
-            description="Google's multimodal AI models with long context windows and strong reasoning",
-            logo_url="https://www.gstatic.com/lamda/images/gemini_sparkle_v002_d4735304ff6292a690345.svg",
-            website_url="https://ai.google.dev/",
-            requires_api_key=True,
-            requires_base_url=False
-        )
+        return self.METADATA
 
 
 # Auto-register this provider
@@ -3,8 +3,7 @@ Groq Provider
 Fast inference with OpenAI-compatible API
 """
 
-from typing import List, Dict, Any, Optional
-from openai import OpenAI
+from typing import List, Dict, Any, Optional, Tuple
 from src.providers.base import BaseProvider, LLMResponse, ProviderConfig, ProviderMetadata
 from src.utils.logger import logger
 
@@ -12,6 +11,21 @@ from src.utils.logger import logger
 class GroqProvider(BaseProvider):
     """Groq provider implementation"""
 
+    MODELS: Tuple[str, ...] = (
+        "mixtral-8x7b-32768",
+        "llama2-70b-4096",
+        "gemma-7b-it",
+    )
+
+    METADATA = ProviderMetadata(
+        display_name="Groq",
+        description="Ultra-fast inference with open-source models on custom LPU hardware",
+        logo_url="https://groq.com/wp-content/uploads/2024/03/PrimaryLogo-min.svg",
+        website_url="https://groq.com",
+        requires_api_key=True,
+        requires_base_url=False
+    )
+
     @property
     def provider_name(self) -> str:
         return "groq"
@@ -19,11 +33,18 @@ class GroqProvider(BaseProvider):
     def is_available(self) -> bool:
         return bool(self.config.api_key)
 
-    def _get_client(self) -> OpenAI:
-        """Lazy client initialization"""
+    def _get_client(self):
+        """Lazy client initialization (openai SDK imported on first use)"""
         if not self._client and self.config.api_key:
+            try:
+                from openai import AsyncOpenAI
+            except ImportError:
+                raise ImportError(
+                    "openai package not installed. "
+                    "Install with: pip install openai"
+                )
             # Groq uses OpenAI-compatible API
-            self._client = OpenAI(
+            self._client = AsyncOpenAI(
                 api_key=self.config.api_key,
                 base_url=self.config.base_url or "https://api.groq.com/openai/v1"
             )
@@ -52,7 +73,7 @@ class GroqProvider(BaseProvider):
         groq_messages.extend(messages)
 
         # Call API
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model=model,
             messages=groq_messages,
             max_tokens=max_tokens or 4096,
@@ -79,22 +100,11 @@ class GroqProvider(BaseProvider):
             }
         )
 
-    def get_models(self) -> List[str]:
-        return [
-            "mixtral-8x7b-32768",
-            "llama2-70b-4096",
-            "gemma-7b-it"
-        ]
+    def get_models(self) -> Tuple[str, ...]:
+        return self.MODELS
 
     def get_metadata(self) -> ProviderMetadata:
-        return ProviderMetadata(
-            display_name="Groq",
-            description="Ultra-fast inference with open-source models on custom LPU hardware",
-            logo_url="https://groq.com/wp-content/uploads/2024/03/PrimaryLogo-min.svg",
-            website_url="https://groq.com",
-            requires_api_key=True,
-            requires_base_url=False
-        )
+        return self.METADATA
 
 
 # Auto-register this provider
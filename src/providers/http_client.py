@@ -0,0 +1,35 @@
+"""
+Shared HTTP Client
+One pooled httpx.AsyncClient reused by every provider that talks plain HTTP
+"""
+
+from typing import Optional
+
+import httpx
+
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_async_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide AsyncClient, creating it on first use
+
+    Connections (and TLS sessions) are kept alive and reused across
+    providers. Callers pass absolute URLs and per-request timeouts.
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        limits = httpx.Limits(max_connections=200, max_keepalive_connections=50)
+        _shared_client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(retries=2, http2=True, limits=limits),
+            limits=limits
+        )
+    return _shared_client
+
+
+async def close_shared_async_client() -> None:
+    """Close the shared client (called on shutdown)"""
+    global _shared_client
+    client, _shared_client = _shared_client, None
+    if client is not None:
+        await client.aclose()
@@ -2,16 +2,37 @@
 Mistral AI Provider
 """
 
-from typing import List, Dict, Any, Optional
-from mistralai.client import MistralClient
-from mistralai.models.chat_completion import ChatMessage
+from typing import List, Dict, Any, Optional, Tuple
+from operator import itemgetter
 from src.providers.base import BaseProvider, LLMResponse, ProviderConfig, ProviderMetadata
 from src.utils.logger import logger
 
 
+# Roles accepted by the Mistral chat API
+_VALID_ROLES = frozenset(("system", "user", "assistant"))
+
+_get_role_content = itemgetter("role", "content")
+
+
 class MistralProvider(BaseProvider):
     """Mistral AI provider implementation"""
 
+    MODELS: Tuple[str, ...] = (
+        "mistral-large-latest",
+        "mistral-medium-latest",
+        "mistral-small-latest",
+        "codestral-latest",
+    )
+
+    METADATA = ProviderMetadata(
+        display_name="Mistral AI",
+        description="European AI leader with powerful multilingual models and GDPR compliance",
+        logo_url="https://mistral.ai/images/logo_hubc88c4ece131b91c7cb753f40e9e1cc5_2589_256x0_resize_q97_h2_lanczos_3.webp",
+        website_url="https://mistral.ai/",
+        requires_api_key=True,
+        requires_base_url=False
+    )
+
     @property
     def provider_name(self) -> str:
         return "mistral"
@@ -19,10 +40,17 @@ class MistralProvider(BaseProvider):
     def is_available(self) -> bool:
         return bool(self.config.api_key)
 
-    def _get_client(self) -> MistralClient:
-        """Lazy client initialization"""
+    def _get_client(self):
+        """Lazy client initialization (mistralai SDK imported on first use)"""
         if not self._client and self.config.api_key:
-            self._client = MistralClient(api_key=self.config.api_key)
+            try:
+                from mistralai.async_client import MistralAsyncClient
+            except ImportError:
+                raise ImportError(
+                    "mistralai package not installed. "
+                    "Install with: pip install mistralai"
+                )
+            self._client = MistralAsyncClient(api_key=self.config.api_key)
         return self._client
 
     async def call(
@@ -39,6 +67,7 @@ class MistralProvider(BaseProvider):
             raise ValueError("Mistral API key not configured")
 
         client = self._get_client()
+        from mistralai.models.chat_completion import ChatMessage
 
         try:
             # Convert messages to Mistral format
@@ -50,19 +79,15 @@ class MistralProvider(BaseProvider):
                     ChatMessage(role="system", content=system_prompt)
                 )
 
-            # Add conversation messages
-            for msg in messages:
-                role = msg["role"]
-                content = msg["content"]
-
-                # Mistral supports: system, user, assistant
-                if role in ["system", "user", "assistant"]:
-                    mistral_messages.append(
-                        ChatMessage(role=role, content=content)
-                    )
+            # Add conversation messages (Mistral supports: system, user, assistant)
+            mistral_messages.extend(
+                ChatMessage(role=role, content=content)
+                for role, content in map(_get_role_content, messages)
+                if role in _VALID_ROLES
+            )
 
             # Call API
-            response = client.chat(
+            response = await client.chat(
                 model=model,
                 messages=mistral_messages,
                 max_tokens=max_tokens or 4096,
@@ -95,23 +120,11 @@ class MistralProvider(BaseProvider):
             logger.error(f"Mistral API error: {str(e)}")
             raise
 
-    def get_models(self) -> List[str]:
-        return [
-            "mistral-large-latest",
-            "mistral-medium-latest",
-            "mistral-small-latest",
-            "codestral-latest"
-        ]
+    def get_models(self) -> Tuple[str, ...]:
+        return self.MODELS
 
     def get_metadata(self) -> ProviderMetadata:
-        return ProviderMetadata(
-            display_name="Mistral AI",
-            description="European AI leader with powerful multilingual models and GDPR compliance",
-            logo_url="https://mistral.ai/images/logo_hubc88c4ece131b91c7cb753f40e9e1cc5_2589_256x0_resize_q97_h2_lanczos_3.webp",
-            website_url="https://mistral.ai/",
-            requires_api_key=True,
-            requires_base_url=False
-        )
+        return self.METADATA
 
 
 # Auto-register this provider
@@ -3,15 +3,40 @@ Ollama Provider
 Local LLM inference with OpenAI-compatible API
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import httpx
-from src.providers.base import BaseProvider, LLMResponse, ProviderConfig, ProviderMetadata
+import orjson
+from src.providers.base import BaseProvider, LLMResponse, ProviderConfig, ProviderMetadata, close_client
 from src.utils.logger import logger
 
 
 class OllamaProvider(BaseProvider):
     """Ollama local provider"""
 
+    # Could query Ollama API for available models in the future
+    MODELS: Tuple[str, ...] = (
+        "llama2",
+        "llama2:13b",
+        "llama2:70b",
+        "mistral",
+        "mixtral",
+        "codellama",
+        "neural-chat",
+        "starling-lm",
+    )
+
+    METADATA = ProviderMetadata(
+        display_name="Ollama",
+        description="Run LLMs locally on your own hardware - Free and private",
+        logo_url="https://ollama.ai/public/ollama.png",
+        website_url="https://ollama.ai",
+        requires_api_key=False,  # No API key needed for local inference
+        requires_base_url=True   # Needs base URL configuration
+    )
+
+    # Pooled HTTP clients shared by every instance, keyed by (base_url, timeout)
+    _shared_clients: Dict[Tuple[str, int], httpx.AsyncClient] = {}
+
     @property
     def provider_name(self) -> str:
         return "ollama"
@@ -21,6 +46,28 @@ class OllamaProvider(BaseProvider):
         # Just check if base_url is configured
         return bool(self.config.base_url)
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Lazy client initialization, one keep-alive connection pool per server"""
+        key = (self.config.base_url, self.config.timeout)
+        client = self._shared_clients.get(key)
+        if client is None:
+            client = httpx.AsyncClient(
+                base_url=self.config.base_url,
+                timeout=self.config.timeout,
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+            )
+            self._shared_clients[key] = client
+        return client
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close all shared Ollama HTTP clients"""
+        clients = list(cls._shared_clients.values())
+        cls._shared_clients.clear()
+        for client in clients:
+            await close_client(client)
+
     async def call(
         self,
         model: str,
@@ -41,19 +88,20 @@ class OllamaProvider(BaseProvider):
         ollama_messages.extend(messages)
 
         # Call Ollama API (OpenAI-compatible)
-        async with httpx.AsyncClient(timeout=self.config.timeout) as client:
-            response = await client.post(
-                f"{self.config.base_url}/v1/chat/completions",
-                json={
-                    "model": model,
-                    "messages": ollama_messages,
-                    "max_tokens": max_tokens or 4096,
-                    "temperature": temperature if temperature is not None else 0.7,
-                    **kwargs
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
+        client = self._get_client()
+        response = await client.post(
+            "/v1/chat/completions",
+            content=orjson.dumps({
+                "model": model,
+                "messages": ollama_messages,
+                "max_tokens": max_tokens or 4096,
+                "temperature": temperature if temperature is not None else 0.7,
+                **kwargs
+            }),
+            headers={"Content-Type": "application/json"}
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
         # Parse response (OpenAI format)
         content = data["choices"][0]["message"]["content"]
@@ -71,28 +119,11 @@ class OllamaProvider(BaseProvider):
             provider_metadata={"model": data.get("model", model)}
         )
 
-    def get_models(self) -> List[str]:
-        # Could query Ollama API for available models in the future
-        return [
-            "llama2",
-            "llama2:13b",
-            "llama2:70b",
-            "mistral",
-            "mixtral",
-            "codellama",
-            "neural-chat",
-            "starling-lm"
-        ]
+    def get_models(self) -> Tuple[str, ...]:
+        return self.MODELS
 
     def get_metadata(self) -> ProviderMetadata:
-        return ProviderMetadata(
-            display_name="Ollama",
-            description="Run LLMs locally on your own hardware - Free and private",
-            logo_url="https://ollama.ai/public/ollama.png",
-            website_url="https://ollama.ai",
-            requires_api_key=False,  # No API key needed for local inference
-            requires_base_url=True   # Needs base URL configuration
-        )
+        return self.METADATA
 
 
 # Auto-register this provider
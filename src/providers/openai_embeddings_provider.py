@@ -3,19 +3,38 @@ OpenAI Embeddings Provider
 Industry-standard embeddings for RAG and semantic search
 """
 
-from typing import List, Optional
-from openai import OpenAI
+from typing import List, Optional, Tuple
+import asyncio
+import numpy as np
+import pybase64
 from src.providers.base_embeddings import (
     BaseEmbeddingsProvider,
     EmbeddingsResponse,
     EmbeddingsProviderConfig
 )
+from src.providers.rate_limit import RateLimiter
 from src.utils.logger import logger
 
 
 class OpenAIEmbeddingsProvider(BaseEmbeddingsProvider):
     """OpenAI embeddings provider implementation"""
 
+    MODELS: Tuple[str, ...] = (
+        "text-embedding-3-small",
+        "text-embedding-3-large",
+        "text-embedding-ada-002",
+    )
+
+    # Inputs per embeddings.create request (API limit is 2048)
+    BATCH_SIZE = 512
+
+    # Batch requests in flight at once per provider instance
+    MAX_CONCURRENT_BATCHES = 8
+
+    def __init__(self, config: EmbeddingsProviderConfig):
+        super().__init__(config)
+        self._limiter = RateLimiter(max_concurrency=self.MAX_CONCURRENT_BATCHES)
+
     @property
     def provider_name(self) -> str:
         return "openai_embeddings"
@@ -23,10 +42,17 @@ class OpenAIEmbeddingsProvider(BaseEmbeddingsProvider):
     def is_available(self) -> bool:
         return bool(self.config.api_key)
 
-    def _get_client(self) -> OpenAI:
-        """Lazy client initialization"""
+    def _get_client(self):
+        """Lazy client initialization (openai SDK imported on first use)"""
         if not self._client and self.config.api_key:
-            self._client = OpenAI(api_key=self.config.api_key)
+            try:
+                from openai import AsyncOpenAI
+            except ImportError:
+                raise ImportError(
+                    "openai package not installed. "
+                    "Install with: pip install openai"
+                )
+            self._client = AsyncOpenAI(api_key=self.config.api_key)
         return self._client
 
     async def generate_embeddings(
@@ -45,21 +71,36 @@ class OpenAIEmbeddingsProvider(BaseEmbeddingsProvider):
         client = self._get_client()
         model = model or self.config.default_model or "text-embedding-3-small"
 
-        try:
-            # Call OpenAI Embeddings API
-            response = client.embeddings.create(
-                input=texts,
-                model=model,
-                encoding_format=kwargs.get('encoding_format', 'float'),  # float or base64
-                dimensions=kwargs.get('dimensions')  # Optional: reduce dimensions for smaller vectors
-            )
+        # base64 ships raw float32 (~5.3 bytes/dim vs ~12 for JSON floats); it is
+        # decoded back to floats below, so callers see the same result either way
+        encoding_format = kwargs.get('encoding_format', 'base64')  # float or base64
+        batch_size = kwargs.get('batch_size') or self.BATCH_SIZE
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+
+        async def embed_batch(batch: List[str]):
+            async with self._limiter:
+                return await client.embeddings.create(
+                    input=batch,
+                    model=model,
+                    encoding_format=encoding_format,
+                    dimensions=kwargs.get('dimensions')  # Optional: reduce dimensions for smaller vectors
+                )
 
-            # Extract embeddings
-            embeddings = [item.embedding for item in response.data]
+        try:
+            # Call OpenAI Embeddings API, one request per batch, concurrently
+            responses = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+            response = responses[0]
+
+            # Extract embeddings (gather preserves batch order)
+            items = [item.embedding for r in responses for item in r.data]
+            if items and isinstance(items[0], str):
+                embeddings = self._decode_base64_embeddings(items)
+            else:
+                embeddings = items
             dimensions = len(embeddings[0]) if embeddings else 0
 
-            # Get token count from response
-            total_tokens = response.usage.total_tokens
+            # Get token count from responses
+            total_tokens = sum(r.usage.total_tokens for r in responses)
 
             # Calculate cost
             cost_usd = self.calculate_cost(model, total_tokens)
@@ -80,7 +121,8 @@ class OpenAIEmbeddingsProvider(BaseEmbeddingsProvider):
                 total_tokens=total_tokens,
                 cost_usd=cost_usd,
                 provider_metadata={
-                    "object": response.object
+                    "object": response.object,
+                    "batches": len(batches)
                 }
             )
 
@@ -88,12 +130,14 @@ class OpenAIEmbeddingsProvider(BaseEmbeddingsProvider):
             logger.error(f"OpenAI embeddings error: {str(e)}")
             raise
 
-    def get_models(self) -> List[str]:
-        return [
-            "text-embedding-3-small",
-            "text-embedding-3-large",
-            "text-embedding-ada-002"
-        ]
+    @staticmethod
+    def _decode_base64_embeddings(items: List[str]) -> List[List[float]]:
+        """Decode base64 float32 vectors with one frombuffer over the joined bytes"""
+        raw = b"".join(pybase64.b64decode(item) for item in items)
+        return np.frombuffer(raw, dtype=np.float32).reshape(len(items), -1).tolist()
+
+    def get_models(self) -> Tuple[str, ...]:
+        return self.MODELS
 
 
 # Auto-register this provider
@@ -2,15 +2,43 @@
 OpenAI Provider
 """
 
-from typing import List, Dict, Any, Optional
-from openai import OpenAI
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
+import asyncio
+import orjson
+from openai import AsyncOpenAI
 from src.providers.base import BaseProvider, LLMResponse, ProviderConfig, ProviderMetadata
+from src.providers.http_client import get_shared_async_client
 from src.utils.logger import logger
 
 
 class OpenAIProvider(BaseProvider):
     """OpenAI provider implementation"""
 
+    MODELS: Tuple[str, ...] = (
+        "gpt-4-turbo",
+        "gpt-4",
+        "gpt-3.5-turbo",
+    )
+
+    METADATA = ProviderMetadata(
+        display_name="OpenAI",
+        description="GPT-4 and DALL-E image generation with wide ecosystem support",
+        logo_url="https://openai.com/favicon.ico",
+        website_url="https://openai.com",
+        requires_api_key=True,
+        requires_base_url=False
+    )
+
+    # Retries for 429/5xx/connection errors, using the SDK's jittered exponential backoff
+    MAX_RETRIES = 3
+
+    # Batch API: half-price completions with a separate quota, minutes-to-hours latency
+    BATCH_ENDPOINT = "/v1/chat/completions"
+    BATCH_COMPLETION_WINDOW = "24h"
+    BATCH_POLL_INTERVAL = 30.0
+    BATCH_DISCOUNT = 0.5
+    BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
     @property
     def provider_name(self) -> str:
         return "openai"
@@ -18,10 +46,15 @@ class OpenAIProvider(BaseProvider):
     def is_available(self) -> bool:
         return bool(self.config.api_key)
 
-    def _get_client(self) -> OpenAI:
-        """Lazy client initialization"""
+    def _get_client(self) -> AsyncOpenAI:
+        """Lazy client initialization (on the shared HTTP connection pool)"""
         if not self._client and self.config.api_key:
-            self._client = OpenAI(api_key=self.config.api_key)
+            self._client = AsyncOpenAI(
+                api_key=self.config.api_key,
+                max_retries=self.MAX_RETRIES,
+                timeout=self.config.timeout,
+                http_client=get_shared_async_client()
+            )
         return self._client
 
     async def call(
@@ -33,10 +66,24 @@ class OpenAIProvider(BaseProvider):
         system_prompt: Optional[str] = None,
         **kwargs
     ) -> LLMResponse:
-        """Call OpenAI API"""
+        """
+        Call OpenAI API
+
+        Pass operation="batch" with a `requests` list to submit the requests
+        through the Batch API instead (see batch_call).
+        """
         if not self.is_available():
             raise ValueError("OpenAI API key not configured")
 
+        if kwargs.pop("operation", "chat") == "batch":
+            return await self._batch(
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                system_prompt=system_prompt,
+                **kwargs
+            )
+
         client = self._get_client()
 
         # Prepare messages
@@ -47,7 +94,7 @@ class OpenAIProvider(BaseProvider):
         openai_messages.extend(messages)
 
         # Call API
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model=model,
             messages=openai_messages,
             max_tokens=max_tokens or 4096,
@@ -55,42 +102,265 @@ class OpenAIProvider(BaseProvider):
             **kwargs
         )
 
-        # Extract response
-        content = response.choices[0].message.content or ""
-        input_tokens = response.usage.prompt_tokens
-        output_tokens = response.usage.completion_tokens
-
-        # Calculate cost
-        cost_usd = self.calculate_cost(model, input_tokens, output_tokens)
+        # Extract response (SDK objects are pydantic models, so read each field once)
+        choice = response.choices[0]
+        usage = response.usage
+        input_tokens = usage.prompt_tokens
+        output_tokens = usage.completion_tokens
 
         return LLMResponse(
-            content=content,
+            content=choice.message.content or "",
             input_tokens=input_tokens,
             output_tokens=output_tokens,
-            cost_usd=cost_usd,
+            cost_usd=self.calculate_cost(model, input_tokens, output_tokens),
             provider_metadata={
                 "model": response.model,
-                "finish_reason": response.choices[0].finish_reason
+                "finish_reason": choice.finish_reason
             }
         )
 
-    def get_models(self) -> List[str]:
-        return [
-            "gpt-4-turbo",
-            "gpt-4",
-            "gpt-3.5-turbo"
-        ]
+    async def stream(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat completion, yielding content deltas as they arrive
 
-    def get_metadata(self) -> ProviderMetadata:
-        return ProviderMetadata(
-            display_name="OpenAI",
-            description="GPT-4 and DALL-E image generation with wide ecosystem support",
-            logo_url="https://openai.com/favicon.ico",
-            website_url="https://openai.com",
-            requires_api_key=True,
-            requires_base_url=False
+        Usage comes from the final stream chunk, so tokens and cost are
+        logged at end of stream without a second request.
+        """
+        if not self.is_available():
+            raise ValueError("OpenAI API key not configured")
+
+        client = self._get_client()
+
+        openai_messages = []
+        if system_prompt:
+            openai_messages.append({"role": "system", "content": system_prompt})
+        openai_messages.extend(messages)
+
+        stream = await client.chat.completions.create(
+            model=model,
+            messages=openai_messages,
+            max_tokens=max_tokens or 4096,
+            temperature=temperature if temperature is not None else 0.7,
+            stream=True,
+            extra_body={"stream_options": {"include_usage": True}},
+            **kwargs
+        )
+
+        usage = None
+        async for chunk in stream:
+            if chunk.choices:
+                delta_content = chunk.choices[0].delta.content
+                if delta_content:
+                    yield delta_content
+            usage = getattr(chunk, "usage", None) or usage
+
+        if usage:
+            input_tokens = usage.prompt_tokens
+            output_tokens = usage.completion_tokens
+            logger.info(
+                "openai_stream_complete",
+                model=model,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                cost_usd=self.calculate_cost(model, input_tokens, output_tokens)
+            )
+
+    async def batch_call(
+        self,
+        requests: List[Dict[str, Any]],
+        poll_interval: Optional[float] = None
+    ) -> List[LLMResponse]:
+        """
+        Run chat completions through the OpenAI Batch API
+
+        Each request is a dict with `model` and `messages` plus optional
+        `max_tokens`, `temperature`, `system_prompt` and `custom_id`. The
+        requests are uploaded as a JSONL file, submitted as one batch and
+        polled until the batch finishes.
+
+        Args:
+            requests: Chat completion requests
+            poll_interval: Seconds between status checks (default: 30)
+
+        Returns:
+            One LLMResponse per request, in input order. Requests that failed
+            inside the batch have empty content and an "error" entry in
+            provider_metadata.
+        """
+        if not self.is_available():
+            raise ValueError("OpenAI API key not configured")
+        if not requests:
+            raise ValueError("'requests' must contain at least one request")
+
+        client = self._get_client()
+
+        custom_ids = []
+        lines = []
+        for index, request in enumerate(requests):
+            custom_id = str(request.get("custom_id", index))
+            custom_ids.append(custom_id)
+
+            openai_messages = []
+            if request.get("system_prompt"):
+                openai_messages.append({"role": "system", "content": request["system_prompt"]})
+            openai_messages.extend(request["messages"])
+
+            temperature = request.get("temperature")
+            lines.append(orjson.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": self.BATCH_ENDPOINT,
+                "body": {
+                    "model": request["model"],
+                    "messages": openai_messages,
+                    "max_tokens": request.get("max_tokens") or 4096,
+                    "temperature": temperature if temperature is not None else 0.7
+                }
+            }))
+
+        if len(set(custom_ids)) != len(custom_ids):
+            raise ValueError("Batch request custom_id values must be unique")
+
+        input_file = await client.files.create(
+            file=("batch.jsonl", b"\n".join(lines), "application/jsonl"),
+            purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=self.BATCH_ENDPOINT,
+            completion_window=self.BATCH_COMPLETION_WINDOW
+        )
+        logger.info("openai_batch_submitted", batch_id=batch.id, requests_count=len(requests))
+
+        interval = poll_interval if poll_interval is not None else self.BATCH_POLL_INTERVAL
+        while batch.status not in self.BATCH_TERMINAL_STATUSES:
+            await asyncio.sleep(interval)
+            batch = await client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise Exception(f"OpenAI batch {batch.id} ended with status '{batch.status}'")
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                file_content = await client.files.content(file_id)
+                for line in file_content.content.splitlines():
+                    if line.strip():
+                        record = orjson.loads(line)
+                        results[record["custom_id"]] = record
+
+        responses = []
+        for custom_id, request in zip(custom_ids, requests):
+            responses.append(self._parse_batch_result(batch.id, custom_id, request, results.get(custom_id)))
+
+        logger.info(
+            "openai_batch_complete",
+            batch_id=batch.id,
+            requests_count=len(requests),
+            failed=sum(1 for r in responses if "error" in r.provider_metadata)
+        )
+        return responses
+
+    def _parse_batch_result(
+        self,
+        batch_id: str,
+        custom_id: str,
+        request: Dict[str, Any],
+        record: Optional[Dict[str, Any]]
+    ) -> LLMResponse:
+        """Convert one Batch API output line into an LLMResponse"""
+        metadata: Dict[str, Any] = {"batch_id": batch_id, "custom_id": custom_id}
+
+        response = (record or {}).get("response") or {}
+        if not record or record.get("error") or response.get("status_code") != 200:
+            metadata["error"] = (
+                (record or {}).get("error")
+                or response.get("body", {}).get("error")
+                or "missing from batch output"
+            )
+            return LLMResponse(content="", input_tokens=0, output_tokens=0, cost_usd=0.0, provider_metadata=metadata)
+
+        body = response["body"]
+        choice = body["choices"][0]
+        input_tokens = body["usage"]["prompt_tokens"]
+        output_tokens = body["usage"]["completion_tokens"]
+        metadata["model"] = body.get("model", request["model"])
+        metadata["finish_reason"] = choice.get("finish_reason")
+
+        return LLMResponse(
+            content=choice["message"].get("content") or "",
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cost_usd=self.calculate_cost(request["model"], input_tokens, output_tokens) * self.BATCH_DISCOUNT,
+            provider_metadata=metadata
         )
 
+    async def _batch(
+        self,
+        model: str,
+        requests: Optional[List[Dict[str, Any]]] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        system_prompt: Optional[str] = None,
+        poll_interval: Optional[float] = None,
+        **kwargs
+    ) -> LLMResponse:
+        """
+        call() entry point for operation="batch"
+
+        Requests inherit the call's model and sampling parameters unless they
+        set their own. Results are aggregated into a single LLMResponse.
+        """
+        if not requests:
+            raise ValueError("'requests' parameter required for batch operation")
+
+        defaults = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "system_prompt": system_prompt
+        }
+        responses = await self.batch_call(
+            [{**defaults, **request} for request in requests],
+            poll_interval=poll_interval
+        )
+
+        results = []
+        errors = []
+        for index, response in enumerate(responses):
+            error = response.provider_metadata.get("error")
+            if error:
+                results.append(None)
+                errors.append({"index": index, "error": error})
+            else:
+                results.append(response.content)
+
+        return LLMResponse(
+            content={"results": results, "errors": errors},
+            input_tokens=sum(r.input_tokens for r in responses),
+            output_tokens=sum(r.output_tokens for r in responses),
+            cost_usd=sum(r.cost_usd for r in responses),
+            provider_metadata={
+                "batch_id": responses[0].provider_metadata["batch_id"],
+                "requests_count": len(requests),
+                "failed_count": len(errors)
+            }
+        )
+
+    def get_models(self) -> Tuple[str, ...]:
+        return self.MODELS
+
+    def get_metadata(self) -> ProviderMetadata:
+        return self.METADATA
+
 
 # Auto-register this provider
 def register():
@@ -3,10 +3,17 @@ Perspective Provider - Google's Toxicity & Content Moderation API
 Fast, accurate ML-based content moderation with ~100ms response time
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple, Union
+import asyncio
 import time
+import httpx
+import orjson
 
 from src.providers.base import BaseProvider, LLMResponse, ProviderConfig, ProviderMetadata
+from src.providers.cache import LLMCache, SingleFlight
+from src.providers.http_client import get_shared_async_client
+from src.providers.rate_limit import RateLimiter
+from src.providers.retry import retry_async
 from src.utils.logger import logger
 
 
@@ -38,9 +45,27 @@ class PerspectiveProvider(BaseProvider):
 
     Operations:
     - analyze: Analyze text for toxicity attributes
-    - batch_analyze: Analyze multiple texts (future enhancement)
+    - batch_analyze: Analyze multiple texts concurrently
     """
 
+    MODELS: Tuple[str, ...] = (
+        "toxicity",
+        "moderation-full",
+        "identity-attack",
+        "profanity",
+    )
+
+    METADATA = ProviderMetadata(
+        display_name="Perspective API",
+        description="Google's ML-powered content moderation API. Analyzes text for "
+                    "toxicity, hate speech, profanity, and threats with ~100ms response time. "
+                    "Free tier with 1 QPS quota. Supports 18 languages and per-sentence analysis.",
+        logo_url="https://www.gstatic.com/images/branding/product/1x/google_cloud_48dp.png",
+        website_url="https://perspectiveapi.com",
+        requires_api_key=True,
+        requires_base_url=False
+    )
+
     # Production-ready attributes
     PRODUCTION_ATTRIBUTES = [
         "TOXICITY",
@@ -69,8 +94,26 @@ class PerspectiveProvider(BaseProvider):
         "id", "it", "ja", "ko", "pl", "pt", "ru", "es", "sv"
     ]
 
+    # Membership sets and the default requestedAttributes block, built once
+    _VALID_ATTRIBUTES = frozenset(PRODUCTION_ATTRIBUTES + EXPERIMENTAL_ATTRIBUTES)
+    _VALID_LANGUAGES = frozenset(SUPPORTED_LANGUAGES)
+    _DEFAULT_REQUESTED = {"TOXICITY": {}}
+
     # API endpoint
-    DISCOVER_SERVICE_URL = "https://commentanalyzer.googleapis.com/$discovery/rest?version=v1alpha1"
+    ANALYZE_URL = "https://commentanalyzer.googleapis.com/v1alpha1/comments:analyze"
+
+    # Perspective enforces a per-second quota, so the bucket releases one request at a time
+    RATE_LIMIT_BURST = 1
+
+    def __init__(self, config: ProviderConfig):
+        super().__init__(config)
+        self.cache = LLMCache(namespace="perspective")
+        self._inflight = SingleFlight()
+        self._limiter = RateLimiter(
+            config.max_concurrency,
+            config.requests_per_minute,
+            burst=self.RATE_LIMIT_BURST
+        )
 
     @property
     def provider_name(self) -> str:
@@ -80,47 +123,17 @@ class PerspectiveProvider(BaseProvider):
         """Check if Perspective API key is configured"""
         return self.config.api_key is not None and len(self.config.api_key) > 0
 
-    def get_models(self) -> List[str]:
+    def get_models(self) -> Tuple[str, ...]:
         """Return available analysis types as 'models'"""
-        return ["toxicity", "moderation-full", "identity-attack", "profanity"]
+        return self.MODELS
 
     def get_metadata(self) -> ProviderMetadata:
         """Provider information for UI display"""
-        return ProviderMetadata(
-            display_name="Perspective API",
-            description="Google's ML-powered content moderation API. Analyzes text for "
-                        "toxicity, hate speech, profanity, and threats with ~100ms response time. "
-                        "Free tier with 1 QPS quota. Supports 18 languages and per-sentence analysis.",
-            logo_url="https://www.gstatic.com/images/branding/product/1x/google_cloud_48dp.png",
-            website_url="https://perspectiveapi.com",
-            requires_api_key=True,
-            requires_base_url=False
-        )
+        return self.METADATA
 
-    def _get_client(self):
-        """Lazy-load Google API Discovery client"""
-        if self._client is None:
-            try:
-                from googleapiclient import discovery
-
-                self._client = discovery.build(
-                    "commentanalyzer",
-                    "v1alpha1",
-                    developerKey=self.config.api_key,
-                    discoveryServiceUrl=self.DISCOVER_SERVICE_URL,
-                    static_discovery=False
-                )
-                logger.info("Initialized Perspective API client")
-            except ImportError:
-                raise ImportError(
-                    "google-api-python-client package not installed. "
-                    "Install with: pip install google-api-python-client google-auth"
-                )
-            except Exception as e:
-                logger.error(f"Failed to initialize Perspective client: {str(e)}")
-                raise
-
-        return self._client
+    def _get_client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client shared with the other HTTP providers"""
+        return get_shared_async_client()
 
     async def call(
         self,
@@ -136,7 +149,7 @@ class PerspectiveProvider(BaseProvider):
 
         Operations:
         - analyze: Analyze text for toxicity (text kwarg required)
-        - batch_analyze: Analyze multiple texts (future enhancement)
+        - batch_analyze: Analyze multiple texts (texts kwarg required)
         """
         if not self.is_available():
             raise ValueError(
@@ -149,10 +162,7 @@ class PerspectiveProvider(BaseProvider):
         if operation == "analyze":
             return await self._analyze(**kwargs)
         elif operation == "batch_analyze":
-            raise NotImplementedError(
-                "Batch analysis not yet implemented. "
-                "Use operation='analyze' for single text analysis."
-            )
+            return await self._batch_analyze(**kwargs)
         else:
             raise ValueError(
                 f"Unknown operation '{operation}'. "
@@ -198,41 +208,59 @@ class PerspectiveProvider(BaseProvider):
         """
         if not text:
             raise ValueError("'text' parameter required for analysis")
+        text_length = len(text)
 
         # Default to TOXICITY if no attributes specified
         if not requested_attributes:
             requested_attributes = ["TOXICITY"]
+            requested_block = self._DEFAULT_REQUESTED
+        else:
+            # Validate attributes (one warning, formatted only if emitted)
+            unknown_attributes = set(requested_attributes) - self._VALID_ATTRIBUTES
+            if unknown_attributes:
+                logger.warning(
+                    "perspective_unknown_attributes",
+                    attributes=sorted(unknown_attributes),
+                    supported=self.PRODUCTION_ATTRIBUTES + self.EXPERIMENTAL_ATTRIBUTES
+                )
+            requested_block = {attr: {} for attr in requested_attributes}
 
-        # Validate attributes
-        all_attributes = self.PRODUCTION_ATTRIBUTES + self.EXPERIMENTAL_ATTRIBUTES
-        for attr in requested_attributes:
-            if attr not in all_attributes:
+        # Validate language codes
+        if languages:
+            unknown_languages = set(languages) - self._VALID_LANGUAGES
+            if unknown_languages:
                 logger.warning(
-                    f"Unknown attribute '{attr}'. "
-                    f"Supported: {', '.join(all_attributes)}"
+                    "perspective_unsupported_languages",
+                    languages=sorted(unknown_languages),
+                    supported=self.SUPPORTED_LANGUAGES
                 )
 
+        # Scores depend only on the text and analysis options, so repeats are served from cache
+        cache_key = self.cache.make_key({
+            "text": text,
+            "attributes": sorted(requested_attributes),
+            "languages": languages,
+            "span_annotations": span_annotations,
+            "community_id": community_id,
+            # A do_not_store request must never be served by one that let Google store the text
+            "do_not_store": do_not_store
+        })
+        cached = await self.cache.get_response(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             client = self._get_client()
 
             # Build analyze request
             analyze_request = {
                 "comment": {"text": text},
-                "requestedAttributes": {
-                    attr: {} for attr in requested_attributes
-                },
+                "requestedAttributes": requested_block,
                 "doNotStore": do_not_store
             }
 
             # Add optional parameters
             if languages:
-                # Validate language codes
-                for lang in languages:
-                    if lang not in self.SUPPORTED_LANGUAGES:
-                        logger.warning(
-                            f"Language '{lang}' may not be fully supported. "
-                            f"Supported: {', '.join(self.SUPPORTED_LANGUAGES)}"
-                        )
                 analyze_request["languages"] = languages
 
             if span_annotations:
@@ -249,35 +277,57 @@ class PerspectiveProvider(BaseProvider):
 
             logger.info(
                 f"Starting Perspective analysis: "
-                f"text_len={len(text)}, attributes={requested_attributes}, "
+                f"text_len={text_length}, attributes={requested_attributes}, "
                 f"languages={languages}, do_not_store={do_not_store}"
             )
 
-            # Call Perspective API
-            response = client.comments().analyze(body=analyze_request).execute()
+            async def request_analysis() -> Dict[str, Any]:
+                wait_started = time.perf_counter()
+                async with self._limiter:
+                    logger.debug(
+                        "perspective_limiter_wait",
+                        wait_time_ms=round((time.perf_counter() - wait_started) * 1000, 1)
+                    )
+                    http_response = await client.post(
+                        self.ANALYZE_URL,
+                        params={"key": self.config.api_key},
+                        timeout=self.config.timeout,
+                        content=orjson.dumps(analyze_request),
+                        headers={"Content-Type": "application/json"}
+                    )
+                http_response.raise_for_status()
+                return orjson.loads(http_response.content)
+
+            # Call Perspective API (identical concurrent requests share one call,
+            # paced to the QPS quota; 429/5xx and connection errors are retried with backoff)
+            response = await self._inflight.do(cache_key, lambda: retry_async(request_analysis))
 
             # Extract attribute scores
             attribute_scores = {}
+            raw_scores = response.get("attributeScores", {})
             for attr in requested_attributes:
-                if attr in response.get("attributeScores", {}):
-                    score_data = response["attributeScores"][attr]
-                    attribute_scores[attr] = {
-                        "summary_score": score_data["summaryScore"]["value"],
-                        "summary_type": score_data["summaryScore"].get("type", "PROBABILITY"),
-                        "span_scores": []
-                    }
-
-                    # Add per-sentence scores if requested
-                    if span_annotations and "spanScores" in score_data:
-                        attribute_scores[attr]["span_scores"] = [
-                            {
-                                "begin": span["begin"],
-                                "end": span["end"],
-                                "score": span["score"]["value"]
-                            }
-                            for span in score_data["spanScores"]
+                score_data = raw_scores.get(attr)
+                if score_data is None:
+                    continue
+
+                summary = score_data["summaryScore"]
+                entry = {
+                    "summary_score": summary["value"],
+                    "summary_type": summary.get("type", "PROBABILITY"),
+                    "span_scores": []
+                }
+
+                # Add per-sentence scores if requested
+                if span_annotations:
+                    spans = score_data.get("spanScores")
+                    if spans:
+                        entry["span_scores"] = [
+                            {"begin": span["begin"], "end": span["end"], "score": span["score"]["value"]}
+                            for span in spans
                         ]
 
+                attribute_scores[attr] = entry
+
             # Detect languages if provided
             detected_languages = response.get("languages", [])
 
@@ -285,7 +335,7 @@ class PerspectiveProvider(BaseProvider):
             response_content = {
                 "attribute_scores": attribute_scores,
                 "detected_languages": detected_languages,
-                "text_length": len(text),
+                "text_length": text_length,
                 "attributes_analyzed": requested_attributes
             }
 
@@ -299,35 +349,103 @@ class PerspectiveProvider(BaseProvider):
             # Calculate cost (free, but track usage)
             cost_usd = 0.0  # Perspective API is free
 
-            # Pseudo-tokens: text_length / 10 (for billing compatibility)
-            pseudo_tokens = int(len(text) / 10) or 1
+            # Pseudo-tokens: len(text) / 10 (for billing compatibility)
+            pseudo_tokens = max(1, text_length // 10)
 
             logger.info(
                 "perspective_analyze_success",
-                text_length=len(text),
+                text_length=text_length,
                 attributes_analyzed=len(requested_attributes),
                 toxicity_score=response_content.get("toxicity_score"),
                 cost_usd=cost_usd
             )
 
-            return LLMResponse(
+            result = LLMResponse(
                 content=response_content,
                 input_tokens=pseudo_tokens,
                 output_tokens=0,  # Analysis doesn't generate tokens
                 cost_usd=cost_usd,
                 provider_metadata={
-                    "text_length": len(text),
+                    "text_length": text_length,
                     "attributes_analyzed": requested_attributes,
                     "detected_languages": detected_languages,
                     "span_annotations": span_annotations,
                     "do_not_store": do_not_store
                 }
             )
+            await self.cache.set_response(cache_key, result)
+            return result
 
         except Exception as e:
             logger.error(f"Perspective analysis failed: {str(e)}")
             raise Exception(f"Perspective analysis failed: {str(e)}")
 
+    async def _batch_analyze(
+        self,
+        texts: Optional[List[str]] = None,
+        max_concurrency: int = 10,
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Analyze several texts concurrently
+
+        Args:
+            texts: Texts to analyze (REQUIRED)
+            max_concurrency: Max analyze requests in flight (default: 10)
+            **kwargs: Options passed to each _analyze call
+
+        Returns:
+            LLMResponse whose content holds per-text results (None where the
+            analysis failed) and the errors, both indexed by input position
+        """
+        if not texts:
+            raise ValueError("'texts' parameter required for batch analysis")
+
+        kwargs.pop("text", None)
+        kwargs.pop("operation", None)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def analyze_one(text: str) -> Union[LLMResponse, Exception]:
+            # Failures are returned, not raised, so one bad text doesn't cancel the group
+            async with semaphore:
+                try:
+                    return await self._analyze(text=text, **kwargs)
+                except Exception as e:
+                    return e
+
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(analyze_one(text)) for text in texts]
+        outcomes = [task.result() for task in tasks]
+
+        results: List[Optional[Dict[str, Any]]] = []
+        errors: List[Dict[str, Any]] = []
+        input_tokens = 0
+        for index, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                results.append(None)
+                errors.append({"index": index, "error": str(outcome)})
+            else:
+                results.append(outcome.content)
+                input_tokens += outcome.input_tokens
+
+        logger.info(
+            "perspective_batch_analyze_complete",
+            texts_count=len(texts),
+            failed=len(errors)
+        )
+
+        return LLMResponse(
+            content={"results": results, "errors": errors},
+            input_tokens=input_tokens,
+            output_tokens=0,
+            cost_usd=0.0,  # Perspective API is free
+            provider_metadata={
+                "texts_count": len(texts),
+                "failed_count": len(errors),
+                "max_concurrency": max_concurrency
+            }
+        )
+
     def _get_severity_level(self, score: float) -> str:
         """
         Convert probability score to severity level
@@ -3,10 +3,9 @@ Pika Labs Video Generation Provider (via Fal.ai)
 Supports Pika v2.2 models for image-to-video generation
 """
 
-from typing import List, Dict, Any, Optional
-import os
+from typing import List, Dict, Any, Optional, Tuple
 import fal_client
-from src.providers.base import BaseProvider, LLMResponse, ProviderConfig, ProviderMetadata
+from src.providers.base import BaseProvider, LLMResponse, ProviderMetadata
 from src.utils.logger import logger
 
 
@@ -22,11 +21,27 @@ class PikaProvider(BaseProvider):
     Fal.ai's hosted Pika models which provide official access.
     """
 
-    # Fixed costs per video (Pika v2.2 pricing via Fal.ai)
-    MODEL_COSTS = {
-        "pika-2.2-720p": 0.20,   # $0.20 per 5-second video
-        "pika-2.2-1080p": 0.45   # $0.45 per 5-second video
+    MODELS: Tuple[str, ...] = (
+        "pika-2.2-720p",
+        "pika-2.2-1080p",
+    )
+
+    METADATA = ProviderMetadata(
+        display_name="Pika Labs (via Fal.ai)",
+        description="Advanced AI video generation with Pika v2.2. High-quality image-to-video with 720p and 1080p support. Powered by Fal.ai.",
+        logo_url="https://pika.art/favicon.ico",
+        website_url="https://pika.art",
+        requires_api_key=True,
+        requires_base_url=False
+    )
+
+    # Fixed (pseudo_tokens, cost) per video (Pika v2.2 pricing via Fal.ai)
+    # Pseudo-tokens are cost-based for billing: $0.01 = 100 tokens
+    MODEL_BILLING = {
+        "pika-2.2-720p": (2000, 0.20),   # $0.20 per 5-second video
+        "pika-2.2-1080p": (4500, 0.45)   # $0.45 per 5-second video
     }
+    DEFAULT_BILLING = MODEL_BILLING["pika-2.2-720p"]
 
     # Map our model names to Fal.ai endpoints
     FAL_ENDPOINTS = {
@@ -48,11 +63,11 @@ class PikaProvider(BaseProvider):
         """Check if Fal.ai API key is configured"""
         return bool(self.config.api_key)
 
-    def _configure_fal_client(self):
-        """Configure fal_client with API key"""
-        if self.config.api_key:
-            # Set FAL_KEY environment variable for fal_client
-            os.environ['FAL_KEY'] = self.config.api_key
+    def _get_client(self) -> fal_client.AsyncClient:
+        """Lazy client initialization, keyed per instance instead of via FAL_KEY"""
+        if not self._client and self.config.api_key:
+            self._client = fal_client.AsyncClient(key=self.config.api_key)
+        return self._client
 
     async def call(
         self,
@@ -76,9 +91,6 @@ class PikaProvider(BaseProvider):
         if not self.is_available():
             raise ValueError("Fal.ai API key not configured (FAL_KEY required for Pika)")
 
-        # Configure fal_client
-        self._configure_fal_client()
-
         # Extract video-specific parameters
         prompt = kwargs.get("prompt", "")
         prompt_image = kwargs.get("prompt_image")
@@ -105,12 +117,15 @@ class PikaProvider(BaseProvider):
         if not fal_endpoint:
             raise ValueError(f"Unknown Pika model: {model}")
 
+        # Fixed cost per video and its pseudo-token equivalent for billing
+        pseudo_tokens, cost_usd = self.MODEL_BILLING.get(model, self.DEFAULT_BILLING)
+
         try:
             logger.info(f"Starting Pika video generation: model={model}, resolution={resolution}")
 
             # Submit request to Fal.ai
-            # Using submit method for async task with status updates
-            handler = fal_client.submit(
+            # Using the async client so polling never blocks the event loop
+            handler = await self._get_client().submit(
                 fal_endpoint,
                 arguments={
                     "image_url": prompt_image,
@@ -122,22 +137,14 @@ class PikaProvider(BaseProvider):
             # Poll for completion with status updates
             logger.info(f"Pika task submitted, polling for completion...")
 
-            # Wait for result (this handles polling internally)
-            result = handler.get()
+            # Wait for result (this handles polling internally, awaiting between checks)
+            result = await handler.get()
 
             # Extract video URL from result
             video_url = result.get("video", {}).get("url")
             if not video_url:
                 raise ValueError("No video URL in Pika response")
 
-            # Calculate cost (fixed per video based on model)
-            cost_usd = self.MODEL_COSTS.get(model, 0.20)
-
-            # For billing tracking: use pseudo-tokens
-            # Map cost to tokens: $0.01 = 100 tokens
-            # So $0.20 = 2000 tokens, $0.45 = 4500 tokens
-            pseudo_tokens = int(cost_usd * 10000)
-
             logger.info(
                 f"Pika video generated successfully: resolution={resolution}, "
                 f"cost=${cost_usd}, url={video_url[:50]}..."
@@ -160,21 +167,11 @@ class PikaProvider(BaseProvider):
             logger.error(f"Pika video generation failed: {str(e)}")
             raise Exception(f"Pika generation error: {str(e)}")
 
-    def get_models(self) -> List[str]:
-        return [
-            "pika-2.2-720p",
-            "pika-2.2-1080p"
-        ]
+    def get_models(self) -> Tuple[str, ...]:
+        return self.MODELS
 
     def get_metadata(self) -> ProviderMetadata:
-        return ProviderMetadata(
-            display_name="Pika Labs (via Fal.ai)",
-            description="Advanced AI video generation with Pika v2.2. High-quality image-to-video with 720p and 1080p support. Powered by Fal.ai.",
-            logo_url="https://pika.art/favicon.ico",
-            website_url="https://pika.art",
-            requires_api_key=True,
-            requires_base_url=False
-        )
+        return self.METADATA
 
     def calculate_cost(
         self,
@@ -185,11 +182,13 @@ class PikaProvider(BaseProvider):
         """
         Override base calculate_cost since Pika uses fixed per-video pricing
 
-        For Pika, input_tokens represents the cost in pseudo-tokens:
-        - 2000 tokens = $0.20 (720p)
-        - 4500 tokens = $0.45 (1080p)
+        Known models return their fixed per-video cost from MODEL_BILLING.
+        Otherwise input_tokens is treated as cost in pseudo-tokens
+        ($0.01 = 100 tokens).
         """
-        # Convert tokens back to cost
+        billing = self.MODEL_BILLING.get(model)
+        if billing is not None:
+            return billing[1]
         return input_tokens / 10000
 
 
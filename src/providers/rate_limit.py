@@ -0,0 +1,69 @@
+"""
+Provider Rate Limiting
+Concurrency caps and token-bucket request pacing for provider API calls
+"""
+
+from typing import Optional
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Async token bucket
+
+    Allows `rate` requests per `period` seconds on average, with bursts of
+    up to `capacity` requests.
+    """
+
+    def __init__(self, rate: float, period: float = 60.0, capacity: Optional[float] = None):
+        self.rate = rate
+        self.period = period
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                refill = (now - self._updated_at) * self.rate / self.period
+                self._tokens = min(self.capacity, self._tokens + refill)
+                self._updated_at = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+
+
+class RateLimiter:
+    """
+    Async context manager combining a concurrency cap and a token bucket
+
+    Either limit may be None to disable it. `burst` caps how many requests
+    the bucket releases back-to-back (default: a full minute's worth).
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        requests_per_minute: Optional[float] = None,
+        burst: Optional[float] = None
+    ):
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self._bucket = TokenBucket(requests_per_minute, capacity=burst) if requests_per_minute else None
+
+    async def __aenter__(self) -> "RateLimiter":
+        if self._bucket:
+            await self._bucket.acquire()
+        if self._semaphore:
+            await self._semaphore.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self._semaphore:
+            self._semaphore.release()
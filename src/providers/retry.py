@@ -0,0 +1,49 @@
+"""
+Provider Retries
+Exponential backoff with full jitter for transient provider API failures
+"""
+
+from typing import Awaitable, Callable, TypeVar
+import asyncio
+import random
+
+import httpx
+
+from src.utils.logger import logger
+
+T = TypeVar("T")
+
+# HTTP statuses worth retrying: rate limited or server-side failure
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def is_retryable_http_error(exc: BaseException) -> bool:
+    """True for connection/timeout errors and 429/5xx responses"""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(exc, httpx.TransportError)
+
+
+async def retry_async(
+    fn: Callable[[], Awaitable[T]],
+    *,
+    attempts: int = 3,
+    min_wait: float = 1.0,
+    max_wait: float = 20.0,
+    retry_if: Callable[[BaseException], bool] = is_retryable_http_error
+) -> T:
+    """
+    Await fn(), retrying failures accepted by retry_if
+
+    Waits a random time up to min_wait * 2**n (capped at max_wait) before
+    retry n, so concurrent callers hitting the same limit spread out.
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            return await fn()
+        except Exception as e:
+            if attempt == attempts or not retry_if(e):
+                raise
+            delay = random.uniform(0, min(max_wait, min_wait * 2 ** (attempt - 1)))
+            logger.warning(f"Retrying after {type(e).__name__} (attempt {attempt}/{attempts}, wait {delay:.1f}s)")
+            await asyncio.sleep(delay)
@@ -3,14 +3,150 @@ RunwayML Video Generation Provider
 Supports Gen-3 and Gen-4 models for text-to-video and image-to-video generation
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import asyncio
+import dataclasses
+import heapq
+import itertools
+import random
+import secrets
 import time
 from runwayml import AsyncRunwayML
+from src.config.settings import settings
 from src.providers.base import BaseProvider, LLMResponse, ProviderConfig, ProviderMetadata
+from src.providers.cache import LLMCache, SingleFlight
+from src.providers.http_client import get_shared_async_client
 from src.utils.logger import logger
 
 
+# Credit costs per second of video
+_MODEL_CREDITS = {
+    "gen4_turbo": 5,
+    "gen4_aleph": 15,
+    "gen3_turbo": 5,
+    "gen3_alpha": 10
+}
+
+_CREDIT_COST_USD = 0.01  # $0.01 per credit
+
+
+class _PollScheduler:
+    """
+    One background loop polling every in-flight Runway task of a client
+
+    Tasks wait in a heap ordered by their next check time. Each tick
+    retrieves all due tasks concurrently, resolves the futures of finished
+    ones and re-queues the rest with jittered exponential backoff, so N
+    concurrent generations share one poll loop instead of N.
+    """
+
+    def __init__(
+        self,
+        client: AsyncRunwayML,
+        initial_interval: float,
+        max_interval: float,
+        backoff: float
+    ):
+        self.client = client
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self._heap: List[Tuple[float, int, str]] = []
+        self._order = itertools.count()
+        # task_id -> [future, next backoff interval]
+        self._watches: Dict[str, List[Any]] = {}
+        self._wakeup = asyncio.Event()
+        self._runner: Optional[asyncio.Task] = None
+
+    def watch(self, task_id: str, delay: float = 0.0) -> asyncio.Future:
+        """Start polling a task after `delay` seconds; the future resolves to the finished task"""
+        future = asyncio.get_running_loop().create_future()
+        self._watches[task_id] = [future, self.initial_interval]
+        self._schedule(task_id, delay)
+
+        if self._runner is None or self._runner.done():
+            self._runner = asyncio.create_task(self._run())
+        self._wakeup.set()
+        return future
+
+    async def close(self) -> None:
+        """Stop the poll loop and fail any tasks still being watched"""
+        if self._runner is not None:
+            self._runner.cancel()
+            self._runner = None
+        for future, _ in self._watches.values():
+            if not future.done():
+                future.set_exception(Exception("Runway poller closed"))
+        self._watches.clear()
+        self._heap.clear()
+
+    def _schedule(self, task_id: str, delay: float) -> None:
+        heapq.heappush(self._heap, (time.monotonic() + delay, next(self._order), task_id))
+
+    async def _run(self) -> None:
+        while self._watches:
+            now = time.monotonic()
+            due = []
+            while self._heap and self._heap[0][0] <= now:
+                task_id = heapq.heappop(self._heap)[2]
+                watch = self._watches.get(task_id)
+                if watch is None:
+                    continue
+                if watch[0].done():
+                    # Waiter timed out or was cancelled
+                    del self._watches[task_id]
+                    continue
+                due.append(task_id)
+
+            if not due:
+                if not self._heap:
+                    break
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self._heap[0][0] - now)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            results = await asyncio.gather(
+                *(self.client.tasks.retrieve(task_id) for task_id in due),
+                return_exceptions=True
+            )
+            for task_id, result in zip(due, results):
+                self._handle(task_id, result)
+
+    def _handle(self, task_id: str, result: Any) -> None:
+        watch = self._watches.get(task_id)
+        if watch is None:
+            return
+        future, interval = watch
+        if future.done():
+            del self._watches[task_id]
+            return
+
+        if isinstance(result, BaseException):
+            error = result
+        else:
+            logger.debug(f"Task {task_id} status: {result.status}")
+            if result.status in ("PENDING", "RUNNING"):
+                # Still processing, back off and check again
+                self._schedule(task_id, interval + random.uniform(0, interval * 0.1))
+                watch[1] = min(interval * self.backoff, self.max_interval)
+                return
+            if result.status == "SUCCEEDED":
+                del self._watches[task_id]
+                future.set_result(result)
+                return
+            if result.status == "FAILED":
+                error_msg = getattr(result, "failure_reason", "Unknown error")
+                error = Exception(f"Task {task_id} failed: {error_msg}")
+            else:
+                error = Exception(f"Unknown task status: {result.status}")
+
+        del self._watches[task_id]
+        future.set_exception(error)
+
+
 class RunwayProvider(BaseProvider):
     """
     RunwayML provider for video generation
@@ -21,15 +157,42 @@ class RunwayProvider(BaseProvider):
     - gen3_turbo: Fast, good quality (5 credits/sec)
     """
 
-    # Credit costs per second of video
-    MODEL_CREDITS = {
-        "gen4_turbo": 5,
-        "gen4_aleph": 15,
-        "gen3_turbo": 5,
-        "gen3_alpha": 10
-    }
+    MODELS: Tuple[str, ...] = (
+        "gen4_turbo",
+        "gen4_aleph",
+        "gen3_turbo",
+        "gen3_alpha",
+    )
+
+    METADATA = ProviderMetadata(
+        display_name="RunwayML",
+        description="Advanced AI video generation with Gen-3 and Gen-4 models. Text-to-video and image-to-video capabilities.",
+        logo_url="https://runwayml.com/favicon.ico",
+        website_url="https://runwayml.com",
+        requires_api_key=True,
+        requires_base_url=False
+    )
+
+    MODEL_CREDITS = _MODEL_CREDITS
+    CREDIT_COST_USD = _CREDIT_COST_USD
 
-    CREDIT_COST_USD = 0.01  # $0.01 per credit
+    # USD per second of video, resolved once from credits
+    COST_USD_PER_SECOND = {model: credits * _CREDIT_COST_USD for model, credits in _MODEL_CREDITS.items()}
+    DEFAULT_COST_USD_PER_SECOND = COST_USD_PER_SECOND["gen4_turbo"]
+
+    # Status polling: jittered exponential backoff between checks of each task
+    POLL_INITIAL_INTERVAL = 0.5
+    POLL_MAX_INTERVAL = 10.0
+    POLL_BACKOFF = 1.5
+
+    # One poll scheduler per API key, shared by all concurrent generations
+    _schedulers: Dict[str, _PollScheduler] = {}
+
+    # Completion callbacks (used when PUBLIC_WEBHOOK_BASE_URL is set)
+    WEBHOOK_PATH = "/api/v2/video/generate/webhook"
+
+    # Repeat submissions of the same job within this window reuse its result
+    IDEMPOTENCY_TTL = 3600  # seconds
 
     # Aspect ratio mapping
     ASPECT_RATIOS = {
@@ -39,6 +202,14 @@ class RunwayProvider(BaseProvider):
         "4:3": "1024:768"
     }
 
+    def __init__(self, config: ProviderConfig):
+        super().__init__(config)
+        # Webhook nonce -> future resolved by Runway's completion callback
+        self._pending_webhooks: Dict[str, asyncio.Future] = {}
+        # Completed jobs by idempotency key; in-flight jobs are coalesced
+        self.cache = LLMCache(namespace="runway", default_ttl=self.IDEMPOTENCY_TTL)
+        self._inflight = SingleFlight()
+
     @property
     def provider_name(self) -> str:
         return "runway"
@@ -47,11 +218,104 @@ class RunwayProvider(BaseProvider):
         return bool(self.config.api_key)
 
     def _get_client(self) -> AsyncRunwayML:
-        """Lazy client initialization"""
+        """Lazy client initialization (on the shared HTTP/2 connection pool)"""
         if not self._client and self.config.api_key:
-            self._client = AsyncRunwayML(api_key=self.config.api_key)
+            self._client = AsyncRunwayML(
+                api_key=self.config.api_key,
+                timeout=self.config.timeout,
+                http_client=get_shared_async_client()
+            )
         return self._client
 
+    def _get_scheduler(self, client: AsyncRunwayML) -> _PollScheduler:
+        """Poll scheduler for this API key, started with the first task it watches"""
+        scheduler = self._schedulers.get(self.config.api_key)
+        if scheduler is None:
+            scheduler = _PollScheduler(
+                client,
+                initial_interval=self.POLL_INITIAL_INTERVAL,
+                max_interval=self.POLL_MAX_INTERVAL,
+                backoff=self.POLL_BACKOFF
+            )
+            self._schedulers[self.config.api_key] = scheduler
+        return scheduler
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Stop the poll schedulers (the shared HTTP pool is closed by the registry)"""
+        schedulers = list(cls._schedulers.values())
+        cls._schedulers.clear()
+        for scheduler in schedulers:
+            await scheduler.close()
+
+    async def _op_generate(
+        self,
+        client: AsyncRunwayML,
+        model: str,
+        kwargs: Dict[str, Any],
+        create_kwargs: Dict[str, Any]
+    ) -> Any:
+        """Start an image-to-video task"""
+        prompt_image = kwargs.get("prompt_image")
+        if not prompt_image:
+            # Text-to-video generation
+            # Note: RunwayML Gen-4 primarily does image-to-video
+            # For pure text-to-video, we'd need to generate an image first
+            # or use a different approach
+            raise ValueError(
+                "RunwayML Gen-4 requires an image for video generation. "
+                "Use 'prompt_image' parameter or generate an image first."
+            )
+
+        logger.info(f"Starting image-to-video generation with model {model}")
+        return await client.image_to_video.create(
+            model=model,
+            prompt_image=prompt_image,
+            prompt_text=kwargs.get("prompt", ""),
+            **create_kwargs
+        )
+
+    async def _op_extend(
+        self,
+        client: AsyncRunwayML,
+        model: str,
+        kwargs: Dict[str, Any],
+        create_kwargs: Dict[str, Any]
+    ) -> Any:
+        """Extend an existing video"""
+        if not kwargs.get("video_url"):
+            raise ValueError("video_url required for extend operation")
+
+        logger.info(f"Starting video extension with model {model}")
+        # RunwayML doesn't have a direct extend endpoint in the SDK yet
+        # This would need to use the video-to-video endpoint with specific parameters
+        raise NotImplementedError(
+            "Video extension will be implemented when RunwayML SDK adds extend support"
+        )
+
+    async def _op_remix(
+        self,
+        client: AsyncRunwayML,
+        model: str,
+        kwargs: Dict[str, Any],
+        create_kwargs: Dict[str, Any]
+    ) -> Any:
+        """Video-to-video transformation of an existing video"""
+        if not kwargs.get("video_url"):
+            raise ValueError("video_url required for remix operation")
+
+        logger.info(f"Starting video remix with model {model}")
+        raise NotImplementedError(
+            "Video remix will be implemented when RunwayML SDK adds video-to-video support"
+        )
+
+    # operation -> handler(self, client, model, kwargs, create_kwargs) returning the created task
+    _OP_TABLE = {
+        "generate": _op_generate,
+        "extend": _op_extend,
+        "remix": _op_remix,
+    }
+
     async def call(
         self,
         model: str,
@@ -72,6 +336,11 @@ class RunwayProvider(BaseProvider):
         - ratio: Aspect ratio (default: "1280:720" = 16:9)
         - operation: "generate", "extend", or "remix" (default: "generate")
         - video_url: Required for extend/remix operations
+        - client_id: Calling API client; duplicate detection is scoped to it
+        - idempotency_key: Optional client key identifying the job; defaults to a
+          hash of the generation parameters. A repeat submission by the same
+          client within IDEMPOTENCY_TTL returns the original job's video at
+          no cost.
         """
         if not self.is_available():
             raise ValueError("RunwayML API key not configured")
@@ -79,112 +348,183 @@ class RunwayProvider(BaseProvider):
         client = self._get_client()
 
         # Extract video-specific parameters
-        prompt = kwargs.get("prompt", "")
-        prompt_image = kwargs.get("prompt_image")
         duration = kwargs.get("duration", 5)
         ratio = kwargs.get("ratio", "1280:720")
         operation = kwargs.get("operation", "generate")
-        video_url = kwargs.get("video_url")
+
+        handler = self._OP_TABLE.get(operation)
+        if handler is None:
+            raise ValueError(f"Unknown operation: {operation}")
 
         # Validate duration (RunwayML supports 5 or 10 seconds)
         if duration not in [5, 10]:
             logger.warning(f"Duration {duration} not standard. Rounding to nearest (5 or 10)")
             duration = 5 if duration <= 7 else 10
 
-        try:
-            # Determine operation type and call appropriate endpoint
-            if operation == "generate":
-                if prompt_image:
-                    # Image-to-video generation
-                    logger.info(f"Starting image-to-video generation with model {model}")
-                    task = await client.image_to_video.create(
-                        model=model,
-                        prompt_image=prompt_image,
-                        prompt_text=prompt,
-                        duration=duration,
-                        ratio=ratio
-                    )
-                else:
-                    # Text-to-video generation
-                    # Note: RunwayML Gen-4 primarily does image-to-video
-                    # For pure text-to-video, we'd need to generate an image first
-                    # or use a different approach
-                    raise ValueError(
-                        "RunwayML Gen-4 requires an image for video generation. "
-                        "Use 'prompt_image' parameter or generate an image first."
-                    )
-
-            elif operation == "extend":
-                if not video_url:
-                    raise ValueError("video_url required for extend operation")
-
-                logger.info(f"Starting video extension with model {model}")
-                # RunwayML doesn't have a direct extend endpoint in the SDK yet
-                # This would need to use the video-to-video endpoint with specific parameters
-                raise NotImplementedError(
-                    "Video extension will be implemented when RunwayML SDK adds extend support"
+        # Identical submissions (client retries, double clicks) share one job.
+        # Scoped per client: another client's identical request is its own
+        # (billed) job, never someone else's video for free.
+        if kwargs.get("idempotency_key"):
+            idempotency_params = {
+                "client_id": kwargs.get("client_id"),
+                "idempotency_key": kwargs["idempotency_key"]
+            }
+        else:
+            idempotency_params = {
+                "client_id": kwargs.get("client_id"),
+                "model": model,
+                "prompt": kwargs.get("prompt", ""),
+                "prompt_image": kwargs.get("prompt_image"),
+                "video_url": kwargs.get("video_url"),
+                "duration": duration,
+                "ratio": ratio,
+                "operation": operation
+            }
+        idempotency_key = self.cache.make_key(idempotency_params)
+        cached = await self.cache.get_response(idempotency_key)
+        if cached is not None:
+            logger.info(f"Returning existing RunwayML job for duplicate submission with model {model}")
+            return cached
+
+        submitted = False
+
+        async def submit() -> LLMResponse:
+            nonlocal submitted
+            submitted = True
+
+            # Ask Runway to call back on completion when we have a public URL
+            webhook_nonce = None
+            create_kwargs: Dict[str, Any] = {"duration": duration, "ratio": ratio}
+            if settings.PUBLIC_WEBHOOK_BASE_URL:
+                webhook_nonce = secrets.token_urlsafe(16)
+                self._pending_webhooks[webhook_nonce] = asyncio.get_running_loop().create_future()
+                create_kwargs["extra_body"] = {
+                    "callbackUrl": f"{settings.PUBLIC_WEBHOOK_BASE_URL.rstrip('/')}{self.WEBHOOK_PATH}/{webhook_nonce}"
+                }
+
+            try:
+                task = await handler(self, client, model, kwargs, create_kwargs)
+
+                # Wait for the completion callback, or poll
+                completed_task = await self._wait_for_task(client, task.id, webhook_nonce, duration)
+
+                # Extract video URL from completed task
+                video_url = self._extract_video_url(completed_task)
+
+                # Calculate cost based on duration and model
+                cost_usd = self._calculate_video_cost(model, duration)
+
+                # For video generation, "tokens" don't apply in the same way
+                # We'll use duration as a proxy (1 second = 100 "tokens" for tracking)
+                pseudo_tokens = duration * 100
+
+                response = LLMResponse(
+                    content=video_url,
+                    input_tokens=pseudo_tokens,  # Duration-based proxy
+                    output_tokens=0,
+                    cost_usd=cost_usd,
+                    provider_metadata={
+                        "model": model,
+                        "task_id": task.id,
+                        "duration": duration,
+                        "ratio": ratio,
+                        "operation": operation
+                    }
                 )
+                await self.cache.set_response(idempotency_key, response)
+                return response
+
+            except Exception as e:
+                logger.error(f"RunwayML API error: {str(e)}")
+                raise
+
+            finally:
+                if webhook_nonce:
+                    self._pending_webhooks.pop(webhook_nonce, None)
+
+        response = await self._inflight.do(idempotency_key, submit)
+        if not submitted:
+            # Coalesced onto a concurrent identical submission; only that one is billed
+            response = dataclasses.replace(
+                response,
+                cost_usd=0.0,
+                provider_metadata={**(response.provider_metadata or {}), "cache_hit": True}
+            )
+        return response
 
-            elif operation == "remix":
-                if not video_url:
-                    raise ValueError("video_url required for remix operation")
+    def resolve_webhook(self, nonce: str) -> bool:
+        """
+        Signal a generation from Runway's completion callback
 
-                logger.info(f"Starting video remix with model {model}")
-                # Video-to-video transformation
-                raise NotImplementedError(
-                    "Video remix will be implemented when RunwayML SDK adds video-to-video support"
-                )
+        Returns:
+            True if the nonce belonged to a generation waiting on this instance
+        """
+        future = self._pending_webhooks.get(nonce)
+        if future is None:
+            return False
+        if not future.done():
+            future.set_result(None)
+        return True
+
+    async def _wait_for_task(
+        self,
+        client: AsyncRunwayML,
+        task_id: str,
+        webhook_nonce: Optional[str],
+        expected_duration: float
+    ) -> Any:
+        """
+        Wait for a task via its completion callback or polling, whichever is first
 
-            else:
-                raise ValueError(f"Unknown operation: {operation}")
-
-            # Poll for task completion
-            logger.info(f"Polling task {task.id} for completion...")
-            completed_task = await self._poll_task_completion(client, task.id)
-
-            # Extract video URL from completed task
-            video_url = self._extract_video_url(completed_task)
-
-            # Calculate cost based on duration and model
-            cost_usd = self._calculate_video_cost(model, duration)
-
-            # For video generation, "tokens" don't apply in the same way
-            # We'll use duration as a proxy (1 second = 100 "tokens" for tracking)
-            pseudo_tokens = duration * 100
-
-            return LLMResponse(
-                content=video_url,
-                input_tokens=pseudo_tokens,  # Duration-based proxy
-                output_tokens=0,
-                cost_usd=cost_usd,
-                provider_metadata={
-                    "model": model,
-                    "task_id": task.id,
-                    "duration": duration,
-                    "ratio": ratio,
-                    "operation": operation
-                }
-            )
+        The backoff poller always runs, so a callback delivered to another
+        worker (or never delivered) costs nothing extra. The callback only
+        signals that the task finished; the task itself is re-fetched from
+        the API, so a forged callback can't inject a result.
+        """
+        poll = asyncio.ensure_future(
+            self._poll_task_completion(client, task_id, expected_duration=expected_duration)
+        )
+        webhook = self._pending_webhooks.get(webhook_nonce) if webhook_nonce else None
+        if webhook is None:
+            return await poll
 
-        except Exception as e:
-            logger.error(f"RunwayML API error: {str(e)}")
-            raise
+        try:
+            await asyncio.wait((poll, webhook), return_when=asyncio.FIRST_COMPLETED)
+            if poll.done():
+                return poll.result()
+
+            task = await client.tasks.retrieve(task_id)
+            if task.status == "SUCCEEDED":
+                logger.info(f"Task {task_id} completed successfully")
+                return task
+            if task.status == "FAILED":
+                error_msg = getattr(task, "failure_reason", "Unknown error")
+                raise Exception(f"Task {task_id} failed: {error_msg}")
+
+            # Callback arrived before the task settled; keep polling
+            return await poll
+        finally:
+            poll.cancel()
 
     async def _poll_task_completion(
         self,
         client: AsyncRunwayML,
         task_id: str,
         max_wait_seconds: int = 300,
-        poll_interval: float = 2.0
+        expected_duration: Optional[float] = None
     ) -> Any:
         """
-        Poll RunwayML task until completion
+        Wait for a RunwayML task to complete
+
+        The task is handed to the shared poll scheduler, which checks it with
+        jittered exponential backoff alongside every other in-flight task.
 
         Args:
             client: RunwayML client
             task_id: Task ID to poll
             max_wait_seconds: Maximum time to wait (default: 5 minutes)
-            poll_interval: Seconds between polls (default: 2 seconds)
+            expected_duration: Requested video length in seconds; rendering
+                takes at least this long, so the first poll waits for 80% of it
 
         Returns:
             Completed task object
@@ -193,36 +533,18 @@ class RunwayProvider(BaseProvider):
             TimeoutError: If task doesn't complete in time
             Exception: If task fails
         """
-        start_time = time.time()
-
-        while True:
-            elapsed = time.time() - start_time
-
-            if elapsed > max_wait_seconds:
-                raise TimeoutError(
-                    f"Task {task_id} did not complete within {max_wait_seconds} seconds"
-                )
-
-            # Get task status
-            task = await client.tasks.retrieve(task_id)
-
-            logger.debug(f"Task {task_id} status: {task.status}")
-
-            if task.status == "SUCCEEDED":
-                logger.info(f"Task {task_id} completed successfully")
-                return task
-
-            elif task.status == "FAILED":
-                error_msg = getattr(task, "failure_reason", "Unknown error")
-                raise Exception(f"Task {task_id} failed: {error_msg}")
+        first_poll_delay = min(expected_duration * 0.8, max_wait_seconds) if expected_duration else 0.0
+        completion = self._get_scheduler(client).watch(task_id, delay=first_poll_delay)
 
-            elif task.status in ["PENDING", "RUNNING"]:
-                # Still processing, wait and retry
-                await asyncio.sleep(poll_interval)
-                continue
+        try:
+            task = await asyncio.wait_for(completion, max_wait_seconds)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Task {task_id} did not complete within {max_wait_seconds} seconds"
+            )
 
-            else:
-                raise Exception(f"Unknown task status: {task.status}")
+        logger.info(f"Task {task_id} completed successfully")
+        return task
 
     def _extract_video_url(self, task: Any) -> str:
         """
@@ -234,13 +556,12 @@ class RunwayProvider(BaseProvider):
         Returns:
             Video URL
         """
-        # RunwayML returns output URLs in task.output
-        if hasattr(task, "output") and task.output:
-            # Output is typically a list of URLs
-            if isinstance(task.output, list) and len(task.output) > 0:
-                return task.output[0]
-            elif isinstance(task.output, str):
-                return task.output
+        # RunwayML returns output URLs in task.output, typically as a list
+        output = getattr(task, "output", None)
+        if isinstance(output, list) and output:
+            return output[0]
+        if isinstance(output, str) and output:
+            return output
 
         raise ValueError("Could not extract video URL from task output")
 
@@ -255,28 +576,14 @@ class RunwayProvider(BaseProvider):
         Returns:
             Cost in USD
         """
-        credits_per_second = self.MODEL_CREDITS.get(model, 5)  # Default to gen4_turbo rate
-        total_credits = credits_per_second * duration
-        cost_usd = total_credits * self.CREDIT_COST_USD
-        return round(cost_usd, 4)
-
-    def get_models(self) -> List[str]:
-        return [
-            "gen4_turbo",
-            "gen4_aleph",
-            "gen3_turbo",
-            "gen3_alpha"
-        ]
+        # Unknown models default to the gen4_turbo rate
+        return round(self.COST_USD_PER_SECOND.get(model, self.DEFAULT_COST_USD_PER_SECOND) * duration, 4)
+
+    def get_models(self) -> Tuple[str, ...]:
+        return self.MODELS
 
     def get_metadata(self) -> ProviderMetadata:
-        return ProviderMetadata(
-            display_name="RunwayML",
-            description="Advanced AI video generation with Gen-3 and Gen-4 models. Text-to-video and image-to-video capabilities.",
-            logo_url="https://runwayml.com/favicon.ico",
-            website_url="https://runwayml.com",
-            requires_api_key=True,
-            requires_base_url=False
-        )
+        return self.METADATA
 
     def calculate_cost(
         self,
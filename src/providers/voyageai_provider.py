@@ -3,13 +3,82 @@ VoyageAI Provider - Embeddings and Reranking
 Premium semantic search and retrieval provider
 """
 
-from typing import Dict, Any, List, Optional, Union
-import os
+from typing import Dict, Any, List, Optional, Union, Tuple, Callable, Awaitable, Set
+import asyncio
+import functools
+import numpy as np
 
+from src.config.settings import settings
 from src.providers.base import BaseProvider, LLMResponse, ProviderConfig, ProviderMetadata
+from src.providers.cache import LLMCache, embeddings_backend
+from src.providers.rate_limit import RateLimiter
 from src.utils.logger import logger
 
 
+EmbedFn = Callable[[List[str]], Awaitable[Tuple[List[List[float]], int]]]
+
+
+class _EmbedBatcher:
+    """
+    Coalesce concurrent single-text embed requests into one API call
+
+    Texts queue up for at most `window` seconds (or until `max_batch` are
+    waiting) and are embedded together. VoyageAI bills per token, so cost is
+    unchanged; each caller gets its own vector and a share of the batch's
+    tokens proportional to its text length.
+    """
+
+    def __init__(self, embed_fn: EmbedFn, max_batch: int, window: float):
+        self._embed_fn = embed_fn
+        self.max_batch = max_batch
+        self.window = window
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: Set[asyncio.Task] = set()
+
+    async def embed(self, text: str) -> Tuple[List[float], int]:
+        """Embed one text as part of the next batch; returns (embedding, tokens)"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _run(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        texts = [text for text, _ in batch]
+        try:
+            embeddings, total_tokens = await self._embed_fn(texts)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # Apportion tokens by text length; the last caller takes the rounding remainder
+        total_chars = sum(map(len, texts)) or 1
+        remaining = total_tokens
+        for i, ((text, future), embedding) in enumerate(zip(batch, embeddings)):
+            tokens = remaining if i == len(batch) - 1 else total_tokens * len(text) // total_chars
+            remaining -= tokens
+            if not future.done():
+                future.set_result((embedding, tokens))
+
+
 class VoyageAIProvider(BaseProvider):
     """
     VoyageAI embeddings and reranking provider
@@ -25,6 +94,15 @@ class VoyageAIProvider(BaseProvider):
     - rerank: Score documents by relevance to query
     """
 
+    METADATA = ProviderMetadata(
+        display_name="Voyage AI",
+        description="Premium embeddings and reranking for semantic search and RAG",
+        logo_url="https://www.voyageai.com/logo.png",
+        website_url="https://www.voyageai.com",
+        requires_api_key=True,
+        requires_base_url=False
+    )
+
     # Embedding models
     EMBEDDING_MODELS = [
         "voyage-3.5",           # Best cost/performance ($0.06/1M tokens)
@@ -41,6 +119,49 @@ class VoyageAIProvider(BaseProvider):
         "rerank-2.5-lite",      # Faster/cheaper ($0.02/1M tokens)
     ]
 
+    MODELS: Tuple[str, ...] = tuple(EMBEDDING_MODELS + RERANK_MODELS)
+
+    # USD per token (list prices are per 1M tokens)
+    EMBEDDING_COST_PER_TOKEN = {
+        model: price / 1_000_000
+        for model, price in {
+            "voyage-3.5": 0.06,
+            "voyage-3.5-lite": 0.02,
+            "voyage-3-large": 0.18,
+            "voyage-code-3": 0.18,
+            "voyage-finance-2": 0.12,
+            "voyage-law-2": 0.12,
+        }.items()
+    }
+    RERANK_COST_PER_TOKEN = {
+        model: price / 1_000_000
+        for model, price in {
+            "rerank-2.5": 0.05,
+            "rerank-2.5-lite": 0.02,
+        }.items()
+    }
+
+    # In-process callers can take embeddings as an [n, d] array instead of lists
+    EMBED_OUTPUT_FORMATS = ("list", "numpy")
+    EMBED_PRECISIONS = {"fp32": np.float32, "fp16": np.float16}
+    EMBED_QUANTIZATIONS = ("int8",)
+
+    # Single-text embeds are micro-batched: up to 64 texts or 5 ms per API call
+    EMBED_BATCH_MAX = 64
+    EMBED_BATCH_WINDOW = 0.005
+
+    def __init__(self, config: ProviderConfig):
+        super().__init__(config)
+        self._limiter = RateLimiter(config.max_concurrency, config.requests_per_minute)
+        # Embeddings are cached per text, so re-embedded chunks skip the API
+        self.cache = LLMCache(
+            namespace="voyageai",
+            backend=embeddings_backend(),
+            default_ttl=settings.EMBED_CACHE_TTL
+        )
+        # (model, input_type, output_dimension, truncation) -> batcher
+        self._embed_batchers: Dict[Tuple[str, Optional[str], Optional[int], Optional[bool]], _EmbedBatcher] = {}
+
     @property
     def provider_name(self) -> str:
         return "voyageai"
@@ -49,32 +170,21 @@ class VoyageAIProvider(BaseProvider):
         """Check if VoyageAI API key is configured"""
         return self.config.api_key is not None and len(self.config.api_key) > 0
 
-    def get_models(self) -> List[str]:
+    def get_models(self) -> Tuple[str, ...]:
         """Return all supported models (embeddings + reranking)"""
-        return self.EMBEDDING_MODELS + self.RERANK_MODELS
+        return self.MODELS
 
     def get_metadata(self) -> ProviderMetadata:
         """Provider information for UI display"""
-        return ProviderMetadata(
-            display_name="Voyage AI",
-            description="Premium embeddings and reranking for semantic search and RAG",
-            logo_url="https://www.voyageai.com/logo.png",
-            website_url="https://www.voyageai.com",
-            requires_api_key=True,
-            requires_base_url=False
-        )
+        return self.METADATA
 
     def _get_client(self):
-        """Lazy-load VoyageAI client"""
+        """Lazy-load the async VoyageAI client"""
         if self._client is None:
             try:
                 import voyageai
 
-                # Set API key in environment (required by voyageai SDK)
-                if self.config.api_key:
-                    os.environ['VOYAGE_API_KEY'] = self.config.api_key
-
-                self._client = voyageai.Client(api_key=self.config.api_key)
+                self._client = voyageai.AsyncClient(api_key=self.config.api_key)
                 logger.info(f"Initialized VoyageAI client")
             except ImportError:
                 raise ImportError(
@@ -128,6 +238,9 @@ class VoyageAIProvider(BaseProvider):
         input_type: Optional[str] = None,
         output_dimension: Optional[int] = None,
         truncation: Optional[bool] = True,
+        output_format: str = "list",
+        precision: str = "fp32",
+        quantize: Optional[str] = None,
         **kwargs
     ) -> LLMResponse:
         """
@@ -139,6 +252,12 @@ class VoyageAIProvider(BaseProvider):
             input_type: "document", "query", or None (optimizes embeddings)
             output_dimension: 256/512/1024/2048 (Matryoshka embeddings)
             truncation: Truncate over-length inputs (default: True)
+            output_format: "list" (JSON-ready, default) or "numpy" for an
+                [n, d] ndarray (VoyageAI vectors are already unit-length)
+            precision: "fp32" (default) or "fp16", for numpy output
+            quantize: "int8" to return {"q": int8 [n, d], "scale": fp16 [n]}
+                with per-row scales; approximate similarities with
+                (q_a @ q_b.T) * np.outer(scale_a, scale_b)
 
         Returns:
             LLMResponse with embeddings in content field
@@ -146,6 +265,24 @@ class VoyageAIProvider(BaseProvider):
         if not texts:
             raise ValueError("'texts' parameter required for embed operation")
 
+        if output_format not in self.EMBED_OUTPUT_FORMATS:
+            raise ValueError(
+                f"Invalid output_format '{output_format}'. "
+                f"Supported: {', '.join(self.EMBED_OUTPUT_FORMATS)}"
+            )
+
+        if quantize is not None and quantize not in self.EMBED_QUANTIZATIONS:
+            raise ValueError(
+                f"Invalid quantize '{quantize}'. "
+                f"Supported: {', '.join(self.EMBED_QUANTIZATIONS)}"
+            )
+
+        if precision not in self.EMBED_PRECISIONS:
+            raise ValueError(
+                f"Invalid precision '{precision}'. "
+                f"Supported: {', '.join(self.EMBED_PRECISIONS)}"
+            )
+
         if model not in self.EMBEDDING_MODELS:
             raise ValueError(
                 f"Invalid embedding model '{model}'. "
@@ -157,34 +294,63 @@ class VoyageAIProvider(BaseProvider):
             texts = [texts]
 
         try:
-            client = self._get_client()
-
-            # Build embed parameters
-            embed_params = {
-                "texts": texts,
-                "model": model,
-                "truncation": truncation
-            }
-
-            # Add optional parameters
-            if input_type:
-                embed_params["input_type"] = input_type
-
-            if output_dimension:
-                embed_params["output_dimension"] = output_dimension
-
-            # Call VoyageAI API (synchronous)
-            result = client.embed(**embed_params)
-
-            # Extract embeddings
-            embeddings = result.embeddings if hasattr(result, 'embeddings') else result
-
-            # Calculate token count (from usage if available, else estimate)
-            if hasattr(result, 'usage') and hasattr(result.usage, 'total_tokens'):
-                total_tokens = result.usage.total_tokens
-            else:
-                # Estimate: ~1 token per 4 characters
-                total_tokens = sum(len(text) for text in texts) // 4
+            embeddings: List[Optional[List[float]]] = [None] * len(texts)
+
+            # Serve repeated texts from the cache
+            cache_keys = None
+            if settings.EMBED_CACHE_ENABLED:
+                cache_keys = [
+                    self.cache.make_key({
+                        "model": model,
+                        "input_type": input_type,
+                        "output_dimension": output_dimension,
+                        "truncation": truncation,
+                        "text": text
+                    })
+                    for text in texts
+                ]
+                cached = await asyncio.gather(*(self.cache.get(key) for key in cache_keys))
+                for i, entry in enumerate(cached):
+                    if entry is not None:
+                        embeddings[i] = entry["embedding"]
+
+            # Embed only the misses (cached vectors cost nothing)
+            miss_indices = [i for i, embedding in enumerate(embeddings) if embedding is None]
+            cache_hits = len(texts) - len(miss_indices)
+            total_tokens = 0
+            if miss_indices:
+                miss_texts = [texts[i] for i in miss_indices]
+                if len(miss_texts) == 1:
+                    # Concurrent single-text requests share one API call
+                    embedding, total_tokens = await self._get_embed_batcher(
+                        model, input_type, output_dimension, truncation
+                    ).embed(miss_texts[0])
+                    fresh = [embedding]
+                else:
+                    fresh, total_tokens = await self._embed_texts(
+                        miss_texts, model, input_type, output_dimension, truncation
+                    )
+
+                for i, embedding in zip(miss_indices, fresh):
+                    embeddings[i] = embedding
+
+                if cache_keys is not None:
+                    await asyncio.gather(*(
+                        self.cache.set(cache_keys[i], {"embedding": embedding})
+                        for i, embedding in zip(miss_indices, fresh)
+                    ))
+
+            num_embeddings = len(embeddings)
+            dimensions = len(embeddings[0]) if num_embeddings else 0
+
+            if quantize == "int8":
+                q, scale = self._quantize_int8(np.asarray(embeddings, dtype=np.float32))
+                if output_format == "numpy":
+                    embeddings = {"q": q, "scale": scale}
+                else:
+                    embeddings = {"q": q.tolist(), "scale": scale.tolist()}
+            elif output_format == "numpy":
+                embeddings = np.asarray(embeddings, dtype=self.EMBED_PRECISIONS[precision])
 
             # Calculate cost
             cost_usd = self._calculate_embedding_cost(model, total_tokens)
@@ -193,21 +359,25 @@ class VoyageAIProvider(BaseProvider):
                 "voyageai_embed_success",
                 model=model,
                 num_texts=len(texts),
-                dimensions=len(embeddings[0]) if embeddings else 0,
+                cache_hits=cache_hits,
+                dimensions=dimensions,
                 tokens=total_tokens,
                 cost_usd=cost_usd
             )
 
             return LLMResponse(
-                content=embeddings,  # List of float arrays
+                content=embeddings,  # List of float arrays (see output_format/quantize)
                 input_tokens=total_tokens,
                 output_tokens=0,  # Embeddings don't generate tokens
                 cost_usd=cost_usd,
                 provider_metadata={
-                    "dimensions": len(embeddings[0]) if embeddings else 0,
-                    "num_embeddings": len(embeddings),
+                    "dimensions": dimensions,
+                    "num_embeddings": num_embeddings,
                     "input_type": input_type,
-                    "truncation": truncation
+                    "truncation": truncation,
+                    "output_format": output_format,
+                    "quantization": "int8-per-row" if quantize else None,
+                    "cache_hits": cache_hits
                 }
             )
 
@@ -215,6 +385,80 @@ class VoyageAIProvider(BaseProvider):
             logger.error(f"VoyageAI embed failed: {str(e)}", model=model)
             raise Exception(f"VoyageAI embedding failed: {str(e)}")
 
+    @staticmethod
+    def _quantize_int8(embeddings: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Symmetric per-row int8 quantization; returns (int8 vectors, fp16 row scales)"""
+        scale = np.max(np.abs(embeddings), axis=1, keepdims=True) / 127.0
+        scale[scale == 0] = 1.0  # All-zero rows quantize to zeros
+        q = np.round(embeddings / scale).astype(np.int8)
+        return q, scale.astype(np.float16).reshape(-1)
+
+    def _get_embed_batcher(
+        self,
+        model: str,
+        input_type: Optional[str],
+        output_dimension: Optional[int],
+        truncation: Optional[bool]
+    ) -> _EmbedBatcher:
+        """Batcher for single-text embeds sharing the same request options"""
+        key = (model, input_type, output_dimension, truncation)
+        batcher = self._embed_batchers.get(key)
+        if batcher is None:
+            batcher = _EmbedBatcher(
+                functools.partial(
+                    self._embed_texts,
+                    model=model,
+                    input_type=input_type,
+                    output_dimension=output_dimension,
+                    truncation=truncation
+                ),
+                max_batch=self.EMBED_BATCH_MAX,
+                window=self.EMBED_BATCH_WINDOW
+            )
+            self._embed_batchers[key] = batcher
+        return batcher
+
+    async def _embed_texts(
+        self,
+        texts: List[str],
+        model: str,
+        input_type: Optional[str],
+        output_dimension: Optional[int],
+        truncation: Optional[bool]
+    ) -> Tuple[List[List[float]], int]:
+        """Make one embed API call; returns (embeddings, total tokens)"""
+        client = self._get_client()
+
+        # Build embed parameters
+        embed_params = {
+            "texts": texts,
+            "model": model,
+            "truncation": truncation
+        }
+
+        # Add optional parameters
+        if input_type:
+            embed_params["input_type"] = input_type
+
+        if output_dimension:
+            embed_params["output_dimension"] = output_dimension
+
+        # Call VoyageAI API (bounded by concurrency/rate limits)
+        async with self._limiter:
+            result = await client.embed(**embed_params)
+
+        # Extract embeddings
+        embeddings = result.embeddings if hasattr(result, 'embeddings') else result
+
+        # Calculate token count (from usage if available, else estimate)
+        if hasattr(result, 'usage') and hasattr(result.usage, 'total_tokens'):
+            total_tokens = result.usage.total_tokens
+        else:
+            # Estimate: ~1 token per 4 characters
+            total_tokens = sum(map(len, texts)) // 4
+
+        return embeddings, total_tokens
+
     async def _rerank(
         self,
         model: str,
@@ -248,6 +492,20 @@ class VoyageAIProvider(BaseProvider):
                 f"Supported: {', '.join(self.RERANK_MODELS)}"
             )
 
+        # Reranking is deterministic for the same query, documents and top_k
+        cache_key = None
+        if settings.EMBED_CACHE_ENABLED:
+            cache_key = self.cache.make_key({
+                "operation": "rerank",
+                "model": model,
+                "query": query,
+                "documents": documents,
+                "top_k": top_k
+            })
+            cached = await self.cache.get_response(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             client = self._get_client()
 
@@ -261,18 +519,20 @@ class VoyageAIProvider(BaseProvider):
             if top_k is not None:
                 rerank_params["top_k"] = top_k
 
-            # Call VoyageAI API (synchronous)
-            result = client.rerank(**rerank_params)
+            # Call VoyageAI API (bounded by concurrency/rate limits)
+            async with self._limiter:
+                result = await client.rerank(**rerank_params)
 
             # Extract ranked results
-            if hasattr(result, 'results'):
+            items = getattr(result, "results", None)
+            if items is not None:
                 ranked_results = [
                     {
                         "index": item.index,
                         "text": item.document,
                         "score": item.relevance_score
                     }
-                    for item in result.results
+                    for item in items
                 ]
             else:
                 # Fallback structure
@@ -283,7 +543,7 @@ class VoyageAIProvider(BaseProvider):
                 total_tokens = result.usage.total_tokens
             else:
                 # Estimate: query + all documents
-                total_tokens = (len(query) + sum(len(doc) for doc in documents)) // 4
+                total_tokens = (len(query) + sum(map(len, documents))) // 4
 
             # Calculate cost
             cost_usd = self._calculate_rerank_cost(model, total_tokens)
@@ -297,7 +557,7 @@ class VoyageAIProvider(BaseProvider):
                 cost_usd=cost_usd
             )
 
-            return LLMResponse(
+            response = LLMResponse(
                 content=ranked_results,  # List of ranked documents
                 input_tokens=total_tokens,
                 output_tokens=0,  # Reranking doesn't generate tokens
@@ -308,6 +568,9 @@ class VoyageAIProvider(BaseProvider):
                     "query_length": len(query)
                 }
             )
+            if cache_key is not None:
+                await self.cache.set_response(cache_key, response)
+            return response
 
         except Exception as e:
             logger.error(f"VoyageAI rerank failed: {str(e)}", model=model)
@@ -315,29 +578,15 @@ class VoyageAIProvider(BaseProvider):
 
     def _calculate_embedding_cost(self, model: str, tokens: int) -> float:
         """Calculate cost for embedding operation"""
-        # Pricing per 1M tokens
-        pricing = {
-            "voyage-3.5": 0.06,
-            "voyage-3.5-lite": 0.02,
-            "voyage-3-large": 0.18,
-            "voyage-code-3": 0.18,
-            "voyage-finance-2": 0.12,
-            "voyage-law-2": 0.12,
-        }
-
-        rate = pricing.get(model, 0.06)  # Default to voyage-3.5 rate
-        return round((tokens / 1_000_000) * rate, 6)
+        # Unknown models default to the voyage-3.5 rate
+        rate = self.EMBEDDING_COST_PER_TOKEN.get(model, self.EMBEDDING_COST_PER_TOKEN["voyage-3.5"])
+        return round(tokens * rate, 6)
 
     def _calculate_rerank_cost(self, model: str, tokens: int) -> float:
         """Calculate cost for reranking operation"""
-        # Pricing per 1M tokens
-        pricing = {
-            "rerank-2.5": 0.05,
-            "rerank-2.5-lite": 0.02,
-        }
-
-        rate = pricing.get(model, 0.02)  # Default to rerank-2.5-lite rate
-        return round((tokens / 1_000_000) * rate, 6)
+        # Unknown models default to the rerank-2.5-lite rate
+        rate = self.RERANK_COST_PER_TOKEN.get(model, self.RERANK_COST_PER_TOKEN["rerank-2.5-lite"])
+        return round(tokens * rate, 6)
 
 
 # Auto-register this provider
@@ -4,17 +4,22 @@ API endpoints for the web UI management console
 No authentication required (internal tool)
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List, Dict, Any
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, insert, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
 from datetime import datetime, timedelta
 from uuid import UUID
+import base64
+import hashlib
 import secrets
+import time
+import orjson
 
-from src.config.database import get_db
+from src.config.database import get_async_db
 from src.config.settings import settings
-from src.models.database import APIClient, PromptTemplate, LLMGenerationLog, LLMProvider, LLMModel
+from src.models.database import APIClient, LLMProvider, LLMModel, llm_daily_costs
 from src.utils.logger import logger
 import anthropic
 import openai as openai_lib
@@ -22,44 +27,86 @@ from groq import Groq
 
 router = APIRouter()
 
+# In-process TTL cache for hot dashboard reads; admin writes that change a
+# cached result invalidate it immediately
+STATS_CACHE_TTL = 30  # seconds
+PROVIDERS_CACHE_TTL = 300  # seconds
+REGISTRY_CACHE_TTL = 15  # seconds
+_response_cache: Dict[str, Tuple[float, Any]] = {}
+
+
+def _get_cached(key: str) -> Optional[Any]:
+    """Return a cached response, or None if missing or expired"""
+    entry = _response_cache.get(key)
+    if entry is None or entry[0] < time.monotonic():
+        return None
+    return entry[1]
+
+
+def _set_cached(key: str, value: Any, ttl: int) -> None:
+    _response_cache[key] = (time.monotonic() + ttl, value)
+
+
+def _invalidate_cached(*keys: str) -> None:
+    for key in keys:
+        _response_cache.pop(key, None)
+
+
+def _etag_response(request: Request, body: bytes, etag: str) -> Response:
+    """Serve pre-serialized JSON, or 304 Not Modified if the client's copy is current"""
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
 
 # ============================================================================
 # Dashboard Stats
 # ============================================================================
 
 @router.get("/stats")
-async def get_dashboard_stats(db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def get_dashboard_stats(db: AsyncSession = Depends(get_async_db)) -> Dict[str, Any]:
     """
     Get dashboard statistics
     Returns counts and aggregated data for the dashboard
+    (cached for STATS_CACHE_TTL seconds)
     """
-    try:
-        # Count total clients
-        total_clients = db.query(APIClient).filter(APIClient.is_active == True).count()
-
-        # Count total templates
-        total_templates = db.query(PromptTemplate).filter(PromptTemplate.is_active == True).count()
+    cached = _get_cached("stats")
+    if cached is not None:
+        return cached
 
+    try:
         # Get stats for last 30 days
         thirty_days_ago = datetime.utcnow() - timedelta(days=30)
 
-        # Total calls and cost in last 30 days
-        stats = db.query(
-            func.count(LLMGenerationLog.log_id).label('total_calls'),
-            func.sum(LLMGenerationLog.input_cost_usd + LLMGenerationLog.output_cost_usd).label('total_cost')
-        ).filter(
-            LLMGenerationLog.created_at >= thirty_days_ago
-        ).first()
-
+        # One round trip: active counts ride along as scalar subqueries, and
+        # calls/cost come from the llm_hourly_costs continuous aggregate
+        # (~720 rows for 30 days) instead of scanning llm_generation_log
+        stats = (await db.execute(
+            text("""
+            SELECT
+                (SELECT COUNT(*) FROM api_clients WHERE is_active) AS total_clients,
+                (SELECT COUNT(*) FROM prompt_templates WHERE is_active) AS total_templates,
+                SUM(call_count) AS total_calls,
+                SUM(total_cost) AS total_cost
+            FROM llm_hourly_costs
+            WHERE hour >= :cutoff
+            """),
+            {"cutoff": thirty_days_ago}
+        )).one()
+
+        total_clients = stats.total_clients or 0
+        total_templates = stats.total_templates or 0
         total_calls = stats.total_calls or 0
         total_cost = float(stats.total_cost or 0)
 
-        return {
+        result = {
             "totalClients": total_clients,
             "totalTemplates": total_templates,
             "totalCalls": total_calls,
             "totalCost": round(total_cost, 2)
         }
+        _set_cached("stats", result, STATS_CACHE_TTL)
+        return result
 
     except Exception as e:
         logger.error(f"Error getting dashboard stats: {str(e)}")
@@ -74,19 +121,29 @@ async def get_dashboard_stats(db: Session = Depends(get_db)) -> Dict[str, Any]:
 # ============================================================================
 
 @router.get("/providers/registry")
-async def get_providers_from_registry(db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
+async def get_providers_from_registry(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+) -> Response:
     """
     Get all LLM providers dynamically from the provider registry
     This endpoint is fully programmatic - new providers appear automatically
     Shows ALL registered providers, including unconfigured ones
     Also includes stored API keys from database
+    (serialized JSON cached for REGISTRY_CACHE_TTL seconds, served with an ETag)
     """
+    cached = _get_cached("providers_registry")
+    if cached is not None:
+        return _etag_response(request, *cached)
+
     try:
         from src.providers import ProviderRegistry
         from src.providers.base import ProviderConfig
 
         # Query database for stored API keys
-        db_providers = db.query(LLMProvider).filter(LLMProvider.is_active == True).all()
+        db_providers = (await db.execute(
+            select(LLMProvider).where(LLMProvider.is_active == True)
+        )).scalars().all()
         db_keys_map = {p.provider_key: p.api_key for p in db_providers}
 
         providers_list = []
@@ -118,6 +175,7 @@ async def get_providers_from_registry(db: Session = Depends(get_db)) -> List[Dic
             if is_configured:
                 models = provider.get_models()
                 pricing_config = provider.config.pricing or {}
+                lowered_pricing = provider.get_lowered_pricing()
 
                 # Build models with pricing info
                 for model_key in models:
@@ -128,8 +186,9 @@ async def get_providers_from_registry(db: Session = Depends(get_db)) -> List[Dic
                         model_pricing = pricing_config[model_key]
                     else:
                         # Try pattern matching (e.g., "claude-3-sonnet" matches any sonnet model)
-                        for price_key, price_data in pricing_config.items():
-                            if price_key.lower() in model_key.lower():
+                        model_key_lower = model_key.lower()
+                        for price_key_lower, price_data in lowered_pricing:
+                            if price_key_lower in model_key_lower:
                                 model_pricing = price_data
                                 break
 
@@ -170,7 +229,11 @@ async def get_providers_from_registry(db: Session = Depends(get_db)) -> List[Dic
             })
 
         logger.info(f"Returned {len(providers_list)} providers from registry (including unconfigured)")
-        return providers_list
+
+        body = orjson.dumps(providers_list)
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        _set_cached("providers_registry", (body, etag), REGISTRY_CACHE_TTL)
+        return _etag_response(request, body, etag)
 
     except Exception as e:
         logger.error(f"Error getting providers from registry: {str(e)}")
@@ -181,14 +244,28 @@ async def get_providers_from_registry(db: Session = Depends(get_db)) -> List[Dic
 
 
 @router.get("/providers")
-async def get_providers(db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
+async def get_providers(db: AsyncSession = Depends(get_async_db)) -> List[Dict[str, Any]]:
     """
     Get all LLM providers with their configuration status and model count
+    (cached for PROVIDERS_CACHE_TTL seconds)
     """
+    cached = _get_cached("providers")
+    if cached is not None:
+        return cached
+
     try:
-        providers = db.query(LLMProvider).filter(
-            LLMProvider.is_active == True
-        ).order_by(LLMProvider.sort_order).all()
+        providers = (await db.execute(
+            select(LLMProvider).where(
+                LLMProvider.is_active == True
+            ).order_by(LLMProvider.sort_order)
+        )).scalars().all()
+
+        # Active model counts for all providers in one grouped query
+        model_counts = dict((await db.execute(
+            select(LLMModel.provider_id, func.count(LLMModel.model_id)).where(
+                LLMModel.is_active == True
+            ).group_by(LLMModel.provider_id)
+        )).all())
 
         result = []
         for provider in providers:
@@ -197,12 +274,6 @@ async def get_providers(db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
             if provider.api_key_env_var:
                 api_key_configured = bool(getattr(settings, provider.api_key_env_var, None))
 
-            # Count models for this provider
-            model_count = db.query(LLMModel).filter(
-                LLMModel.provider_id == provider.provider_id,
-                LLMModel.is_active == True
-            ).count()
-
             # Mask the stored API key if it exists
             api_key_masked = None
             if provider.api_key:
@@ -216,11 +287,12 @@ async def get_providers(db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
                 "api_key_configured": api_key_configured,
                 "api_key_masked": api_key_masked,
                 "has_stored_key": bool(provider.api_key),
-                "model_count": model_count,
+                "model_count": model_counts.get(provider.provider_id, 0),
                 "logo_url": provider.logo_url,
                 "website_url": provider.website_url
             })
 
+        _set_cached("providers", result, PROVIDERS_CACHE_TTL)
         return result
 
     except Exception as e:
@@ -232,15 +304,17 @@ async def get_providers(db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
 
 
 @router.get("/providers/{provider_id}/models")
-async def get_provider_models(provider_id: str, db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
+async def get_provider_models(provider_id: str, db: AsyncSession = Depends(get_async_db)) -> List[Dict[str, Any]]:
     """
     Get all models for a specific provider
     """
     try:
-        models = db.query(LLMModel).filter(
-            LLMModel.provider_id == provider_id,
-            LLMModel.is_active == True
-        ).order_by(LLMModel.sort_order).all()
+        models = (await db.execute(
+            select(LLMModel).where(
+                LLMModel.provider_id == provider_id,
+                LLMModel.is_active == True
+            ).order_by(LLMModel.sort_order)
+        )).scalars().all()
 
         return [
             {
@@ -269,27 +343,29 @@ async def get_provider_models(provider_id: str, db: Session = Depends(get_db)) -
 @router.get("/models")
 async def get_all_models(
     provider_key: str = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> List[Dict[str, Any]]:
     """
     Get all LLM models, optionally filtered by provider
     """
     try:
-        query = db.query(LLMModel, LLMProvider).join(
+        query = select(LLMModel, LLMProvider).join(
             LLMProvider, LLMModel.provider_id == LLMProvider.provider_id
-        ).filter(
+        ).where(
             LLMModel.is_active == True,
             LLMProvider.is_active == True
         )
 
         # Filter by provider if specified
         if provider_key:
-            query = query.filter(LLMProvider.provider_key == provider_key)
+            query = query.where(LLMProvider.provider_key == provider_key)
 
-        results = query.order_by(
-            LLMProvider.sort_order,
-            LLMModel.sort_order
-        ).all()
+        results = (await db.execute(
+            query.order_by(
+                LLMProvider.sort_order,
+                LLMModel.sort_order
+            )
+        )).all()
 
         return [
             {
@@ -324,13 +400,13 @@ async def get_all_models(
 async def update_model(
     model_id: str,
     model_data: Dict[str, Any],
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Dict[str, Any]:
     """
     Update model pricing and configuration
     """
     try:
-        model = db.query(LLMModel).filter(LLMModel.model_id == model_id).first()
+        model = await db.scalar(select(LLMModel).where(LLMModel.model_id == model_id))
 
         if not model:
             raise HTTPException(
@@ -352,8 +428,9 @@ async def update_model(
 
         model.updated_at = datetime.utcnow()
 
-        db.commit()
-        db.refresh(model)
+        await db.commit()
+        _invalidate_cached("providers", "providers_registry")
+        await db.refresh(model)
 
         logger.info(f"Updated model: {model.model_key}")
 
@@ -365,7 +442,7 @@ async def update_model(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error updating model: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -374,12 +451,12 @@ async def update_model(
 
 
 @router.post("/models/{model_id}/toggle")
-async def toggle_model(model_id: str, db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def toggle_model(model_id: str, db: AsyncSession = Depends(get_async_db)) -> Dict[str, Any]:
     """
     Toggle model enabled status
     """
     try:
-        model = db.query(LLMModel).filter(LLMModel.model_id == model_id).first()
+        model = await db.scalar(select(LLMModel).where(LLMModel.model_id == model_id))
 
         if not model:
             raise HTTPException(
@@ -390,8 +467,9 @@ async def toggle_model(model_id: str, db: Session = Depends(get_db)) -> Dict[str
         model.is_enabled = not model.is_enabled
         model.updated_at = datetime.utcnow()
 
-        db.commit()
-        db.refresh(model)
+        await db.commit()
+        _invalidate_cached("providers", "providers_registry")
+        await db.refresh(model)
 
         logger.info(f"Toggled model {model.model_key} to {'enabled' if model.is_enabled else 'disabled'}")
 
@@ -404,7 +482,7 @@ async def toggle_model(model_id: str, db: Session = Depends(get_db)) -> Dict[str
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error toggling model: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -420,15 +498,15 @@ async def toggle_model(model_id: str, db: Session = Depends(get_db)) -> Dict[str
 async def update_provider_api_key(
     provider_key: str,
     data: Dict[str, Any],
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Dict[str, Any]:
     """
     Update provider API key
     """
     try:
-        provider = db.query(LLMProvider).filter(
-            LLMProvider.provider_key == provider_key
-        ).first()
+        provider = await db.scalar(
+            select(LLMProvider).where(LLMProvider.provider_key == provider_key)
+        )
 
         if not provider:
             raise HTTPException(
@@ -446,8 +524,9 @@ async def update_provider_api_key(
         provider.api_key = api_key
         provider.updated_at = datetime.utcnow()
 
-        db.commit()
-        db.refresh(provider)
+        await db.commit()
+        _invalidate_cached("providers", "providers_registry")
+        await db.refresh(provider)
 
         logger.info(f"Updated API key for provider: {provider_key}")
 
@@ -463,7 +542,7 @@ async def update_provider_api_key(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error updating provider API key: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -474,15 +553,15 @@ async def update_provider_api_key(
 @router.delete("/providers/{provider_key}/api-key")
 async def delete_provider_api_key(
     provider_key: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Dict[str, str]:
     """
     Delete provider API key
     """
     try:
-        provider = db.query(LLMProvider).filter(
-            LLMProvider.provider_key == provider_key
-        ).first()
+        provider = await db.scalar(
+            select(LLMProvider).where(LLMProvider.provider_key == provider_key)
+        )
 
         if not provider:
             raise HTTPException(
@@ -493,7 +572,8 @@ async def delete_provider_api_key(
         provider.api_key = None
         provider.updated_at = datetime.utcnow()
 
-        db.commit()
+        await db.commit()
+        _invalidate_cached("providers", "providers_registry")
 
         logger.info(f"Deleted API key for provider: {provider_key}")
 
@@ -502,7 +582,7 @@ async def delete_provider_api_key(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error deleting provider API key: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -514,7 +594,7 @@ async def delete_provider_api_key(
 async def test_provider_api_key(
     provider_key: str,
     data: Dict[str, Any] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Dict[str, Any]:
     """
     Test provider API key and fetch available models with costs
@@ -535,9 +615,9 @@ async def test_provider_api_key(
         # Step 1: Validate provider
         add_step("validate_provider", "running", "Validating provider configuration...")
 
-        provider = db.query(LLMProvider).filter(
-            LLMProvider.provider_key == provider_key
-        ).first()
+        provider = await db.scalar(
+            select(LLMProvider).where(LLMProvider.provider_key == provider_key)
+        )
 
         if not provider:
             add_step("validate_provider", "failed", "", "Provider not found in database")
@@ -832,10 +912,12 @@ async def test_provider_api_key(
 
             for model_data in discovered_models:
                 # Check if model already exists
-                existing_model = db.query(LLMModel).filter(
-                    LLMModel.model_key == model_data["model_key"],
-                    LLMModel.provider_id == provider.provider_id
-                ).first()
+                existing_model = await db.scalar(
+                    select(LLMModel).where(
+                        LLMModel.model_key == model_data["model_key"],
+                        LLMModel.provider_id == provider.provider_id
+                    )
+                )
 
                 if existing_model:
                     # Update existing model
@@ -865,11 +947,12 @@ async def test_provider_api_key(
                     db.add(new_model)
                     models_saved += 1
 
-            db.commit()
+            await db.commit()
+            _invalidate_cached("providers", "providers_registry")
             add_step("save_models", "success", f"Saved {models_saved} new models, updated {models_updated} existing models")
 
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             logger.error(f"Error saving models to database: {str(e)}")
             add_step("save_models", "failed", "", f"Failed to save models: {str(e)}")
 
@@ -900,29 +983,81 @@ async def test_provider_api_key(
 # API Clients Management
 # ============================================================================
 
+CLIENTS_STREAM_BATCH = 100  # rows fetched per round trip when streaming clients
+CLIENTS_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _encode_clients_cursor(client: APIClient) -> str:
+    """Opaque, URL-safe keyset cursor for the page ending at `client`"""
+    raw = f"{client.created_at.isoformat()}|{client.client_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_clients_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, _, client_id = raw.rpartition("|")
+        return datetime.fromisoformat(created_at), UUID(client_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def _serialize_client(client: APIClient) -> bytes:
+    return orjson.dumps({
+        "client_id": str(client.client_id),
+        "client_name": client.client_name,
+        "api_key": client.api_key,
+        "organization": client.organization,
+        "contact_email": client.contact_email,
+        "is_active": client.is_active,
+        "rate_limit": client.rate_limit,
+        "monthly_budget_usd": float(client.monthly_budget_usd) if client.monthly_budget_usd else None,
+        "created_at": client.created_at.isoformat() if client.created_at else None,
+        "updated_at": client.updated_at.isoformat() if client.updated_at else None
+    })
+
+
 @router.get("/clients")
-async def get_clients(db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
+async def get_clients(
+    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+) -> Response:
     """
-    Get all API clients
+    Get API clients, newest first
+    Without `limit`, streamed as a JSON array CLIENTS_STREAM_BATCH rows at a
+    time. With `limit`, returns one page and, if more rows may follow, its
+    cursor in the X-Next-Cursor header; pass it back as `cursor`.
     """
-    try:
-        clients = db.query(APIClient).order_by(APIClient.created_at.desc()).all()
+    # client_id breaks created_at ties (bulk inserts share one timestamp)
+    query = select(APIClient).order_by(APIClient.created_at.desc(), APIClient.client_id.desc())
+    if cursor is not None:
+        query = query.where(
+            tuple_(APIClient.created_at, APIClient.client_id) < tuple_(*_decode_clients_cursor(cursor))
+        )
 
-        return [
-            {
-                "client_id": str(client.client_id),
-                "client_name": client.client_name,
-                "api_key": client.api_key,
-                "organization": client.organization,
-                "contact_email": client.contact_email,
-                "is_active": client.is_active,
-                "rate_limit": client.rate_limit,
-                "monthly_budget_usd": float(client.monthly_budget_usd) if client.monthly_budget_usd else None,
-                "created_at": client.created_at.isoformat() if client.created_at else None,
-                "updated_at": client.updated_at.isoformat() if client.updated_at else None
-            }
-            for client in clients
-        ]
+    if limit is not None:
+        try:
+            page = (await db.scalars(query.limit(limit))).all()
+        except Exception as e:
+            logger.error(f"Error getting clients: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to fetch clients"
+            )
+
+        headers = {CLIENTS_CURSOR_HEADER: _encode_clients_cursor(page[-1])} if len(page) == limit else None
+        return Response(
+            content=b"[" + b",".join(map(_serialize_client, page)) + b"]",
+            media_type="application/json",
+            headers=headers
+        )
+
+    try:
+        clients = await db.stream_scalars(query.execution_options(yield_per=CLIENTS_STREAM_BATCH))
 
     except Exception as e:
         logger.error(f"Error getting clients: {str(e)}")
@@ -931,11 +1066,25 @@ async def get_clients(db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
             detail="Failed to fetch clients"
         )
 
+    async def encode_clients() -> AsyncIterator[bytes]:
+        separator = b"["
+        try:
+            async for batch in clients.partitions():
+                yield separator + b",".join(map(_serialize_client, batch))
+                separator = b","
+        except Exception as e:
+            # Headers are already sent; log and cut the stream short
+            logger.error(f"Error streaming clients: {str(e)}")
+            raise
+        yield b"]" if separator == b"," else b"[]"
+
+    return StreamingResponse(encode_clients(), media_type="application/json")
+
 
 @router.post("/clients", status_code=status.HTTP_201_CREATED)
 async def create_client(
     client_data: Dict[str, Any],
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Dict[str, Any]:
     """
     Create a new API client
@@ -943,9 +1092,9 @@ async def create_client(
     """
     try:
         # Check if client name already exists
-        existing = db.query(APIClient).filter(
-            APIClient.client_name == client_data.get("client_name")
-        ).first()
+        existing = await db.scalar(
+            select(APIClient).where(APIClient.client_name == client_data.get("client_name"))
+        )
 
         if existing:
             raise HTTPException(
@@ -956,20 +1105,20 @@ async def create_client(
         # Generate secure API key
         api_key = f"{client_data.get('client_name').replace(' ', '_').lower()}_{secrets.token_hex(16)}"
 
-        # Create client
-        new_client = APIClient(
-            client_name=client_data.get("client_name"),
-            api_key=api_key,
-            organization=client_data.get("organization"),
-            contact_email=client_data.get("contact_email"),
-            rate_limit=client_data.get("rate_limit", 100),
-            monthly_budget_usd=client_data.get("monthly_budget_usd"),
-            is_active=True
-        )
-
-        db.add(new_client)
-        db.commit()
-        db.refresh(new_client)
+        # Create client (RETURNING hands back the generated row in the same round trip)
+        new_client = (await db.execute(
+            insert(APIClient).values(
+                client_name=client_data.get("client_name"),
+                api_key=api_key,
+                organization=client_data.get("organization"),
+                contact_email=client_data.get("contact_email"),
+                rate_limit=client_data.get("rate_limit", 100),
+                monthly_budget_usd=client_data.get("monthly_budget_usd"),
+                is_active=True
+            ).returning(APIClient.client_id, APIClient.client_name, APIClient.api_key)
+        )).one()
+        await db.commit()
+        _invalidate_cached("stats")
 
         logger.info(f"Created new API client: {new_client.client_name}")
 
@@ -983,7 +1132,7 @@ async def create_client(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error creating client: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -991,13 +1140,97 @@ async def create_client(
         )
 
 
+@router.post("/clients/bulk", status_code=status.HTTP_201_CREATED)
+async def create_clients_bulk(
+    clients_data: List[Dict[str, Any]],
+    db: AsyncSession = Depends(get_async_db)
+) -> Dict[str, Any]:
+    """
+    Create many API clients at once
+    All names are checked in one query and the clients are inserted with a
+    single multi-row INSERT ... RETURNING and one commit (all or nothing)
+    """
+    try:
+        names = [client_data.get("client_name") for client_data in clients_data]
+        if not names:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="At least one client is required"
+            )
+        if not all(names):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="client_name is required for every client"
+            )
+        if len(set(names)) != len(names):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Duplicate client names in request"
+            )
+
+        # Check all names against existing clients in one round trip
+        existing = (await db.execute(
+            select(APIClient.client_name).where(APIClient.client_name.in_(names))
+        )).scalars().all()
+
+        if existing:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Clients with these names already exist: {', '.join(existing)}"
+            )
+
+        rows = [
+            {
+                "client_name": client_data["client_name"],
+                "api_key": f"{client_data['client_name'].replace(' ', '_').lower()}_{secrets.token_hex(16)}",
+                "organization": client_data.get("organization"),
+                "contact_email": client_data.get("contact_email"),
+                "rate_limit": client_data.get("rate_limit", 100),
+                "monthly_budget_usd": client_data.get("monthly_budget_usd"),
+                "is_active": True
+            }
+            for client_data in clients_data
+        ]
+
+        created = (await db.execute(
+            insert(APIClient).returning(APIClient.client_id, APIClient.client_name, APIClient.api_key),
+            rows
+        )).all()
+        await db.commit()
+        _invalidate_cached("stats")
+
+        logger.info(f"Created {len(created)} API clients in bulk")
+
+        return {
+            "clients": [
+                {
+                    "client_id": str(row.client_id),
+                    "client_name": row.client_name,
+                    "api_key": row.api_key
+                }
+                for row in created
+            ],
+            "message": f"Created {len(created)} clients successfully"
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"Error creating clients in bulk: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create clients: {str(e)}"
+        )
+
+
 @router.delete("/clients/{client_id}")
-async def delete_client(client_id: str, db: Session = Depends(get_db)) -> Dict[str, str]:
+async def delete_client(client_id: str, db: AsyncSession = Depends(get_async_db)) -> Dict[str, str]:
     """
     Delete an API client
     """
     try:
-        client = db.query(APIClient).filter(APIClient.client_id == client_id).first()
+        client = await db.scalar(select(APIClient).where(APIClient.client_id == client_id))
 
         if not client:
             raise HTTPException(
@@ -1005,8 +1238,9 @@ async def delete_client(client_id: str, db: Session = Depends(get_db)) -> Dict[s
                 detail="Client not found"
             )
 
-        db.delete(client)
-        db.commit()
+        await db.delete(client)
+        await db.commit()
+        _invalidate_cached("stats")
 
         logger.info(f"Deleted API client: {client.client_name}")
 
@@ -1015,7 +1249,7 @@ async def delete_client(client_id: str, db: Session = Depends(get_db)) -> Dict[s
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error deleting client: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1024,12 +1258,12 @@ async def delete_client(client_id: str, db: Session = Depends(get_db)) -> Dict[s
 
 
 @router.post("/clients/{client_id}/regenerate-key")
-async def regenerate_api_key(client_id: str, db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def regenerate_api_key(client_id: str, db: AsyncSession = Depends(get_async_db)) -> Dict[str, Any]:
     """
     Regenerate API key for a client
     """
     try:
-        client = db.query(APIClient).filter(APIClient.client_id == client_id).first()
+        client = await db.scalar(select(APIClient).where(APIClient.client_id == client_id))
 
         if not client:
             raise HTTPException(
@@ -1042,8 +1276,7 @@ async def regenerate_api_key(client_id: str, db: Session = Depends(get_db)) -> D
         client.api_key = new_api_key
         client.updated_at = datetime.utcnow()
 
-        db.commit()
-        db.refresh(client)
+        await db.commit()
 
         logger.info(f"Regenerated API key for client: {client.client_name}")
 
@@ -1056,7 +1289,7 @@ async def regenerate_api_key(client_id: str, db: Session = Depends(get_db)) -> D
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error regenerating API key: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1068,14 +1301,14 @@ async def regenerate_api_key(client_id: str, db: Session = Depends(get_db)) -> D
 async def update_client(
     client_id: str,
     client_data: Dict[str, Any],
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Dict[str, Any]:
     """
     Update API client details
     Allows updating: client_name, organization, contact_email, rate_limit, monthly_budget_usd, is_active
     """
     try:
-        client = db.query(APIClient).filter(APIClient.client_id == client_id).first()
+        client = await db.scalar(select(APIClient).where(APIClient.client_id == client_id))
 
         if not client:
             raise HTTPException(
@@ -1086,10 +1319,12 @@ async def update_client(
         # Update allowed fields
         if "client_name" in client_data:
             # Check if new name conflicts with existing client
-            existing = db.query(APIClient).filter(
-                APIClient.client_name == client_data["client_name"],
-                APIClient.client_id != client_id
-            ).first()
+            existing = await db.scalar(
+                select(APIClient).where(
+                    APIClient.client_name == client_data["client_name"],
+                    APIClient.client_id != client_id
+                )
+            )
             if existing:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -1110,8 +1345,9 @@ async def update_client(
 
         client.updated_at = datetime.utcnow()
 
-        db.commit()
-        db.refresh(client)
+        await db.commit()
+        _invalidate_cached("stats")
+        await db.refresh(client)
 
         logger.info(f"Updated client: {client.client_name}")
 
@@ -1130,7 +1366,7 @@ async def update_client(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error updating client: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1142,17 +1378,24 @@ async def update_client(
 # Billing & Usage
 # ============================================================================
 
+def _billing_cutoff(days: int) -> datetime:
+    """Start of the UTC day `days` days ago (billing reads whole days from llm_daily_costs)"""
+    return (datetime.utcnow() - timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
 @router.get("/billing/organizations")
-async def get_organizations(db: Session = Depends(get_db)) -> List[str]:
+async def get_organizations(db: AsyncSession = Depends(get_async_db)) -> List[str]:
     """
     Get list of unique organizations from API clients
     Used for filtering billing data by organization
     """
     try:
-        results = db.query(APIClient.organization).distinct().filter(
-            APIClient.organization.isnot(None),
-            APIClient.organization != ''
-        ).order_by(APIClient.organization).all()
+        results = (await db.execute(
+            select(APIClient.organization).distinct().where(
+                APIClient.organization.isnot(None),
+                APIClient.organization != ''
+            ).order_by(APIClient.organization)
+        )).all()
 
         return [row[0] for row in results]
 
@@ -1169,35 +1412,35 @@ async def get_billing_stats(
     days: int = 30,
     organization: str = None,
     client_name: str = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Dict[str, Any]:
     """
     Get billing statistics for specified time range
     Optionally filtered by organization and/or client name
     """
     try:
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
+        cutoff_date = _billing_cutoff(days)
 
-        # Build query with optional filters
-        query = db.query(
-            func.count(LLMGenerationLog.log_id).label('total_calls'),
-            func.sum(LLMGenerationLog.input_cost_usd + LLMGenerationLog.output_cost_usd).label('total_cost')
-        ).join(
+        # Build query with optional filters (over the daily rollup, not the raw log)
+        query = select(
+            func.sum(llm_daily_costs.c.call_count).label('total_calls'),
+            func.sum(llm_daily_costs.c.total_cost).label('total_cost')
+        ).select_from(llm_daily_costs).join(
             APIClient,
-            LLMGenerationLog.client_id == APIClient.client_id
-        ).filter(
-            LLMGenerationLog.created_at >= cutoff_date
+            llm_daily_costs.c.client_id == APIClient.client_id
+        ).where(
+            llm_daily_costs.c.day >= cutoff_date
         )
 
         # Apply organization filter if provided
         if organization:
-            query = query.filter(APIClient.organization == organization)
+            query = query.where(APIClient.organization == organization)
 
         # Apply client name filter if provided
         if client_name:
-            query = query.filter(APIClient.client_name == client_name)
+            query = query.where(APIClient.client_name == client_name)
 
-        stats = query.first()
+        stats = (await db.execute(query)).first()
 
         total_calls = stats.total_calls or 0
         total_cost = float(stats.total_cost or 0)
@@ -1222,42 +1465,44 @@ async def get_daily_costs(
     days: int = 30,
     organization: str = None,
     client_name: str = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> List[Dict[str, Any]]:
     """
     Get daily cost breakdown by provider
     Optionally filtered by organization and/or client name
     """
     try:
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
-
-        # Build query with optional filters
-        query = db.query(
-            func.date_trunc('day', LLMGenerationLog.created_at).label('day'),
-            LLMGenerationLog.provider,
-            func.count(LLMGenerationLog.log_id).label('total_calls'),
-            func.sum(LLMGenerationLog.input_cost_usd + LLMGenerationLog.output_cost_usd).label('total_cost')
-        ).join(
+        cutoff_date = _billing_cutoff(days)
+
+        # Build query with optional filters (over the daily rollup, not the raw log)
+        query = select(
+            llm_daily_costs.c.day,
+            llm_daily_costs.c.provider,
+            func.sum(llm_daily_costs.c.call_count).label('total_calls'),
+            func.sum(llm_daily_costs.c.total_cost).label('total_cost')
+        ).select_from(llm_daily_costs).join(
             APIClient,
-            LLMGenerationLog.client_id == APIClient.client_id
-        ).filter(
-            LLMGenerationLog.created_at >= cutoff_date
+            llm_daily_costs.c.client_id == APIClient.client_id
+        ).where(
+            llm_daily_costs.c.day >= cutoff_date
         )
 
         # Apply organization filter if provided
         if organization:
-            query = query.filter(APIClient.organization == organization)
+            query = query.where(APIClient.organization == organization)
 
         # Apply client name filter if provided
         if client_name:
-            query = query.filter(APIClient.client_name == client_name)
-
-        results = query.group_by(
-            func.date_trunc('day', LLMGenerationLog.created_at),
-            LLMGenerationLog.provider
-        ).order_by(
-            func.date_trunc('day', LLMGenerationLog.created_at).asc()
-        ).all()
+            query = query.where(APIClient.client_name == client_name)
+
+        results = (await db.execute(
+            query.group_by(
+                llm_daily_costs.c.day,
+                llm_daily_costs.c.provider
+            ).order_by(
+                llm_daily_costs.c.day.asc()
+            )
+        )).all()
 
         return [
             {
@@ -1282,45 +1527,47 @@ async def get_client_costs(
     days: int = 30,
     organization: str = None,
     client_name: str = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> List[Dict[str, Any]]:
     """
     Get cost breakdown by client
     Optionally filtered by organization and/or client name
     """
     try:
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
+        cutoff_date = _billing_cutoff(days)
 
-        # Build query with optional filters
-        query = db.query(
+        # Build query with optional filters (over the daily rollup, not the raw log)
+        query = select(
             APIClient.client_name,
             APIClient.organization,
             APIClient.monthly_budget_usd,
-            func.count(LLMGenerationLog.log_id).label('total_calls'),
-            func.sum(LLMGenerationLog.input_tokens + LLMGenerationLog.output_tokens).label('total_tokens'),
-            func.sum(LLMGenerationLog.input_cost_usd + LLMGenerationLog.output_cost_usd).label('total_cost')
-        ).join(
-            LLMGenerationLog,
-            APIClient.client_id == LLMGenerationLog.client_id
-        ).filter(
-            LLMGenerationLog.created_at >= cutoff_date
+            func.sum(llm_daily_costs.c.call_count).label('total_calls'),
+            func.sum(llm_daily_costs.c.total_tokens).label('total_tokens'),
+            func.sum(llm_daily_costs.c.total_cost).label('total_cost')
+        ).select_from(APIClient).join(
+            llm_daily_costs,
+            APIClient.client_id == llm_daily_costs.c.client_id
+        ).where(
+            llm_daily_costs.c.day >= cutoff_date
         )
 
         # Apply organization filter if provided
         if organization:
-            query = query.filter(APIClient.organization == organization)
+            query = query.where(APIClient.organization == organization)
 
         # Apply client name filter if provided
         if client_name:
-            query = query.filter(APIClient.client_name == client_name)
-
-        results = query.group_by(
-            APIClient.client_name,
-            APIClient.organization,
-            APIClient.monthly_budget_usd
-        ).order_by(
-            func.sum(LLMGenerationLog.input_cost_usd + LLMGenerationLog.output_cost_usd).desc()
-        ).all()
+            query = query.where(APIClient.client_name == client_name)
+
+        results = (await db.execute(
+            query.group_by(
+                APIClient.client_name,
+                APIClient.organization,
+                APIClient.monthly_budget_usd
+            ).order_by(
+                func.sum(llm_daily_costs.c.total_cost).desc()
+            )
+        )).all()
 
         return [
             {
@@ -3,25 +3,68 @@ API v2 Audio Operations Router
 Provider and model agnostic audio processing endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
+from typing import Any, Dict
+from urllib.parse import urlsplit
+import asyncio
+import ipaddress
+import socket
 import time
+import uuid
 
 from src.config.database import get_db
+from src.config.settings import settings
 from src.models.database import APIClient
 from src.models.schemas import (
     V2AudioTranscribeRequest,
     V2AudioTranscribeResponse,
     V2AudioSynthesizeRequest,
+    V2AudioTranscribeWebhook,
     V2BaseResponse
 )
 from src.services.auth import get_current_client
 from src.services.llm_core import llm_core
+from src.providers import ProviderRegistry
+from src.providers.http_client import get_shared_async_client
 from src.services.billing import billing_service
 from src.utils.logger import logger
 
 router = APIRouter()
 
+# Header AssemblyAI echoes back on transcript webhooks (per-transcript secret)
+WEBHOOK_AUTH_HEADER = "X-LLMHub-Webhook-Secret"
+WEBHOOK_PATH = "/api/v2/audio/transcribe/webhook"
+WEBHOOK_PROVIDERS = ("assemblyai",)  # Transcription providers with webhook delivery
+
+
+async def _ensure_public_https_url(url: str) -> None:
+    """
+    Reject caller-supplied webhook targets the hub must not call (SSRF guard)
+
+    The URL must be https and its host must resolve only to public
+    addresses; private, loopback, link-local and other reserved ranges are
+    refused.
+
+    Raises:
+        ValueError: If the URL is not allowed
+    """
+    parts = urlsplit(url)
+    if parts.scheme != "https" or not parts.hostname:
+        raise ValueError("webhook_url must be an https URL")
+
+    try:
+        addresses = await asyncio.get_running_loop().getaddrinfo(
+            parts.hostname, parts.port or 443, type=socket.SOCK_STREAM
+        )
+    except socket.gaierror:
+        raise ValueError(f"webhook_url host '{parts.hostname}' does not resolve")
+
+    for *_, sockaddr in addresses:
+        address = ipaddress.ip_address(sockaddr[0])
+        if not address.is_global or address.is_multicast:
+            raise ValueError(f"webhook_url host '{parts.hostname}' resolves to a non-public address")
+
 
 def _select_transcription_provider_and_model(
     request_provider: str = None,
@@ -172,10 +215,55 @@ async def transcribe_audio(
             "search": request.search,
             "replace": request.replace,
             "multichannel": request.multichannel,
+            "include_words": request.include_words,
 
             "operation": "transcribe"  # Signal to provider this is transcription
         }
 
+        request_metadata = {
+            "audio_url": request.audio_url,
+            "language_code": request.language_code,
+            "features_enabled": {
+                # AssemblyAI features
+                "speaker_labels": request.speaker_labels,
+                "sentiment_analysis": request.sentiment_analysis,
+                "entity_detection": request.entity_detection,
+                "auto_chapters": request.auto_chapters,
+                "summarization": request.summarization,
+                "iab_categories": request.iab_categories,
+                "content_safety": request.content_safety,
+                # Deepgram features
+                "detect_language": request.detect_language,
+                "smart_format": request.smart_format,
+                "diarize": request.speaker_labels or request.utterances,
+                "topics": request.topics,
+                "intents": request.intents,
+                "keywords": bool(request.keywords)
+            }
+        }
+
+        # Webhook delivery (AssemblyAI): the provider returns immediately with a
+        # queued transcript_id. AssemblyAI calls back our own endpoint, which
+        # bills the finished transcript and forwards it to request.webhook_url.
+        queued = bool(request.webhook_url)
+        if queued:
+            if provider not in WEBHOOK_PROVIDERS:
+                raise ValueError(
+                    f"webhook_url is not supported by provider '{provider}'. "
+                    f"Supported: {', '.join(WEBHOOK_PROVIDERS)}"
+                )
+            if not settings.PUBLIC_WEBHOOK_BASE_URL:
+                raise ValueError("webhook_url requires PUBLIC_WEBHOOK_BASE_URL to be configured")
+            await _ensure_public_https_url(str(request.webhook_url))
+            transcribe_kwargs["webhook_url"] = f"{settings.PUBLIC_WEBHOOK_BASE_URL.rstrip('/')}{WEBHOOK_PATH}"
+            transcribe_kwargs["webhook_auth_header_name"] = WEBHOOK_AUTH_HEADER
+            transcribe_kwargs["webhook_context"] = {
+                "client_id": str(client.client_id),
+                "forward_url": str(request.webhook_url),
+                "submitted_at": start_time,
+                "request_metadata": request_metadata
+            }
+
         # Call transcription provider
         result = await llm_core.call_llm(
             provider=provider,
@@ -191,6 +279,27 @@ async def transcribe_audio(
         # Extract response content (dict with transcript and intelligence results)
         response_content = result["content"]
 
+        if queued:
+            # Billed by the webhook once the transcript completes
+            logger.info(
+                "transcription_queued",
+                client=client.client_name,
+                provider=provider,
+                model=model,
+                transcript_id=response_content.get("transcript_id")
+            )
+            return V2AudioTranscribeResponse(
+                success=True,
+                content=response_content,
+                text="",
+                audio_duration=0,
+                provider_used=provider,
+                model_used=model,
+                tokens_used=0,
+                cost_usd=0,
+                generation_time_ms=generation_time_ms
+            )
+
         # Log to database for billing
         log_id = billing_service.log_generation(
             db=db,
@@ -205,26 +314,8 @@ async def transcribe_audio(
             generation_time_ms=generation_time_ms,
             success=True,
             request_metadata={
-                "audio_url": request.audio_url,
-                "audio_duration": response_content.get("audio_duration"),
-                "language_code": request.language_code,
-                "features_enabled": {
-                    # AssemblyAI features
-                    "speaker_labels": request.speaker_labels,
-                    "sentiment_analysis": request.sentiment_analysis,
-                    "entity_detection": request.entity_detection,
-                    "auto_chapters": request.auto_chapters,
-                    "summarization": request.summarization,
-                    "iab_categories": request.iab_categories,
-                    "content_safety": request.content_safety,
-                    # Deepgram features
-                    "detect_language": request.detect_language,
-                    "smart_format": request.smart_format,
-                    "diarize": request.speaker_labels or request.utterances,
-                    "topics": request.topics,
-                    "intents": request.intents,
-                    "keywords": bool(request.keywords)
-                }
+                **request_metadata,
+                "audio_duration": response_content.get("audio_duration")
             }
         )
 
@@ -304,6 +395,150 @@ async def transcribe_audio(
         )
 
 
+async def _forward_transcript(url: str, body: Dict[str, Any]) -> None:
+    """POST a finished transcript to the caller's webhook_url"""
+    try:
+        # Re-checked at send time: the host may resolve differently by now
+        await _ensure_public_https_url(url)
+        response = await get_shared_async_client().post(url, json=body, follow_redirects=False)
+        response.raise_for_status()
+    except Exception as e:
+        logger.error(
+            f"Transcript forward failed: {str(e)}",
+            transcript_id=body.get("transcript_id")
+        )
+
+
+@router.post("/transcribe/webhook", include_in_schema=False)
+async def transcription_webhook(
+    payload: V2AudioTranscribeWebhook,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
+    """
+    Receive AssemblyAI transcript completion callbacks
+
+    Verifies the per-transcript secret, fetches and bills the finished
+    transcript, then forwards it to the webhook_url the caller gave to
+    /transcribe. Unknown or expired transcripts get a 404 so AssemblyAI
+    retries; transient fetch failures get a 502 for the same reason.
+    """
+    secret = request.headers.get(WEBHOOK_AUTH_HEADER)
+    if not secret:
+        raise HTTPException(
+            status_code=401,
+            detail={
+                "code": "INVALID_WEBHOOK_SECRET",
+                "message": "Webhook authentication failed"
+            }
+        )
+
+    provider = ProviderRegistry.get_provider("assemblyai")
+    pending = await provider.claim_webhook(payload.transcript_id, secret) if provider else None
+    if pending is None:
+        logger.warning("transcription_webhook_unmatched", transcript_id=payload.transcript_id)
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "code": "TRANSCRIPT_NOT_FOUND",
+                "message": "No pending transcript matches this callback"
+            }
+        )
+
+    context = pending["context"]
+    model = pending["model"]
+    generation_time_ms = int((time.time() - context["submitted_at"]) * 1000)
+
+    client = db.query(APIClient).filter(
+        APIClient.client_id == uuid.UUID(context["client_id"])
+    ).first()
+
+    try:
+        result = await provider.fetch_webhook_transcript(payload.transcript_id, pending)
+    except Exception as e:
+        if payload.status == "completed":
+            # Transcript is fine, we just couldn't fetch it: let AssemblyAI retry
+            await provider.release_webhook(payload.transcript_id, pending)
+            logger.error(f"Transcript fetch failed: {str(e)}", transcript_id=payload.transcript_id)
+            raise HTTPException(
+                status_code=502,
+                detail={
+                    "code": "TRANSCRIPT_FETCH_FAILED",
+                    "message": "Could not fetch the completed transcript"
+                }
+            )
+
+        logger.error(f"Transcription failed: {str(e)}", transcript_id=payload.transcript_id)
+        log_id = None
+        if client:
+            log_id = billing_service.log_generation(
+                db=db,
+                client=client,
+                endpoint="/api/v2/audio/transcribe",
+                provider="assemblyai",
+                model=model,
+                input_tokens=0,
+                output_tokens=0,
+                input_cost_usd=0,
+                output_cost_usd=0,
+                generation_time_ms=generation_time_ms,
+                success=False,
+                error_message=str(e),
+                error_type=type(e).__name__,
+                request_metadata=context["request_metadata"]
+            )
+        background_tasks.add_task(_forward_transcript, context["forward_url"], {
+            "transcript_id": payload.transcript_id,
+            "status": "error",
+            "error": str(e),
+            "log_id": str(log_id) if log_id else None
+        })
+        return {"received": True}
+
+    response_content = result.content
+    log_id = None
+    if client:
+        log_id = billing_service.log_generation(
+            db=db,
+            client=client,
+            endpoint="/api/v2/audio/transcribe",
+            provider="assemblyai",
+            model=model,
+            input_tokens=result.input_tokens,  # Duration-based pseudo-tokens
+            output_tokens=result.output_tokens,
+            input_cost_usd=result.cost_usd,
+            output_cost_usd=0,
+            generation_time_ms=generation_time_ms,
+            success=True,
+            request_metadata={
+                **context["request_metadata"],
+                "transcript_id": payload.transcript_id,
+                "audio_duration": response_content.get("audio_duration")
+            }
+        )
+    else:
+        logger.error("transcription_webhook_client_missing", client_id=context["client_id"])
+
+    logger.info(
+        "transcription_webhook_billed",
+        transcript_id=payload.transcript_id,
+        model=model,
+        audio_duration=response_content.get("audio_duration"),
+        cost_usd=result.cost_usd
+    )
+
+    background_tasks.add_task(_forward_transcript, context["forward_url"], {
+        "transcript_id": payload.transcript_id,
+        "status": "completed",
+        "cost_usd": result.cost_usd,
+        "log_id": str(log_id) if log_id else None,
+        "content": response_content
+    })
+
+    return {"received": True}
+
+
 @router.post("/synthesize", response_model=V2BaseResponse)
 async def synthesize_audio(
     request: V2AudioSynthesizeRequest,
@@ -333,7 +568,8 @@ async def synthesize_audio(
             "voice": request.voice_id if request.voice_id else request.voice,
             "output_format": request.output_format,
             "language": request.language,
-            "speed": request.speed
+            "speed": request.speed,
+            "output_encoding": "base64"
         }
 
         # Add ElevenLabs-specific voice settings if provided
@@ -366,7 +602,7 @@ async def synthesize_audio(
             endpoint="/api/v2/audio/synthesize",
             provider=provider,
             model=model,
-            input_tokens=result["input_tokens"],  # Character count * 100
+            input_tokens=result["billable_units"],  # Character count
             output_tokens=result["output_tokens"],
             input_cost_usd=result["cost_usd"],
             output_cost_usd=0,
@@ -376,7 +612,8 @@ async def synthesize_audio(
                 "text_length": len(request.text),
                 "voice": request.voice_id or request.voice,
                 "output_format": request.output_format,
-                "language": request.language
+                "language": request.language,
+                "unit_type": result["unit_type"]
             }
         )
 
@@ -389,14 +626,14 @@ async def synthesize_audio(
             cost_usd=result["cost_usd"]
         )
 
-        # Return base64-encoded audio data
+        # Return base64-encoded audio data (encoded by the provider as it streams in)
         # Client can decode and save/stream as needed
         return V2BaseResponse(
             success=True,
             content=result["content"],  # Base64-encoded audio
             provider_used=provider,
             model_used=model,
-            tokens_used=result["input_tokens"],
+            tokens_used=result["billable_units"],
             cost_usd=result["cost_usd"],
             generation_time_ms=generation_time_ms,
             log_id=log_id
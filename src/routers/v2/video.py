@@ -17,6 +17,7 @@ from src.models.schemas import (
     V2VideoDescribeRequest,
     V2BaseResponse
 )
+from src.providers import ProviderRegistry
 from src.services.auth import get_current_client
 from src.services.llm_core import llm_core
 from src.services.billing import billing_service
@@ -129,7 +130,8 @@ async def generate_video(
             prompt_image=prompt_image,
             duration=request.duration,
             ratio=ratio,
-            operation="generate"
+            operation="generate",
+            client_id=str(client.client_id)  # Scopes Runway's duplicate-job detection
         )
 
         generation_time_ms = int((time.time() - start_time) * 1000)
@@ -218,6 +220,33 @@ async def generate_video(
         )
 
 
+@router.post("/generate/webhook/{nonce}", include_in_schema=False)
+async def generation_webhook(nonce: str):
+    """
+    Receive RunwayML task completion callbacks
+
+    The nonce in the path identifies the waiting /generate call; the task
+    result itself is re-fetched from Runway by the provider. A nonce no
+    generation on this worker is waiting for gets a 404, so Runway retries
+    (possibly reaching the right worker) while that generation keeps polling.
+    """
+    provider = ProviderRegistry.get_provider("runway")
+    resolved = provider.resolve_webhook(nonce) if provider else False
+
+    logger.info("video_generation_webhook_received", resolved=resolved)
+
+    if not resolved:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "code": "GENERATION_NOT_FOUND",
+                "message": "No pending generation matches this callback"
+            }
+        )
+
+    return {"received": True}
+
+
 @router.post("/remix", response_model=V2BaseResponse)
 async def remix_video(
     request: V2VideoRemixRequest,
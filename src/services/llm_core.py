@@ -67,7 +67,9 @@ class LLMCoreService:
                 name="cohere",
                 api_key=settings.COHERE_API_KEY,
                 default_model="command-r-plus",
-                pricing=pricing_config.get("cohere", {})
+                pricing=pricing_config.get("cohere", {}),
+                max_concurrency=settings.COHERE_MAX_CONCURRENCY,
+                requests_per_minute=settings.COHERE_REQUESTS_PER_MINUTE
             ),
             "ollama": ProviderConfig(
                 name="ollama",
@@ -98,7 +100,9 @@ class LLMCoreService:
                 name="voyageai",
                 api_key=settings.VOYAGE_API_KEY,
                 default_model="voyage-3.5-lite",
-                pricing=pricing_config.get("voyageai", {})
+                pricing=pricing_config.get("voyageai", {}),
+                max_concurrency=settings.VOYAGE_MAX_CONCURRENCY,
+                requests_per_minute=settings.VOYAGE_REQUESTS_PER_MINUTE
             ),
             "assemblyai": ProviderConfig(
                 name="assemblyai",
@@ -110,13 +114,16 @@ class LLMCoreService:
                 name="deepgram",
                 api_key=settings.DEEPGRAM_API_KEY,
                 default_model="nova-3",
-                pricing=pricing_config.get("deepgram", {})
+                pricing=pricing_config.get("deepgram", {}),
+                max_concurrency=settings.DEEPGRAM_MAX_CONCURRENCY,
+                requests_per_minute=settings.DEEPGRAM_REQUESTS_PER_MINUTE
             ),
             "perspective": ProviderConfig(
                 name="perspective",
                 api_key=settings.PERSPECTIVE_API_KEY,
                 default_model="toxicity",
-                pricing=pricing_config.get("perspective", {})
+                pricing=pricing_config.get("perspective", {}),
+                requests_per_minute=settings.PERSPECTIVE_REQUESTS_PER_MINUTE
             )
         }
 
@@ -165,7 +172,8 @@ class LLMCoreService:
             system_prompt: Optional system prompt
 
         Returns:
-            Dict with keys: content, input_tokens, output_tokens, cost_usd, generation_time_ms
+            Dict with keys: content, input_tokens, output_tokens, cost_usd,
+            billable_units, unit_type, generation_time_ms
 
         Raises:
             ValueError: If provider not configured or invalid
@@ -206,6 +214,8 @@ class LLMCoreService:
                 "input_tokens": response.input_tokens,
                 "output_tokens": response.output_tokens,
                 "cost_usd": response.cost_usd,
+                "billable_units": response.billable_units,
+                "unit_type": response.unit_type,
                 "generation_time_ms": generation_time_ms
             }
 
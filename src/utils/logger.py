@@ -4,10 +4,25 @@ Structured logging configuration using structlog
 
 import logging
 import sys
+import orjson
 import structlog
 from src.config.settings import settings
 
 
+def _orjson_dumps(obj, default=None, **kwargs) -> str:
+    """
+    orjson-backed serializer for structlog's JSONRenderer
+
+    Serializes numpy arrays and non-string dict keys natively; decoded to str
+    because the stdlib logger factory expects text.
+    """
+    return orjson.dumps(
+        obj,
+        default=default,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    ).decode()
+
+
 def configure_logging():
     """Configure structured logging for the application"""
 
@@ -29,7 +44,7 @@ def configure_logging():
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer() if settings.LOG_LEVEL == "info" else structlog.dev.ConsoleRenderer(),
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps) if settings.LOG_LEVEL == "info" else structlog.dev.ConsoleRenderer(),
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
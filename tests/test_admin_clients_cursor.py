@@ -0,0 +1,44 @@
+"""
+Tests for GET /admin/clients keyset paging cursors
+"""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from src.routers.admin import _decode_clients_cursor, _encode_clients_cursor
+
+
+def _client(created_at):
+    return SimpleNamespace(created_at=created_at, client_id=uuid4())
+
+
+def test_cursor_round_trips():
+    client = _client(datetime(2025, 3, 1, 12, 30, 15, 123456, tzinfo=timezone.utc))
+
+    assert _decode_clients_cursor(_encode_clients_cursor(client)) == (client.created_at, client.client_id)
+
+
+def test_cursor_is_url_safe():
+    # The raw timestamp contains "+00:00", which breaks unencoded query strings
+    cursor = _encode_clients_cursor(_client(datetime.now(timezone.utc)))
+
+    assert not set(cursor) & set("+/=:| ")
+
+
+def test_cursors_of_same_timestamp_rows_differ():
+    # Bulk-inserted clients share created_at; client_id breaks the tie
+    created_at = datetime.now(timezone.utc)
+
+    assert _encode_clients_cursor(_client(created_at)) != _encode_clients_cursor(_client(created_at))
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "2025-03-01T12:30:15+00:00|" + str(uuid4())])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        _decode_clients_cursor(cursor)
+
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,175 @@
+"""
+Tests for provider response caching and in-flight request coalescing
+"""
+
+import asyncio
+
+import pytest
+
+from src.providers import cache as cache_module
+from src.providers.cache import InMemoryCacheBackend, LLMCache, SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_single_flight_merges_concurrent_calls():
+    flight = SingleFlight()
+    calls = 0
+
+    async def fn():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return object()
+
+    results = await asyncio.gather(*(flight.do("key", fn) for _ in range(5)))
+
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert flight._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_single_flight_calls_again_once_settled():
+    flight = SingleFlight()
+    calls = 0
+
+    async def fn():
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await flight.do("key", fn) == 1
+    assert await flight.do("key", fn) == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_keys_are_independent():
+    flight = SingleFlight()
+
+    async def fn(value):
+        await asyncio.sleep(0.01)
+        return value
+
+    results = await asyncio.gather(flight.do("a", lambda: fn("a")), flight.do("b", lambda: fn("b")))
+
+    assert results == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_single_flight_error_fans_out_to_every_caller():
+    flight = SingleFlight()
+    calls = 0
+
+    async def fn():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise ValueError("upstream failed")
+
+    results = await asyncio.gather(*(flight.do("key", fn) for _ in range(3)), return_exceptions=True)
+
+    assert calls == 1
+    assert all(isinstance(result, ValueError) for result in results)
+    assert flight._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_single_flight_leader_cancellation_keeps_followers():
+    flight = SingleFlight()
+    calls = 0
+
+    async def fn():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return 42
+
+    leader = asyncio.create_task(flight.do("key", fn))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do("key", fn))
+    await asyncio.sleep(0.01)
+
+    leader.cancel()
+
+    assert await follower == 42
+    assert leader.cancelled()
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_single_flight_follower_cancellation_keeps_leader():
+    flight = SingleFlight()
+
+    async def fn():
+        await asyncio.sleep(0.05)
+        return 42
+
+    leader = asyncio.create_task(flight.do("key", fn))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do("key", fn))
+    await asyncio.sleep(0.01)
+
+    follower.cancel()
+
+    assert await leader == 42
+
+
+@pytest.mark.asyncio
+async def test_single_flight_finishes_call_when_every_caller_cancelled():
+    flight = SingleFlight()
+    finished = asyncio.Event()
+
+    async def fn():
+        await asyncio.sleep(0.01)
+        finished.set()
+        return 42
+
+    caller = asyncio.create_task(flight.do("key", fn))
+    await asyncio.sleep(0)
+    caller.cancel()
+
+    await asyncio.wait_for(finished.wait(), 1)
+    await asyncio.sleep(0)
+    assert flight._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_in_memory_backend_evicts_least_recently_used():
+    backend = InMemoryCacheBackend(max_entries=2)
+    await backend.set("a", b"1", ttl=60)
+    await backend.set("b", b"2", ttl=60)
+    await backend.get("a")
+    await backend.set("c", b"3", ttl=60)
+
+    assert await backend.get("a") == b"1"
+    assert await backend.get("b") is None
+    assert await backend.get("c") == b"3"
+
+
+@pytest.mark.asyncio
+async def test_unbounded_backend_keeps_live_entries_and_sweeps_expired(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    backend = InMemoryCacheBackend(max_entries=None)
+
+    for i in range(2000):
+        await backend.set(f"live{i}", b"x", ttl=60)
+    await backend.set("short", b"x", ttl=1)
+    now[0] += 10
+    await backend.set("new", b"x", ttl=60)
+
+    assert await backend.get("live0") == b"x"
+    assert "short" not in backend._entries
+
+
+@pytest.mark.asyncio
+async def test_pop_claims_an_entry_once():
+    cache = LLMCache(namespace="test", backend=InMemoryCacheBackend(max_entries=None), default_ttl=60)
+    key = cache.make_key({"transcript_id": "t1", "secret": "s"})
+    await cache.set(key, {"model": "best"})
+
+    claims = await asyncio.gather(*(cache.pop(key) for _ in range(3)))
+
+    assert claims.count({"model": "best"}) == 1
+    assert claims.count(None) == 2
+    assert await cache.get(key) is None
@@ -0,0 +1,32 @@
+"""
+Tests for incremental base64 encoding of streamed ElevenLabs audio
+"""
+
+import base64
+
+import pytest
+
+from src.providers.elevenlabs_provider import ElevenLabsProvider
+
+
+@pytest.mark.parametrize("chunk_sizes", [
+    [],
+    [0],
+    [1],
+    [3, 3, 3],
+    [1, 1, 1, 1],
+    [2, 5, 0, 7, 1],
+    [4096, 4095, 4097, 1],
+])
+def test_matches_one_shot_encoding(chunk_sizes):
+    audio = bytes(i % 251 for i in range(sum(chunk_sizes)))
+    chunks = []
+    offset = 0
+    for size in chunk_sizes:
+        chunks.append(audio[offset:offset + size])
+        offset += size
+
+    encoded, audio_size = ElevenLabsProvider._encode_base64_stream(iter(chunks))
+
+    assert encoded == base64.b64encode(audio).decode("ascii")
+    assert audio_size == len(audio)
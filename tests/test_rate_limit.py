@@ -0,0 +1,64 @@
+"""
+Tests for provider concurrency caps and token-bucket pacing
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.providers.rate_limit import RateLimiter, TokenBucket
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_then_paces():
+    bucket = TokenBucket(rate=10, period=1.0, capacity=2)
+
+    started = time.monotonic()
+    await bucket.acquire()
+    await bucket.acquire()
+    burst_elapsed = time.monotonic() - started
+    await bucket.acquire()
+    paced_elapsed = time.monotonic() - started
+
+    assert burst_elapsed < 0.05
+    assert paced_elapsed >= 0.08  # One token refills every 0.1s
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_caps_concurrency():
+    limiter = RateLimiter(max_concurrency=2)
+    active = 0
+    peak = 0
+
+    async def work():
+        nonlocal active, peak
+        async with limiter:
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(work() for _ in range(6)))
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_releases_slot_on_error():
+    limiter = RateLimiter(max_concurrency=1)
+
+    with pytest.raises(ValueError):
+        async with limiter:
+            raise ValueError("boom")
+
+    await asyncio.wait_for(limiter.__aenter__(), 0.1)
+    await limiter.__aexit__(None, None, None)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_without_limits_is_a_no_op():
+    limiter = RateLimiter()
+
+    async with limiter:
+        pass
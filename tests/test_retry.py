@@ -0,0 +1,67 @@
+"""
+Tests for provider retries with exponential backoff
+"""
+
+import httpx
+import pytest
+
+from src.providers.retry import is_retryable_http_error, retry_async
+
+
+def _status_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://api.example.com")
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError(f"HTTP {status_code}", request=request, response=response)
+
+
+@pytest.mark.parametrize("status_code,retryable", [(429, True), (503, True), (400, False), (404, False)])
+def test_is_retryable_http_error_status_codes(status_code, retryable):
+    assert is_retryable_http_error(_status_error(status_code)) is retryable
+
+
+def test_is_retryable_http_error_transport_errors():
+    assert is_retryable_http_error(httpx.ConnectError("refused"))
+    assert not is_retryable_http_error(ValueError("bad input"))
+
+
+@pytest.mark.asyncio
+async def test_retry_async_retries_until_success():
+    calls = 0
+
+    async def fn():
+        nonlocal calls
+        calls += 1
+        if calls < 3:
+            raise _status_error(503)
+        return "ok"
+
+    assert await retry_async(fn, attempts=3, min_wait=0) == "ok"
+    assert calls == 3
+
+
+@pytest.mark.asyncio
+async def test_retry_async_does_not_retry_permanent_errors():
+    calls = 0
+
+    async def fn():
+        nonlocal calls
+        calls += 1
+        raise _status_error(400)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await retry_async(fn, attempts=3, min_wait=0)
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_async_gives_up_after_attempts():
+    calls = 0
+
+    async def fn():
+        nonlocal calls
+        calls += 1
+        raise _status_error(429)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await retry_async(fn, attempts=4, min_wait=0)
+    assert calls == 4
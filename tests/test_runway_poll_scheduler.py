@@ -0,0 +1,101 @@
+"""
+Tests for the shared Runway task poll loop
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.providers.runway_provider import _PollScheduler
+
+
+class _FakeTasks:
+    """tasks.retrieve() that walks each task through a scripted list of statuses"""
+
+    def __init__(self, statuses):
+        self.statuses = {task_id: list(script) for task_id, script in statuses.items()}
+        self.calls = []
+
+    async def retrieve(self, task_id):
+        self.calls.append(task_id)
+        status = self.statuses[task_id].pop(0)
+        if isinstance(status, Exception):
+            raise status
+        return SimpleNamespace(id=task_id, status=status, failure_reason="bad prompt", output=["https://video"])
+
+
+def _scheduler(statuses):
+    tasks = _FakeTasks(statuses)
+    client = SimpleNamespace(tasks=tasks)
+    return _PollScheduler(client, initial_interval=0.01, max_interval=0.02, backoff=2), tasks
+
+
+@pytest.mark.asyncio
+async def test_polls_until_succeeded():
+    scheduler, tasks = _scheduler({"t1": ["PENDING", "RUNNING", "SUCCEEDED"]})
+
+    task = await asyncio.wait_for(scheduler.watch("t1"), 1)
+
+    assert task.status == "SUCCEEDED"
+    assert tasks.calls == ["t1", "t1", "t1"]
+    assert scheduler._watches == {}
+
+
+@pytest.mark.asyncio
+async def test_failed_task_raises():
+    scheduler, _ = _scheduler({"t1": ["RUNNING", "FAILED"]})
+
+    with pytest.raises(Exception, match="bad prompt"):
+        await asyncio.wait_for(scheduler.watch("t1"), 1)
+
+
+@pytest.mark.asyncio
+async def test_retrieve_error_is_delivered_to_the_waiter():
+    scheduler, _ = _scheduler({"t1": [ConnectionError("reset")]})
+
+    with pytest.raises(ConnectionError):
+        await asyncio.wait_for(scheduler.watch("t1"), 1)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_tasks_share_one_loop():
+    scheduler, tasks = _scheduler({
+        "t1": ["SUCCEEDED"],
+        "t2": ["RUNNING", "SUCCEEDED"],
+        "t3": ["RUNNING", "RUNNING", "FAILED"],
+    })
+
+    first = scheduler.watch("t1")
+    runner = scheduler._runner
+    second = scheduler.watch("t2")
+    third = scheduler.watch("t3")
+    results = await asyncio.wait_for(asyncio.gather(first, second, third, return_exceptions=True), 1)
+
+    assert scheduler._runner is runner
+    assert [result.status for result in results[:2]] == ["SUCCEEDED", "SUCCEEDED"]
+    assert isinstance(results[2], Exception)
+    assert sorted(tasks.calls) == ["t1", "t2", "t2", "t3", "t3", "t3"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_stops_polling():
+    scheduler, tasks = _scheduler({"t1": ["RUNNING"] * 100})
+
+    waiter = scheduler.watch("t1", delay=0.02)
+    waiter.cancel()
+    await asyncio.sleep(0.05)
+
+    assert tasks.calls == []
+    assert scheduler._watches == {}
+
+
+@pytest.mark.asyncio
+async def test_close_fails_pending_tasks():
+    scheduler, _ = _scheduler({"t1": ["RUNNING"] * 100})
+
+    waiter = scheduler.watch("t1", delay=10)
+    await scheduler.close()
+
+    with pytest.raises(Exception, match="poller closed"):
+        await waiter
@@ -0,0 +1,94 @@
+"""
+Tests for coalescing concurrent VoyageAI embed requests into batches
+"""
+
+import asyncio
+
+import pytest
+
+from src.providers.voyageai_provider import _EmbedBatcher
+
+
+class _FakeEmbed:
+    """Embeds each text as [len(text)] and bills `tokens_per_char` per character"""
+
+    def __init__(self, tokens_per_char: int = 1, error: Exception = None):
+        self.tokens_per_char = tokens_per_char
+        self.error = error
+        self.batches = []
+
+    async def __call__(self, texts):
+        self.batches.append(list(texts))
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        return [[float(len(text))] for text in texts], sum(map(len, texts)) * self.tokens_per_char
+
+
+@pytest.mark.asyncio
+async def test_concurrent_embeds_share_one_call():
+    embed = _FakeEmbed()
+    batcher = _EmbedBatcher(embed, max_batch=64, window=0.01)
+
+    results = await asyncio.gather(*(batcher.embed(text) for text in ("a", "bb", "ccc")))
+
+    assert embed.batches == [["a", "bb", "ccc"]]
+    assert [embedding for embedding, _ in results] == [[1.0], [2.0], [3.0]]
+
+
+@pytest.mark.asyncio
+async def test_full_batch_flushes_without_waiting_for_window():
+    embed = _FakeEmbed()
+    batcher = _EmbedBatcher(embed, max_batch=2, window=10)
+
+    results = await asyncio.wait_for(asyncio.gather(batcher.embed("a"), batcher.embed("b")), 1)
+
+    assert len(results) == 2
+    assert embed.batches == [["a", "b"]]
+
+
+@pytest.mark.asyncio
+async def test_token_shares_are_proportional_and_sum_to_total():
+    embed = _FakeEmbed()
+    batcher = _EmbedBatcher(embed, max_batch=64, window=0.01)
+
+    async def embed_with_fixed_total(texts):
+        embeddings, _ = await embed(texts)
+        return embeddings, 9  # Not divisible by the character split
+
+    batcher._embed_fn = embed_with_fixed_total
+    results = await asyncio.gather(batcher.embed("a" * 10), batcher.embed("b" * 30))
+    shares = [tokens for _, tokens in results]
+
+    assert sum(shares) == 9
+    assert shares[0] == 9 * 10 // 40
+    assert shares[1] == 9 - shares[0]
+
+
+@pytest.mark.asyncio
+async def test_batch_error_fans_out_to_every_caller():
+    embed = _FakeEmbed(error=RuntimeError("voyage down"))
+    batcher = _EmbedBatcher(embed, max_batch=64, window=0.01)
+
+    results = await asyncio.gather(batcher.embed("a"), batcher.embed("b"), return_exceptions=True)
+
+    assert len(embed.batches) == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_affect_the_batch():
+    embed = _FakeEmbed()
+    batcher = _EmbedBatcher(embed, max_batch=64, window=0.02)
+
+    cancelled = asyncio.create_task(batcher.embed("a"))
+    kept = asyncio.create_task(batcher.embed("bb"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    embedding, tokens = await kept
+
+    assert cancelled.cancelled()
+    assert embedding == [2.0]
+    assert embed.batches == [["a", "bb"]]
+    assert tokens == 2